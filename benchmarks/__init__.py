@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for the hot paths of django-fluent-blogs.
+
+These are executed with ``./runbenchmarks.py``, which loads synthetic datasets
+of increasing size and reports the query count and timings of each view as JSON.
+"""
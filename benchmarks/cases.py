@@ -0,0 +1,130 @@
+"""
+The benchmark cases, each one renders a page of the blog.
+"""
+from django.conf import settings
+from django.template import Context, Template
+from django.utils import translation
+
+from fluent_blogs import appsettings
+from fluent_blogs.models import get_entry_model
+
+CASES = []
+
+
+def case(name, requires=None):
+    """
+    Register a benchmark case. The function receives the test client and dataset size.
+    """
+
+    def _dec(func):
+        CASES.append((name, func, requires))
+        return func
+
+    return _dec
+
+
+def has_taggit():
+    return "taggit" in settings.INSTALLED_APPS
+
+
+# ---- Archives
+
+
+@case("archive_index")
+def archive_index(client, size):
+    return client.get("/blog/")
+
+
+@case("archive_deep_page")
+def archive_deep_page(client, size):
+    page = max(1, size // appsettings.FLUENT_BLOGS_PAGINATE_BY // 2)
+    return client.get(f"/blog/page/{page}/")
+
+
+@case("category_archive")
+def category_archive(client, size):
+    return client.get("/blog/categories/category-0/")
+
+
+@case("tag_archive", requires=has_taggit)
+def tag_archive(client, size):
+    return client.get("/blog/tags/tag-0/")
+
+
+@case("author_archive")
+def author_archive(client, size):
+    return client.get("/blog/authors/author-0/")
+
+
+@case("entry_detail")
+def entry_detail(client, size):
+    with translation.override("en"):
+        url = get_entry_model().objects.language("en").get(pk=1).get_absolute_url()
+    return client.get(url)
+
+
+# ---- Feeds
+
+
+@case("feed_entries")
+def feed_entries(client, size):
+    return client.get("/blog/feed.rss2")
+
+
+@case("feed_category")
+def feed_category(client, size):
+    return client.get("/blog/categories/category-0/feed.rss2")
+
+
+@case("feed_author")
+def feed_author(client, size):
+    return client.get("/blog/authors/author-0/feed.rss2")
+
+
+@case("feed_tag", requires=has_taggit)
+def feed_tag(client, size):
+    return client.get("/blog/tags/tag-0/feed.rss2")
+
+
+# ---- Sitemaps
+
+
+@case("sitemap_entries")
+def sitemap_entries(client, size):
+    return client.get("/sitemap-blog_entries.xml")
+
+
+@case("sitemap_categories")
+def sitemap_categories(client, size):
+    return client.get("/sitemap-blog_categories.xml")
+
+
+@case("sitemap_authors")
+def sitemap_authors(client, size):
+    return client.get("/sitemap-blog_authors.xml")
+
+
+@case("sitemap_tags", requires=has_taggit)
+def sitemap_tags(client, size):
+    return client.get("/sitemap-blog_tags.xml")
+
+
+# ---- Template tags
+
+
+@case("tag_get_entries")
+def tag_get_entries(client, size):
+    template = Template(
+        "{% load fluent_blogs_tags %}{% get_entries limit=10 as entries %}"
+        "{% for entry in entries %}{{ entry.title }} {{ entry.url }}{% endfor %}"
+    )
+    return template.render(Context())
+
+
+@case("tag_get_tags", requires=has_taggit)
+def tag_get_tags(client, size):
+    template = Template(
+        "{% load fluent_blogs_tags %}{% get_tags as tags %}"
+        "{% for tag in tags %}{{ tag.name }} {{ tag.count }}{% endfor %}"
+    )
+    return template.render(Context())
@@ -0,0 +1,108 @@
+"""
+Synthetic datasets for the benchmarks.
+
+The entries are written with the bulk importer, so large datasets load quickly.
+Datasets grow incrementally: loading 10k entries after 1k only adds the missing 9k.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sites.models import Site
+from parler.models import TranslatableModel
+
+from fluent_blogs.importer import EntryImporter
+from fluent_blogs.models import get_category_model, get_entry_model
+
+NUM_AUTHORS = 10
+NUM_CATEGORIES = 20
+NUM_TAGS = 50
+LANGUAGES = ("en", "nl")
+START_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def setup_base_data():
+    """
+    Create the site, authors and categories that the entries refer to.
+    """
+    Site.objects.update_or_create(
+        id=settings.SITE_ID, defaults=dict(domain="testserver", name="Benchmark")
+    )
+
+    User = get_user_model()
+    User.objects.bulk_create(
+        [
+            User(username=f"author-{i}", first_name="Author", last_name=str(i))
+            for i in range(NUM_AUTHORS)
+        ]
+    )
+
+    Category = get_category_model()
+    translated = issubclass(Category, TranslatableModel)
+    for i in range(NUM_CATEGORIES):
+        if translated:
+            category = Category.objects.language(LANGUAGES[0]).create(
+                title=f"Category {i}", slug=f"category-{i}"
+            )
+            category.create_translation(
+                LANGUAGES[1], title=f"Categorie {i}", slug=f"categorie-{i}"
+            )
+        else:
+            Category.objects.create(name=f"Category {i}", slug=f"category-{i}")
+
+
+def get_rows(start, end, seed=42, id_offset=0):
+    """
+    Generate the import rows for the entries in the given range.
+    """
+    rnd = random.Random(seed + start)
+    for i in range(start, end):
+        row = {
+            "id": id_offset + i + 1,
+            "language_code": LANGUAGES[0],
+            "title": f"Entry {i}",
+            "slug": f"entry-{i}",
+            "status": "p",
+            "publication_date": (START_DATE - timedelta(hours=i)).isoformat(),
+            "author": f"author-{i % NUM_AUTHORS}",
+            "categories": [f"category-{c}" for c in rnd.sample(range(NUM_CATEGORIES), 2)],
+            "tags": [f"tag-{t}" for t in rnd.sample(range(NUM_TAGS), 3)],
+            "translations": {
+                language_code: {"title": f"Entry {i} ({language_code})", "slug": f"entry-{i}"}
+                for language_code in LANGUAGES[1:]
+            },
+        }
+        yield row
+
+
+def load_dataset(size):
+    """
+    Make sure the database contains *size* entries.
+    """
+    current = get_entry_model().objects.count()
+    if current == 0:
+        setup_base_data()
+    if current < size:
+        EntryImporter(batch_size=2000).run(get_rows(current, size))
+
+
+#: The ID range of the entries of the other sites, so they don't collide with the main dataset.
+OTHER_SITES_ID_OFFSET = 10_000_000
+
+
+def load_sites(num_sites, size):
+    """
+    Make sure the database contains *num_sites* sites, each with *size* entries.
+    The main site is ``settings.SITE_ID``, the other sites only add data to filter out.
+    """
+    load_dataset(size)
+    other_ids = [site_id for site_id in range(1, num_sites + 1) if site_id != settings.SITE_ID]
+    for i, site_id in enumerate(other_ids[: num_sites - 1]):
+        site, created = Site.objects.get_or_create(
+            id=site_id, defaults=dict(domain=f"site{site_id}.example.com", name=f"Site {site_id}")
+        )
+        if created:
+            EntryImporter(site=site, batch_size=2000).run(
+                get_rows(0, size, id_offset=OTHER_SITES_ID_OFFSET + i * size)
+            )
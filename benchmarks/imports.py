@@ -0,0 +1,74 @@
+"""
+Measure the import time of the modules that are loaded on every worker boot.
+
+Each measurement runs in a fresh interpreter, as modules are only imported once per process.
+"""
+import json
+import statistics
+import subprocess
+import sys
+from os import path
+
+#: The modules that the URLconf, sitemaps and templates import.
+IMPORT_CASES = (
+    "fluent_blogs.urls",
+    "fluent_blogs.sitemaps",
+    "fluent_blogs.templatetags.fluent_blogs_tags",
+)
+
+_SCRIPT = """
+import json, sys
+from time import perf_counter
+
+import runbenchmarks  # configures the settings
+import django
+
+start = perf_counter()
+django.setup()
+setup = perf_counter() - start
+
+before = set(sys.modules)
+start = perf_counter()
+import {module}
+duration = perf_counter() - start
+print(json.dumps({{"setup": setup, "import": duration, "modules": len(set(sys.modules) - before)}}))
+"""
+
+
+def measure_import(module, repeat=5):
+    """
+    Import a module in a new interpreter several times, and return the timings.
+    """
+    root = path.dirname(path.dirname(path.abspath(__file__)))
+    runs = []
+    for __ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _SCRIPT.format(module=module)],
+            cwd=root,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        runs.append(json.loads(output.splitlines()[-1]))
+
+    return {
+        "setup_ms": round(statistics.median(run["setup"] for run in runs) * 1000, 3),
+        "import_ms": round(statistics.median(run["import"] for run in runs) * 1000, 3),
+        "modules": runs[0]["modules"],
+    }
+
+
+def run_import_benchmarks(names=None, repeat=5, progress=None):
+    """
+    Measure all import cases.
+    """
+    results = []
+    for module in IMPORT_CASES:
+        if names and module not in names:
+            continue
+        result = {"module": module}
+        result.update(measure_import(module, repeat=repeat))
+        results.append(result)
+        if progress:
+            progress(f"{module:<45} {result}")
+    return results
@@ -0,0 +1,113 @@
+"""
+Execute the benchmark cases and collect the results.
+"""
+import statistics
+from time import perf_counter
+
+import django
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from .cases import CASES
+from .datasets import load_dataset, load_sites
+
+
+def run_case(func, client, size, repeat=5, warm=False):
+    """
+    Run a single case several times, and return the query count and timings.
+    Unless *warm* is set, the cache is cleared before each run.
+    """
+    timings = []
+    queries = None
+    for __ in range(repeat):
+        if not warm:
+            cache.clear()
+
+        with CaptureQueriesContext(connection) as captured:
+            start = perf_counter()
+            response = func(client, size)
+            timings.append(perf_counter() - start)
+
+        status_code = getattr(response, "status_code", 200)
+        if status_code != 200:
+            raise AssertionError(f"Unexpected status code {status_code}")
+        if queries is None:
+            queries = len(captured)
+
+    return {
+        "queries": queries,
+        "min_ms": round(min(timings) * 1000, 3),
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "max_ms": round(max(timings) * 1000, 3),
+    }
+
+
+def run_cases(client, size, names=None, repeat=5, warm=False, progress=None, **extra):
+    """
+    Run all cases against the currently loaded data.
+    """
+    results = []
+    for name, func, requires in CASES:
+        if names and name not in names:
+            continue
+        result = dict(extra, dataset=size, case=name)
+        if requires is not None and not requires():
+            result["skipped"] = True
+        else:
+            result.update(run_case(func, client, size, repeat=repeat, warm=warm))
+        results.append(result)
+        if progress:
+            progress(f"{size:>7} {name:<20} {result}")
+    return results
+
+
+def run_benchmarks(sizes, names=None, repeat=5, warm=False, progress=None):
+    """
+    Load each dataset size, and run all cases against it.
+    Returns a dictionary that can be stored as JSON.
+    """
+    client = Client()
+    results = []
+    for size in sorted(sizes):
+        start = perf_counter()
+        load_dataset(size)
+        if progress:
+            progress(f"Loaded {size} entries in {perf_counter() - start:.1f}s")
+
+        results += run_cases(client, size, names, repeat=repeat, warm=warm, progress=progress)
+
+    return {
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "repeat": repeat,
+        "warm": warm,
+        "results": results,
+    }
+
+
+def run_site_benchmarks(site_counts, size, names=None, repeat=5, warm=False, progress=None):
+    """
+    Add more sites with *size* entries each, and run all cases against the main site.
+    The timings should stay flat, as every query is filtered by site first.
+    """
+    client = Client()
+    results = []
+    for num_sites in sorted(site_counts):
+        start = perf_counter()
+        load_sites(num_sites, size)
+        if progress:
+            progress(f"Loaded {num_sites} sites in {perf_counter() - start:.1f}s")
+
+        results += run_cases(
+            client, size, names, repeat=repeat, warm=warm, progress=progress, sites=num_sites
+        )
+
+    return {
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "repeat": repeat,
+        "warm": warm,
+        "results": results,
+    }
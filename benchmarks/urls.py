@@ -0,0 +1,22 @@
+from django.contrib.sitemaps.views import sitemap
+from django.urls import include, path
+
+import fluent_blogs.urls
+from fluent_blogs.sitemaps import (
+    AuthorArchiveSitemap,
+    CategoryArchiveSitemap,
+    EntrySitemap,
+    TagArchiveSitemap,
+)
+
+sitemaps = {
+    "blog_entries": EntrySitemap,
+    "blog_categories": CategoryArchiveSitemap,
+    "blog_authors": AuthorArchiveSitemap,
+    "blog_tags": TagArchiveSitemap,
+}
+
+urlpatterns = [
+    path("blog/", include(fluent_blogs.urls)),
+    path("sitemap-<section>.xml", sitemap, {"sitemaps": sitemaps}, name="sitemap"),
+]
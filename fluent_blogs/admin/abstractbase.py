@@ -14,14 +14,13 @@ from parler.admin import TranslatableAdmin
 from parler.models import TranslationDoesNotExist
 
 from fluent_blogs import appsettings
+from fluent_blogs.admin.changelist import EntryChangeList, LanguageCodeListFilter
 from fluent_blogs.admin.forms import (
     AbstractEntryBaseAdminForm,
     AbstractTranslatableEntryBaseAdminForm,
 )
 from fluent_blogs.base_models import AbstractEntryBase
-from fluent_blogs.models import get_entry_model
-
-EntryModel = get_entry_model()
+from fluent_blogs.sites import get_current_site_id
 
 
 class AbstractEntryBaseAdmin(MultiSiteAdminMixin, PlaceholderFieldAdmin):
@@ -136,6 +135,17 @@ class AbstractEntryBaseAdmin(MultiSiteAdminMixin, PlaceholderFieldAdmin):
 
     # ---- List code ----
 
+    def get_changelist(self, request, **kwargs):
+        # Caches the dates of the date hierarchy.
+        return EntryChangeList
+
+    def get_queryset(self, request):
+        # Same as MultiSiteAdminMixin, but using the site of the current request.
+        qs = super(MultiSiteAdminMixin, self).get_queryset(request)
+        if self.filter_site:
+            qs = qs.parent_site(get_current_site_id())
+        return qs
+
     STATUS_ICONS = {
         AbstractEntryBase.PUBLISHED: "admin/img/icon-yes.svg",
         AbstractEntryBase.HIDDEN: "admin/img/icon-alert.svg",
@@ -231,7 +241,7 @@ class AbstractTranslatableEntryBaseAdmin(TranslatableAdmin, AbstractEntryBaseAdm
     )
     list_filter = ["status"]
     if getattr(settings, "PARLER_LANGUAGES", None):
-        list_filter.append("translations__language_code")
+        list_filter.append(LanguageCodeListFilter)
     search_fields = ("translations__slug", "translations__title")
     prepopulated_fields = (
         {}
@@ -0,0 +1,149 @@
+"""
+The list filters and date hierarchy of the entry admin.
+
+The admin list of a large blog spends most of its queries on the sidebar:
+the filter choices and the years/months of the date hierarchy are read from the whole entry table.
+These are cached with versioned cache keys, so they are refreshed when the entries or categories change.
+"""
+from django.contrib import admin
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from django.utils.translation import get_language
+from django.utils.translation import gettext_lazy as _
+from parler.utils import get_language_title
+
+from fluent_blogs import appsettings
+from fluent_blogs.cache import ALL_SITES, get_versioned_cache_key
+
+__all__ = (
+    "CategoryListFilter",
+    "LanguageCodeListFilter",
+    "EntryChangeList",
+)
+
+
+def _get_cached(key, get_value):
+    value = cache.get(key)
+    if value is None:
+        value = get_value()
+        cache.set(key, value, appsettings.FLUENT_BLOGS_ADMIN_CACHE_TIMEOUT)
+    return value
+
+
+class CategoryListFilter(admin.RelatedFieldListFilter):
+    """
+    The categories filter, which caches the category choices until the categories change.
+    """
+
+    def field_choices(self, field, request, model_admin):
+        key = get_versioned_cache_key(
+            "admin_category_choices",
+            model_admin.opts.label_lower,
+            depends_on=["category"],
+            site_id=ALL_SITES,
+            language_code=get_language(),
+        )
+        choices = cache.get(key)
+        if choices is None:
+            choices = list(super().field_choices(field, request, model_admin))
+            cache.set(key, choices, appsettings.FLUENT_BLOGS_ADMIN_CACHE_TIMEOUT)
+        return choices
+
+
+class LanguageCodeListFilter(admin.SimpleListFilter):
+    """
+    The language filter of translated entries.
+
+    Unlike the ``translations__language_code`` field filter, this uses an ``EXISTS`` subquery,
+    so the list query doesn't need a ``JOIN`` and ``DISTINCT`` over the whole entry table.
+    The URL parameter is the same, so existing links to the filter keep working.
+    """
+
+    title = _("language")
+    parameter_name = "translations__language_code"
+
+    def lookups(self, request, model_admin):
+        translation_model = model_admin.model._parler_meta.root_model
+        key = get_versioned_cache_key(
+            "admin_language_codes",
+            model_admin.opts.label_lower,
+            depends_on=["entry"],
+            site_id=ALL_SITES,
+        )
+        language_codes = _get_cached(
+            key,
+            lambda: list(
+                translation_model.objects.order_by("language_code")
+                .values_list("language_code", flat=True)
+                .distinct()
+            ),
+        )
+        return [
+            (language_code, get_language_title(language_code)) for language_code in language_codes
+        ]
+
+    def queryset(self, request, queryset):
+        if not self.value():
+            return queryset
+
+        translation_model = queryset.model._parler_meta.root_model
+        return queryset.filter(
+            Exists(
+                translation_model.objects.filter(master=OuterRef("pk"), language_code=self.value())
+            )
+        )
+
+
+class _CachedDatesQuerySet:
+    # Wraps the list queryset for the {% date_hierarchy %} tag, which reads the dates from the whole table.
+    def __init__(self, queryset, key_args):
+        self._queryset = queryset
+        self._key_args = key_args
+
+    def __getattr__(self, name):
+        return getattr(self._queryset, name)
+
+    def __iter__(self):
+        return iter(self._queryset)
+
+    def __len__(self):
+        return len(self._queryset)
+
+    def _get_cache_key(self, *args):
+        return get_versioned_cache_key(
+            "admin_date_hierarchy", *self._key_args, *args, depends_on=["entry"]
+        )
+
+    def aggregate(self, *args, **kwargs):
+        key = self._get_cache_key("aggregate", repr(args), repr(sorted(kwargs.items())))
+        return _get_cached(key, lambda: self._queryset.aggregate(*args, **kwargs))
+
+    def dates(self, field_name, kind, order="ASC"):
+        key = self._get_cache_key("dates", field_name, kind, order)
+        return _get_cached(key, lambda: list(self._queryset.dates(field_name, kind, order)))
+
+    def datetimes(self, field_name, kind, order="ASC", tzinfo=None):
+        key = self._get_cache_key(
+            "datetimes", field_name, kind, order, timezone.get_current_timezone_name()
+        )
+        return _get_cached(
+            key, lambda: list(self._queryset.datetimes(field_name, kind, order, tzinfo))
+        )
+
+
+class EntryChangeList(ChangeList):
+    """
+    The admin list of entries, which caches the dates of the date hierarchy until the entries change.
+    """
+
+    def __init__(self, request, *args, **kwargs):
+        super().__init__(request, *args, **kwargs)
+        if self.date_hierarchy:
+            # The dates depend on all filters and the search query, but not on the ordering.
+            params = sorted((k, v) for k, v in self.params.items() if k != ORDER_VAR)
+            self.queryset = _CachedDatesQuerySet(
+                self.queryset,
+                (self.opts.label_lower, repr(params)),
+            )
@@ -8,6 +8,7 @@ from fluent_blogs.admin.abstractbase import (
     AbstractTranslatableEntryBaseAdmin,
     SeoEntryAdminMixin,
 )
+from fluent_blogs.admin.changelist import CategoryListFilter, LanguageCodeListFilter
 from fluent_blogs.models import get_entry_model
 
 EntryModel = get_entry_model()
@@ -87,9 +88,9 @@ for _f in appsettings.FLUENT_BLOGS_ADMIN_FIELDS:
 # Add filters for optional mixin fields
 # Note, not adding 'tags' yet. It should only display tags that are in use, sorted by count.
 if "categories" in _model_fields:
-    EntryAdmin.list_filter.append("categories")
+    EntryAdmin.list_filter.append(("categories", CategoryListFilter))
 if _is_translated and getattr(settings, "PARLER_LANGUAGES", None):
-    EntryAdmin.list_filter.append("translations__language_code")
+    EntryAdmin.list_filter.append(LanguageCodeListFilter)
 if "enable_comments" in _model_fields:
     EntryAdmin.list_filter.append("enable_comments")
 
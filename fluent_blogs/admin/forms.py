@@ -9,8 +9,6 @@ from fluent_blogs import appsettings
 from fluent_blogs.models import get_entry_model
 from fluent_blogs.models.query import get_date_range
 
-EntryModel = get_entry_model()
-
 
 class AbstractEntryBaseAdminForm(SlugPreviewFormMixin, ModelForm):
     """
@@ -72,7 +70,7 @@ class AbstractEntryBaseAdminForm(SlugPreviewFormMixin, ModelForm):
         if date_range:
             dup_filters["publication_date__range"] = date_range
 
-        dup_qs = EntryModel.objects.filter(**dup_filters)
+        dup_qs = get_entry_model().objects.filter(**dup_filters)
 
         if self.instance and self.instance.pk:
             dup_qs = dup_qs.exclude(pk=self.instance.pk)
@@ -0,0 +1,41 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class FluentBlogsConfig(AppConfig):
+    name = "fluent_blogs"
+    default_auto_field = "django.db.models.AutoField"
+
+    def ready(self):
+        # The entry model is registered with other apps here,
+        # so get_entry_model() is a cheap lookup that can be called anywhere.
+        from fluent_blogs.base_models import CommentsEntryMixin
+        from fluent_blogs.models import get_entry_model
+
+        EntryModel = get_entry_model()
+
+        # Auto-register with django-fluent-comments moderation
+        if "fluent_comments" in settings.INSTALLED_APPS and issubclass(
+            EntryModel, CommentsEntryMixin
+        ):
+            from fluent_comments.moderation import moderate_model
+
+            moderate_model(
+                EntryModel,
+                publication_date_field="publication_date",
+                enable_comments_field="enable_comments",
+            )
+
+        # Auto-register with django-any-urlfield
+        if "any_urlfield" in settings.INSTALLED_APPS:
+            from any_urlfield.forms.widgets import SimpleRawIdWidget
+            from any_urlfield.models import AnyUrlField
+
+            AnyUrlField.register_model(EntryModel, widget=SimpleRawIdWidget(EntryModel))
+
+        # Track the changes of the blog content, to update the counters, permalinks and invalidate caches.
+        from fluent_blogs import counts, invalidation, permalinks
+
+        counts.connect_signals()
+        permalinks.connect_signals()
+        invalidation.connect_signals()
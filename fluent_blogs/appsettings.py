@@ -41,6 +41,11 @@ FLUENT_BLOGS_ENTRY_MODEL = getattr(settings, "FLUENT_BLOGS_ENTRY_MODEL", "fluent
 # RSS feeds
 FLUENT_BLOGS_FEED_PROTOCOL = getattr(settings, "FLUENT_BLOGS_FEED_PROTOCOL", "http")
 FLUENT_BLOGS_MAX_FEED_ITEMS = getattr(settings, "FLUENT_BLOGS_MAX_FEED_ITEMS", 30)
+# Read the contents of the feed items from the cache, with absolute URLs for images and links.
+FLUENT_BLOGS_FEED_FULL_CONTENT = getattr(settings, "FLUENT_BLOGS_FEED_FULL_CONTENT", False)
+FLUENT_BLOGS_FEED_CONTENT_CACHE_TIMEOUT = getattr(
+    settings, "FLUENT_BLOGS_FEED_CONTENT_CACHE_TIMEOUT", 7 * 24 * 3600
+)
 
 # Comment settings
 FLUENT_BLOGS_INCLUDE_STATIC_FILES = getattr(settings, "FLUENT_BLOGS_INCLUDE_STATIC_FILES", True)
@@ -48,6 +53,38 @@ FLUENT_BLOGS_PAGINATE_BY = getattr(settings, "FLUENT_BLOGS_PAGINATE_BY", 10)
 
 # Performance settings
 FLUENT_BLOGS_PREFETCH_TRANSLATIONS = getattr(settings, "FLUENT_BLOGS_PREFETCH_TRANSLATIONS", False)
+# The {% blogcache %} fragments are invalidated when the content changes, so they can be kept long.
+FLUENT_BLOGS_FRAGMENT_CACHE_TIMEOUT = getattr(
+    settings, "FLUENT_BLOGS_FRAGMENT_CACHE_TIMEOUT", 24 * 3600
+)
+# Extra relations to prefetch at the detail page, e.g. when the templates display them.
+FLUENT_BLOGS_DETAIL_PREFETCH_RELATED = getattr(
+    settings, "FLUENT_BLOGS_DETAIL_PREFETCH_RELATED", ()
+)
+FLUENT_BLOGS_SHORTLINK_CACHE_TIMEOUT = getattr(
+    settings, "FLUENT_BLOGS_SHORTLINK_CACHE_TIMEOUT", 3600
+)
+# The slugs of categories, tags and authors are cached; unknown slugs are cached for a shorter time.
+FLUENT_BLOGS_SLUG_CACHE_TIMEOUT = getattr(settings, "FLUENT_BLOGS_SLUG_CACHE_TIMEOUT", 24 * 3600)
+FLUENT_BLOGS_SLUG_NOT_FOUND_CACHE_TIMEOUT = getattr(
+    settings, "FLUENT_BLOGS_SLUG_NOT_FOUND_CACHE_TIMEOUT", 300
+)
+# The filter choices and date hierarchy of the admin list are cached until the entries change.
+FLUENT_BLOGS_ADMIN_CACHE_TIMEOUT = getattr(settings, "FLUENT_BLOGS_ADMIN_CACHE_TIMEOUT", 3600)
+
+# Database alias for the read-only queries of the views, feeds, sitemaps and template tags.
+FLUENT_BLOGS_READ_DATABASE = getattr(settings, "FLUENT_BLOGS_READ_DATABASE", None)
+# Number of seconds to read from the primary database after a visitor posted data.
+FLUENT_BLOGS_READ_PRIMARY_AFTER_WRITE = getattr(
+    settings, "FLUENT_BLOGS_READ_PRIMARY_AFTER_WRITE", 0
+)
+
+# Instrumentation settings
+FLUENT_BLOGS_INSTRUMENTATION = getattr(settings, "FLUENT_BLOGS_INSTRUMENTATION", False)
+FLUENT_BLOGS_SERVER_TIMING = getattr(settings, "FLUENT_BLOGS_SERVER_TIMING", True)
+FLUENT_BLOGS_STATS_SINK = getattr(
+    settings, "FLUENT_BLOGS_STATS_SINK", "fluent_blogs.instrumentation.LoggingStatsSink"
+)
 
 # Note: the default language setting is used during the migrations
 # Allow this module to have other settings, but default to the shared settings
@@ -84,7 +121,9 @@ def get_language_settings(language_code, site_id=None):
     Return the language settings for the current site
     """
     if site_id is None:
-        site_id = getattr(settings, "SITE_ID", None)
+        from fluent_blogs.sites import get_current_site_id
+
+        site_id = get_current_site_id()
 
     for lang_dict in FLUENT_BLOGS_LANGUAGES.get(site_id, ()):
         if lang_dict["code"] == language_code:
@@ -2,6 +2,7 @@ from django.conf import settings
 from django.contrib.sites.models import Site
 from django.db import models
 from django.urls import NoReverseMatch
+from django.utils.functional import cached_property
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 from fluent_contents.extensions import PluginHtmlField, PluginImageField
@@ -15,6 +16,7 @@ from slug_preview.models import SlugPreviewField
 
 from fluent_blogs import appsettings
 from fluent_blogs.managers import EntryManager, TranslatableEntryManager
+from fluent_blogs.sites import get_current_site_id
 from fluent_blogs.urlresolvers import blog_reverse
 
 # Rename to old class names
@@ -45,7 +47,7 @@ __all__ = (
 
 
 def _get_current_site():
-    return Site.objects.get_current().pk
+    return get_current_site_id()
 
 
 class AbstractTranslatedFieldsEntryBaseMixin(models.Model):
@@ -160,18 +162,27 @@ class AbstractSharedEntryBaseMixin(models.Model):
         """
         Return the link path from the archive page.
         """
+        return self._get_relative_url(self.slug)
+
+    def _get_relative_url(self, slug):
         # Return the link style, using the permalink style setting.
         return appsettings.FLUENT_BLOGS_ENTRY_LINK_STYLE.lstrip("/").format(
             year=self.publication_date.strftime("%Y"),
             month=self.publication_date.strftime("%m"),
             day=self.publication_date.strftime("%d"),
-            slug=self.slug,
+            slug=slug,
             pk=self.pk,
         )
 
     def get_current_language(self):
         return None  # Normal untranslated model: the API is there, but unused.
 
+    def get_translated_urls(self, language_codes=None, page=None, page_urls=None):
+        """
+        Return the URL of each translation, as ``{language_code: url}``.
+        """
+        return {}  # Normal untranslated model: the API is there, but unused.
+
     def get_short_url(self):
         return blog_reverse("entry_shortlink", kwargs={"pk": self.pk}, ignore_multiple=True)
 
@@ -190,33 +201,35 @@ class AbstractSharedEntryBaseMixin(models.Model):
     def is_draft(self):
         return self.status == self.DRAFT
 
-    @property
+    @cached_property
     def previous_entry(self):
         """
-        Return the previous entry
+        Return the previous entry.
+        The value is cached on the object, as templates commonly read it more than once.
         """
         if not self.publication_date:
             # Protection for manually created models (Entry.objects.create())
             return None
         qs = self.__class__.objects.published()
         if self.is_translatable_model:
-            qs = qs.translated()
+            qs = qs.translated().fetch_translations()
 
         entries = qs.filter(publication_date__lt=self.publication_date).order_by(
             "-publication_date"
         )[:1]
         return entries[0] if entries else None
 
-    @property
+    @cached_property
     def next_entry(self):
         """
-        Return the next entry
+        Return the next entry.
+        The value is cached on the object, as templates commonly read it more than once.
         """
         if not self.publication_date:
             return None
         qs = self.__class__.objects.published()
         if self.is_translatable_model:
-            qs = qs.translated()
+            qs = qs.translated().fetch_translations()
 
         entries = qs.filter(publication_date__gt=self.publication_date).order_by(
             "publication_date"
@@ -381,6 +394,46 @@ class AbstractTranslatableEntryBase(TranslatableModel, AbstractSharedEntryBaseMi
         with switch_language(self):
             return super().default_url
 
+    def get_translated_urls(self, language_codes=None, page=None, page_urls=None):
+        """
+        Return the URL of each translation, as ``{language_code: url}``, e.g. for a language switch menu.
+
+        All translations are read at once, from ``prefetch_related("translations")`` when that's used.
+        By default, only the languages of the current site are included.
+        When a *page* is given, the URLs are relative to that blog page.
+        The *page_urls* dict stores the URL of the blog per language, so it can be reused for the next entry.
+        """
+        if language_codes is None:
+            language_codes = [
+                language["code"]
+                for language in appsettings.FLUENT_BLOGS_LANGUAGES.get(get_current_site_id(), ())
+            ]
+        if page_urls is None:
+            page_urls = {}
+
+        slugs = {
+            translation.language_code: translation.slug for translation in self.translations.all()
+        }
+        urls = {}
+        for language_code in language_codes or sorted(slugs):
+            if language_code not in slugs:
+                continue
+
+            try:
+                page_url = page_urls[language_code]
+            except KeyError:
+                if page is not None:
+                    with switch_language(page, language_code):
+                        page_url = page.get_absolute_url()
+                else:
+                    page_url = blog_reverse(
+                        "entry_archive_index", ignore_multiple=True, language_code=language_code
+                    )
+                page_urls[language_code] = page_url
+
+            urls[language_code] = page_url + self._get_relative_url(slugs[language_code])
+        return urls
+
 
 class AbstractTranslatedFieldsEntryBase(
     TranslatedFieldsModel, AbstractTranslatedFieldsEntryBaseMixin
@@ -0,0 +1,161 @@
+"""
+Cache keys of the blog.
+
+All cached data of the blog is stored per site, so multiple sites can share the same cache backend.
+
+Instead of deleting cached data, the cache keys embed "generation" numbers of the content they depend on.
+When the content changes, the generation is increased, so all variations of the old keys are no longer read
+and simply expire from the cache. The generations are increased by the :mod:`fluent_blogs.invalidation` module.
+"""
+import hashlib
+import time
+
+from django.core.cache import cache
+
+from fluent_blogs.sites import get_current_site_id
+
+__all__ = (
+    "ALL_SITES",
+    "GENERATION_DIMENSIONS",
+    "get_cache_key",
+    "get_versioned_cache_key",
+    "get_versioned_cache_keys",
+    "get_generations",
+    "bump_generation",
+    "bump_generations",
+)
+
+_MAX_KEY_LENGTH = 200
+
+#: The site ID for data which is shared by all sites.
+ALL_SITES = "all"
+
+#: The content that cache keys can depend on.
+#: The ``site`` and ``month`` generations are stored per site, the others are shared by all sites.
+#: The ``global`` generation is part of all keys, it's increased by ``manage.py bump_blog_cache``.
+#: The generation of a dimension without a value (e.g. ``"category"``) is increased when any object changes.
+GENERATION_DIMENSIONS = ("global", "site", "month", "entry", "category", "tag", "author", "page")
+_SITE_DIMENSIONS = ("site", "month")
+
+
+def get_cache_key(name, *args, site_id=None, language_code=None):
+    """
+    Return the cache key for a cached object of the blog.
+    The key includes the current site, unless a *site_id* is given.
+    """
+    if site_id is None:
+        site_id = get_current_site_id()
+
+    prefix = f"fluent_blogs.{name}.site{site_id}"
+    if language_code:
+        prefix += f".{language_code}"
+    if not args:
+        return prefix
+
+    suffix = ".".join(str(arg) for arg in args)
+    if len(prefix) + len(suffix) > _MAX_KEY_LENGTH or any(c.isspace() for c in suffix):
+        # Keep the key valid for memcached
+        suffix = hashlib.md5(suffix.encode("utf-8")).hexdigest()
+    return f"{prefix}.{suffix}"
+
+
+def _get_generation_key(dimension, value=None, site_id=None):
+    if dimension not in GENERATION_DIMENSIONS:
+        raise ValueError(f"Invalid cache dimension: {dimension}")
+
+    if dimension in _SITE_DIMENSIONS:
+        site_id = site_id or get_current_site_id()
+    else:
+        site_id = ALL_SITES
+
+    if value is None:
+        return get_cache_key("generation", dimension, site_id=site_id)
+    return get_cache_key("generation", dimension, value, site_id=site_id)
+
+
+def _new_generation():
+    # Start at a new number, so a counter that was evicted from the cache never reuses old keys.
+    return int(time.time() * 1000)
+
+
+def get_generations(*dependencies, site_id=None):
+    """
+    Return the current generations for the given ``(dimension, value)`` pairs.
+    A plain dimension name can be given for dimensions without a value, e.g. ``"site"``.
+    The generations are read in a single cache call.
+    """
+    keys = []
+    for dependency in dependencies:
+        if isinstance(dependency, str):
+            dependency = (dependency, None)
+        keys.append(_get_generation_key(*dependency, site_id=site_id))
+
+    found = cache.get_many(keys)
+    missing = {key: _new_generation() for key in keys if key not in found}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        found.update(missing)
+    return [found[key] for key in keys]
+
+
+def get_versioned_cache_key(name, *args, depends_on=(), site_id=None, language_code=None):
+    """
+    Return the cache key for a cached object, which includes the generations of the content it depends on.
+    The *depends_on* contains ``(dimension, value)`` pairs, e.g. ``[("category", 4)]``.
+    The ``global`` generation is always included.
+    """
+    generations = get_generations("global", *depends_on, site_id=site_id)
+    version = "-".join(str(generation) for generation in generations)
+    return get_cache_key(name, *args, f"g{version}", site_id=site_id, language_code=language_code)
+
+
+def get_versioned_cache_keys(name, keys, site_id=None, language_code=None):
+    """
+    Return the versioned cache keys for multiple objects, reading all generations in a single cache call.
+    The *keys* is a list of ``(args, depends_on)`` tuples.
+    """
+    dependencies = {dependency for args, depends_on in keys for dependency in depends_on}
+    dependencies = ["global"] + sorted(dependencies, key=str)
+    generations = dict(zip(dependencies, get_generations(*dependencies, site_id=site_id)))
+
+    result = []
+    for args, depends_on in keys:
+        version = "-".join(str(generations[dependency]) for dependency in ["global", *depends_on])
+        result.append(
+            get_cache_key(name, *args, f"g{version}", site_id=site_id, language_code=language_code)
+        )
+    return result
+
+
+def bump_generation(dimension, value=None, site_id=None):
+    """
+    Increase the generation of a dimension, so all cache keys that depend on it are no longer used.
+    """
+    key = _get_generation_key(dimension, value, site_id=site_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key does not exist
+        cache.set(key, _new_generation(), timeout=None)
+
+
+def bump_generations(invalidation):
+    """
+    Increase all generations that are affected by an :class:`~fluent_blogs.invalidation.Invalidation`.
+    """
+    for site_id in invalidation.site_ids:
+        bump_generation("site", site_id=site_id)
+    for site_id, year, month in invalidation.months:
+        bump_generation("month", f"{year:04d}-{month:02d}", site_id=site_id)
+
+    for dimension, values in (
+        ("entry", invalidation.entry_ids),
+        ("category", invalidation.category_ids),
+        ("tag", invalidation.tag_ids),
+        ("author", invalidation.author_ids),
+        ("page", invalidation.page_ids),
+    ):
+        for value in values:
+            bump_generation(dimension, value)
+        if values:
+            bump_generation(dimension)
@@ -0,0 +1,241 @@
+"""
+Counters of the published entries per category and tag.
+
+Counting the entries of each category requires a ``GROUP BY`` over the relation table,
+joined with the publication filter and the translations. Instead, the counts are stored
+in the :class:`~fluent_blogs.models.EntryCount` table, per site and language.
+
+The counters of the affected categories and tags are updated after each transaction that changes
+the entries, their categories or tags, and when entries go live or expire (see :mod:`fluent_blogs.scheduler`).
+Use ``manage.py rebuild_blog_counts`` to recalculate all counters.
+This is required once after upgrading, to fill the counters of the existing entries.
+"""
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import OuterRef, PositiveIntegerField, Subquery, Sum
+from django.utils.translation import get_language
+from parler.models import TranslatableModel
+
+from fluent_blogs import appsettings
+from fluent_blogs.invalidation import _get_m2m_field, subscribe
+from fluent_blogs.models import EntryCount, get_entry_model
+from fluent_blogs.replicas import for_read
+from fluent_blogs.sites import get_current_site_id
+
+__all__ = (
+    "get_entry_counts",
+    "with_entry_counts",
+    "update_counts",
+    "rebuild_counts",
+    "connect_signals",
+)
+
+RELATIONS = (EntryCount.CATEGORY, EntryCount.TAG)
+
+
+def _get_links(relation):
+    """
+    Return the relation table as ``(queryset, entry field, object field)``,
+    or ``None`` when the entry model doesn't have this relation.
+    """
+    EntryModel = get_entry_model()
+    if relation == EntryCount.CATEGORY:
+        field = _get_m2m_field(EntryModel, "categories")
+        if field is None:
+            return None
+        through = field.remote_field.through
+        return through.objects.all(), field.m2m_column_name(), field.m2m_reverse_name()
+    else:
+        if "taggit" not in settings.INSTALLED_APPS or getattr(EntryModel, "tags", None) is None:
+            return None
+        through = EntryModel.tags.through
+        ct = ContentType.objects.get_for_model(EntryModel)
+        return through.objects.filter(content_type=ct), "object_id", "tag_id"
+
+
+def _count(relation, object_ids=None):
+    """
+    Count the published entries, as ``{(object_id, site_id, language_code): count}``.
+    """
+    links = _get_links(relation)
+    if links is None:
+        return {}
+    links, entry_field, object_field = links
+
+    EntryModel = get_entry_model()
+    entries = EntryModel._default_manager.all()
+    entries = entries.filter(entries._get_published_filter())
+    links = links.filter(**{f"{entry_field}__in": entries.values("pk")})
+    if object_ids is not None:
+        links = links.filter(**{f"{object_field}__in": object_ids})
+
+    # The site and languages of the linked entries.
+    entry_ids = links.values(entry_field)
+    entry_sites = dict(
+        EntryModel._default_manager.filter(pk__in=entry_ids).values_list("pk", "parent_site_id")
+    )
+    entry_languages = defaultdict(set)
+    if issubclass(EntryModel, TranslatableModel):
+        translations = EntryModel._parler_meta.root_model.objects.filter(master_id__in=entry_ids)
+        for entry_id, language_code in translations.values_list("master_id", "language_code"):
+            entry_languages[entry_id].add(language_code)
+    else:
+        for entry_id in entry_sites:
+            entry_languages[entry_id].add("")
+
+    # An entry is also displayed in the languages that fall back to its translations.
+    found_languages = set().union(*entry_languages.values())
+    site_choices = {
+        site_id: _get_language_choices(site_id, found_languages)
+        for site_id in set(entry_sites.values())
+    }
+
+    counts = defaultdict(int)
+    for object_id, entry_id in links.values_list(object_field, entry_field):
+        site_id = entry_sites.get(entry_id)
+        if site_id is None:
+            continue
+        for language_code, choices in site_choices[site_id].items():
+            if entry_languages[entry_id] & choices:
+                counts[(object_id, site_id, language_code)] += 1
+    return counts
+
+
+def _get_language_choices(site_id, found_languages):
+    # Return the languages that are displayed for each language of the site.
+    if not issubclass(get_entry_model(), TranslatableModel):
+        return {"": {""}}
+
+    language_codes = {lang["code"] for lang in appsettings.FLUENT_BLOGS_LANGUAGES.get(site_id, ())}
+    language_codes.update(found_languages)
+    return {
+        language_code: set(
+            appsettings.FLUENT_BLOGS_LANGUAGES.get_active_choices(language_code, site_id=site_id)
+        )
+        for language_code in language_codes
+    }
+
+
+def _store(relation, counts, object_ids=None):
+    """
+    Write the changed counters, and remove the counters that dropped to zero.
+    """
+    with transaction.atomic():
+        qs = EntryCount.objects.filter(relation=relation)
+        if object_ids is not None:
+            qs = qs.filter(object_id__in=object_ids)
+
+        existing = {
+            (row.object_id, row.parent_site_id, row.language_code): row
+            for row in qs.select_for_update()
+        }
+        stale = [row.pk for key, row in existing.items() if key not in counts]
+        changed = []
+        for key, row in existing.items():
+            if key in counts and row.count != counts[key]:
+                row.count = counts[key]
+                changed.append(row)
+        new = [
+            EntryCount(
+                relation=relation,
+                object_id=object_id,
+                parent_site_id=site_id,
+                language_code=language_code,
+                count=count,
+            )
+            for (object_id, site_id, language_code), count in counts.items()
+            if (object_id, site_id, language_code) not in existing
+        ]
+
+        if stale:
+            EntryCount.objects.filter(pk__in=stale).delete()
+        if changed:
+            EntryCount.objects.bulk_update(changed, ["count"])
+        if new:
+            # Concurrent updates calculate the same counts, so these can be ignored.
+            EntryCount.objects.bulk_create(new, batch_size=500, ignore_conflicts=True)
+
+
+def update_counts(category_ids=(), tag_ids=()):
+    """
+    Recalculate the counters of the given categories and tags.
+    """
+    for relation, object_ids in ((EntryCount.CATEGORY, category_ids), (EntryCount.TAG, tag_ids)):
+        if object_ids:
+            object_ids = set(object_ids)
+            _store(relation, _count(relation, object_ids), object_ids)
+
+
+def rebuild_counts():
+    """
+    Recalculate all counters.
+    """
+    for relation in RELATIONS:
+        _store(relation, _count(relation))
+
+
+def _get_count_language(language_code=None, site_id=None):
+    if not issubclass(get_entry_model(), TranslatableModel):
+        return ""
+
+    # Map a language variant (e.g. "en-us") to the configured language.
+    language_code = language_code or get_language()
+    return appsettings.FLUENT_BLOGS_LANGUAGES.get_language(language_code, site_id=site_id)["code"]
+
+
+def _get_counts_queryset(relation, site_id=None, language_code=None):
+    if site_id is None:
+        site_id = get_current_site_id()
+
+    qs = EntryCount.objects.filter(
+        relation=relation, language_code=_get_count_language(language_code, site_id)
+    )
+    if appsettings.FLUENT_BLOGS_FILTER_SITE_ID:
+        qs = qs.filter(parent_site=site_id)
+    return for_read(qs)
+
+
+def get_entry_counts(relation, site_id=None, language_code=None):
+    """
+    Return the number of published entries for the current site and language,
+    as ``{object_id: count}`` dictionary. The *relation* is ``"category"`` or ``"tag"``.
+    """
+    qs = _get_counts_queryset(relation, site_id=site_id, language_code=language_code)
+    return dict(
+        qs.order_by()
+        .values("object_id")
+        .annotate(total=Sum("count"))
+        .values_list("object_id", "total")
+    )
+
+
+def with_entry_counts(queryset, relation, site_id=None, language_code=None):
+    """
+    Add a ``count`` attribute to a queryset of categories or tags.
+    Only the objects with published entries are returned.
+    """
+    counts = (
+        _get_counts_queryset(relation, site_id=site_id, language_code=language_code)
+        .filter(object_id=OuterRef("pk"))
+        .order_by()
+        .values("object_id")
+        .annotate(total=Sum("count"))
+        .values("total")
+    )
+    return queryset.annotate(count=Subquery(counts, output_field=PositiveIntegerField())).filter(
+        count__gt=0
+    )
+
+
+def _on_cache_invalidated(sender, invalidation, **kwargs):
+    update_counts(invalidation.category_ids, invalidation.tag_ids)
+
+
+def connect_signals():
+    """
+    Update the counters when the blog content changed. This is called by the ``AppConfig.ready()`` method.
+    """
+    subscribe(_on_cache_invalidated)
@@ -0,0 +1,184 @@
+"""
+Streaming export of blog entries.
+
+The entries are read in chunks of a fixed size, with the translations,
+categories, tags and contents fetched in bulk for each chunk.
+This keeps the memory usage constant, regardless of the number of entries.
+The rows use the same format as :mod:`fluent_blogs.importer` reads.
+"""
+import json
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+from parler.models import TranslatableModel
+
+from fluent_blogs.models import get_category_model, get_entry_model
+
+__all__ = (
+    "EntryExporter",
+    "export_entries",
+    "write_jsonl",
+)
+
+
+class EntryExporter:
+    """
+    Export blog entries as dictionaries.
+
+    When *since* is given, only the entries modified after that moment are exported.
+    This allows incremental exports based on the ``modification_date``.
+    """
+
+    def __init__(self, since=None, batch_size=500, include_contents=True, using=None):
+        self.model = get_entry_model()
+        self.since = since
+        self.batch_size = batch_size
+        self.using = using
+
+        self.is_translatable = issubclass(self.model, TranslatableModel)
+        if self.is_translatable:
+            self.translation_model = self.model._parler_meta.root_model
+            self.translated_fields = _get_value_fields(self.translation_model)
+        else:
+            self.translated_fields = ()
+        self.shared_fields = _get_value_fields(self.model)
+
+        field_names = [f.name for f in self.model._meta.get_fields()]
+        self.has_categories = "categories" in field_names
+        self.has_tags = "tags" in field_names and bool(getattr(self.model, "tags", None))
+        self.has_contents = include_contents and "contents" in field_names
+
+    def get_queryset(self):
+        """
+        The base queryset of all entries to export.
+        """
+        qs = self.model._base_manager.all()
+        if self.using:
+            qs = qs.using(self.using)
+        if self.since is not None:
+            qs = qs.filter(modification_date__gt=self.since)
+        return qs.select_related("author")
+
+    def iter_chunks(self):
+        """
+        Read the entries in chunks, using keyset pagination on the primary key.
+        Each chunk is a new query, so only a single chunk is kept in memory.
+        """
+        qs = self.get_queryset().order_by("pk")
+        if self.is_translatable:
+            qs = qs.prefetch_related("translations")
+        if self.has_categories:
+            Category = get_category_model()
+            category_qs = Category.objects.all()
+            if issubclass(Category, TranslatableModel):
+                category_qs = category_qs.prefetch_related("translations")
+            qs = qs.prefetch_related(Prefetch("categories", queryset=category_qs))
+        if self.has_tags:
+            qs = qs.prefetch_related("tags")
+
+        last_pk = None
+        while True:
+            chunk_qs = qs if last_pk is None else qs.filter(pk__gt=last_pk)
+            chunk = list(chunk_qs[: self.batch_size])
+            if not chunk:
+                return
+            yield chunk
+            if len(chunk) < self.batch_size:
+                return
+            last_pk = chunk[-1].pk
+
+    def __iter__(self):
+        for chunk in self.iter_chunks():
+            contents = self._get_chunk_contents(chunk) if self.has_contents else {}
+            for entry in chunk:
+                yield self.get_row(entry, contents)
+
+    def get_row(self, entry, contents=None):
+        """
+        Return the export data for a single entry.
+        """
+        row = {"id": entry.pk}
+        for name, field in self.shared_fields.items():
+            row[name] = field.value_from_object(entry)
+        row["site"] = entry.parent_site_id
+        row["author"] = entry.author.get_username() if entry.author_id else None
+
+        if self.is_translatable:
+            translations = {}
+            for translation in entry.translations.all():
+                values = {
+                    name: field.value_from_object(translation)
+                    for name, field in self.translated_fields.items()
+                }
+                if contents:
+                    values["contents"] = contents.get((entry.pk, translation.language_code), "")
+                translations[translation.language_code] = values
+
+            # The first language is exported flat, the remaining as "translations".
+            if translations:
+                language_code = sorted(translations)[0]
+                row["language_code"] = language_code
+                row.update(translations.pop(language_code))
+                row["translations"] = translations
+        elif contents:
+            row["contents"] = contents.get((entry.pk, None), "")
+
+        if self.has_categories:
+            row["categories"] = [category.slug for category in entry.categories.all()]
+        if self.has_tags:
+            row["tags"] = [tag.name for tag in entry.tags.all()]
+        return row
+
+    def _get_chunk_contents(self, chunk):
+        # Render the contents of all entries in the chunk, reading the content items in bulk.
+        from fluent_contents.models import ContentItem
+        from fluent_contents.rendering import render_content_items
+        from fluent_contents.rendering.utils import get_dummy_request
+
+        ct = ContentType.objects.get_for_model(self.model)
+        items = ContentItem.objects.filter(
+            parent_type=ct,
+            parent_id__in=[entry.pk for entry in chunk],
+            placeholder__slot="blog_contents",
+        ).order_by("parent_id", "language_code", "sort_order")
+
+        grouped = {}
+        for item in items:
+            language_code = item.language_code if self.is_translatable else None
+            grouped.setdefault((item.parent_id, language_code), []).append(item)
+
+        contents = {}
+        for key, key_items in grouped.items():
+            request = get_dummy_request(key[1])
+            contents[key] = str(render_content_items(request, key_items).html)
+        return contents
+
+
+def export_entries(**kwargs):
+    """
+    Iterate over all blog entries, returning a dictionary per entry.
+    The keyword arguments are passed to :class:`EntryExporter`.
+    """
+    return iter(EntryExporter(**kwargs))
+
+
+def write_jsonl(rows, fileobj):
+    """
+    Write the rows to a JSON Lines file.
+    Returns the number of rows written.
+    """
+    count = 0
+    for row in rows:
+        fileobj.write(json.dumps(row, cls=DjangoJSONEncoder) + "\n")
+        count += 1
+    return count
+
+
+def _get_value_fields(model):
+    # The concrete fields that are included in the export.
+    return {
+        field.name: field
+        for field in model._meta.concrete_fields
+        if not field.primary_key and not field.is_relation and field.name != "language_code"
+    }
@@ -0,0 +1,137 @@
+"""
+Feed generators of the blog.
+
+Besides the RSS and Atom formats of :mod:`django.utils.feedgenerator`, this adds a JSON Feed 1.1 format.
+All generators can also write the feed in parts, so large feeds can be sent with a
+:class:`~django.http.StreamingHttpResponse` while the items are read from the database.
+"""
+import json
+from io import StringIO
+
+from django.utils import feedgenerator
+from django.utils.xmlutils import SimplerXMLGenerator
+
+__all__ = (
+    "StreamingFeedMixin",
+    "Atom1Feed",
+    "RssUserland091Feed",
+    "Rss201rev2Feed",
+    "JsonFeed",
+)
+
+
+class StreamingFeedMixin:
+    """
+    Allow writing the feed in parts.
+    """
+
+    #: The closing tag of the document, the items of the next parts are written before it.
+    closing_tag = None
+
+    def stream(self, next_feeds, encoding="utf-8"):
+        """
+        Generate the feed document in parts. The *next_feeds* is an iterable of generators
+        that hold the next items of the feed. The feed elements are only taken from this object.
+        """
+        document = self.writeString(encoding)
+        end = document.rindex(self.closing_tag)
+        yield document[:end].encode(encoding)
+
+        has_items = bool(self.items)
+        for feed in next_feeds:
+            if feed.items:
+                yield feed.write_items_string(encoding, is_continued=has_items).encode(encoding)
+                has_items = True
+
+        yield document[end:].encode(encoding)
+
+    def write_items_string(self, encoding, is_continued=False):
+        """
+        Return the elements of the items only.
+        """
+        buffer = StringIO()
+        handler = SimplerXMLGenerator(buffer, encoding, short_empty_elements=True)
+        self.write_items(handler)
+        return buffer.getvalue()
+
+
+class Atom1Feed(StreamingFeedMixin, feedgenerator.Atom1Feed):
+    closing_tag = "</feed>"
+
+
+class RssUserland091Feed(StreamingFeedMixin, feedgenerator.RssUserland091Feed):
+    closing_tag = "</channel>"
+
+
+class Rss201rev2Feed(StreamingFeedMixin, feedgenerator.Rss201rev2Feed):
+    closing_tag = "</channel>"
+
+
+class JsonFeed(StreamingFeedMixin, feedgenerator.SyndicationFeed):
+    """
+    A `JSON Feed 1.1 <https://www.jsonfeed.org/version/1.1/>`_ document.
+    """
+
+    content_type = "application/feed+json; charset=utf-8"
+    closing_tag = "]}"
+
+    def write(self, outfile, encoding):
+        data = self.get_feed_data()
+        data["items"] = [self.get_item_data(item) for item in self.items]  # Keep as last key
+        outfile.write(json.dumps(data, ensure_ascii=False))
+
+    def write_items_string(self, encoding, is_continued=False):
+        items = ", ".join(
+            json.dumps(self.get_item_data(item), ensure_ascii=False) for item in self.items
+        )
+        return f", {items}" if is_continued else items
+
+    def get_feed_data(self):
+        feed = self.feed
+        data = {
+            "version": "https://jsonfeed.org/version/1.1",
+            "title": feed["title"],
+            "home_page_url": feed["link"],
+        }
+        if feed["feed_url"]:
+            data["feed_url"] = feed["feed_url"]
+        if feed["subtitle"] or feed["description"]:
+            data["description"] = feed["subtitle"] or feed["description"]
+        if feed["language"]:
+            data["language"] = feed["language"]
+        if feed["author_name"]:
+            data["authors"] = [_get_author(feed)]
+        return data
+
+    def get_item_data(self, item):
+        data = {
+            "id": item["unique_id"] or item["link"],
+            "url": item["link"],
+            "title": item["title"],
+            "content_html": item["description"] or "",
+        }
+        if item["pubdate"]:
+            data["date_published"] = feedgenerator.rfc3339_date(item["pubdate"])
+        if item["updateddate"]:
+            data["date_modified"] = feedgenerator.rfc3339_date(item["updateddate"])
+        if item["author_name"]:
+            data["authors"] = [_get_author(item)]
+        if item["categories"]:
+            data["tags"] = list(item["categories"])
+        if item["enclosures"]:
+            data["attachments"] = [
+                {
+                    "url": enclosure.url,
+                    "mime_type": enclosure.mime_type,
+                    "size_in_bytes": int(enclosure.length or 0),
+                }
+                for enclosure in item["enclosures"]
+            ]
+        return data
+
+
+def _get_author(values):
+    author = {"name": values["author_name"]}
+    if values["author_link"]:
+        author["url"] = values["author_link"]
+    return author
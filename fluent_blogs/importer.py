@@ -0,0 +1,497 @@
+"""
+Bulk import of blog entries.
+
+The rows are read as a stream (e.g. from a JSON Lines or CSV file),
+and written to the database in batches using ``bulk_create()``.
+Each row is a dictionary with the following keys:
+
+* ``id``: optional primary key, used to detect rows which are already imported.
+* ``language_code``: the language of the ``title``, ``slug`` and other translated fields.
+* ``title``, ``slug`` and any other (translated) model field, e.g. ``status`` or ``publication_date``.
+* ``translations``: optional dictionary of ``{language_code: {field: value}}`` for additional languages.
+* ``author``: the username of the author.
+* ``categories``: a list of category slugs.
+* ``tags``: a list of tag names.
+* ``contents``: the HTML contents, stored as text item in the ``blog_contents`` placeholder.
+
+This is the same format as the output of :mod:`fluent_blogs.exporter`.
+"""
+import csv
+import json
+from datetime import datetime
+from itertools import islice
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.core.management.color import no_style
+from django.db import connections, router, transaction
+from django.utils.text import slugify
+from django.utils.timezone import is_naive, make_aware
+from parler.models import TranslatableModel
+
+from fluent_blogs import appsettings
+from fluent_blogs.models import get_category_model, get_entry_model
+from fluent_blogs.signals import entries_changed
+from fluent_blogs.sites import get_current_site_id
+
+__all__ = (
+    "read_jsonl",
+    "read_csv",
+    "EntryImporter",
+    "import_entries",
+)
+
+# Row keys that are handled separately from the model fields.
+_SPECIAL_KEYS = (
+    "id",
+    "language_code",
+    "translations",
+    "author",
+    "categories",
+    "tags",
+    "contents",
+    # Written by the exporter, but not imported.
+    "site",
+    "creation_date",
+    "modification_date",
+)
+
+
+def read_jsonl(fileobj):
+    """
+    Read rows from a JSON Lines file, one JSON object per line.
+    """
+    for line_no, line in enumerate(fileobj, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON at line {line_no}: {e}")
+
+
+def read_csv(fileobj):
+    """
+    Read rows from a CSV file with a header line.
+    The ``categories`` and ``tags`` columns contain comma separated values.
+    """
+    for row in csv.DictReader(fileobj):
+        row = {key: value for key, value in row.items() if value not in ("", None)}
+        for name in ("categories", "tags"):
+            if name in row:
+                row[name] = [value.strip() for value in row[name].split(",") if value.strip()]
+        yield row
+
+
+def _chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ImportResult:
+    """
+    The statistics of an import run.
+    """
+
+    def __init__(self):
+        self.created = 0
+        self.skipped = 0
+        self.warnings = []
+
+    def __repr__(self):
+        return "<ImportResult created={} skipped={} warnings={}>".format(
+            self.created, self.skipped, len(self.warnings)
+        )
+
+
+class EntryImporter:
+    """
+    Import blog entries in batches.
+
+    Categories, authors and tags are resolved using in-memory lookup tables,
+    so each batch only needs a fixed number of queries.
+    Content items are polymorphic models, which ``bulk_create()`` doesn't support;
+    these are still saved one by one within the batch transaction.
+
+    When *resume* is set, rows that were already imported are skipped.
+    These are detected by their ``id``, or by their slug, language and publication date.
+    """
+
+    def __init__(self, site=None, language_code=None, batch_size=500, resume=False, using=None):
+        self.model = get_entry_model()
+        self.using = using or router.db_for_write(self.model)
+        self.batch_size = batch_size
+        self.resume = resume
+        self.language_code = language_code or appsettings.FLUENT_BLOGS_DEFAULT_LANGUAGE_CODE
+        self.result = ImportResult()
+
+        # Resolve once, instead of calling the parent_site default for every row.
+        if site is None:
+            site = get_current_site_id()
+        self.site_id = site.pk if isinstance(site, Site) else int(site)
+
+        self.is_translatable = issubclass(self.model, TranslatableModel)
+        if self.is_translatable:
+            self.translation_model = self.model._parler_meta.root_model
+            self.translated_fields = _get_value_fields(self.translation_model)
+        else:
+            self.translation_model = None
+            self.translated_fields = {}
+        self.shared_fields = _get_value_fields(self.model)
+
+        field_names = [f.name for f in self.model._meta.get_fields()]
+        self.has_categories = "categories" in field_names
+        self.has_tags = "tags" in field_names and bool(getattr(self.model, "tags", None))
+        self.has_contents = "contents" in field_names
+        self.content_item_model, self.content_item_field = _get_content_item_model()
+
+        # Lookup tables, filled on demand.
+        self._categories = None
+        self._authors = {}
+        self._tags = {}
+
+    def run(self, rows, progress=None):
+        """
+        Import all rows. The optional *progress* callback receives the :class:`ImportResult`
+        after every batch.
+        """
+        for batch in _chunked(rows, self.batch_size):
+            self.import_batch(batch)
+            if progress is not None:
+                progress(self.result)
+        return self.result
+
+    def import_batch(self, rows):
+        """
+        Import a single batch of rows in one transaction.
+        """
+        with transaction.atomic(using=self.using):
+            if self.resume:
+                rows = self._exclude_existing(rows)
+                if not rows:
+                    return
+
+            self._load_authors(rows)
+            entries = [self._build_entry(row) for row in rows]
+            self._bulk_create_entries(entries)
+            if any(row.get("id") for row in rows):
+                self._reset_sequences()
+
+            if self.is_translatable:
+                translations = []
+                for row, entry in zip(rows, entries):
+                    for language_code, values in self._get_row_translations(row):
+                        translations.append(self._build_translation(entry, language_code, values))
+                self.translation_model.objects.using(self.using).bulk_create(translations)
+
+            if self.has_categories:
+                self._bulk_add_categories(rows, entries)
+            if self.has_tags:
+                self._bulk_add_tags(rows, entries)
+            if self.has_contents:
+                self._bulk_add_contents(rows, entries)
+
+        self.result.created += len(entries)
+        entries_changed.send(sender=self.model, entry_ids=[entry.pk for entry in entries])
+
+    def _get_row_translations(self, row):
+        base = {k: v for k, v in row.items() if k in self.translated_fields or k == "contents"}
+        languages = [(row.get("language_code") or self.language_code, base)]
+        languages += list((row.get("translations") or {}).items())
+        return languages
+
+    def _build_entry(self, row):
+        values = {"parent_site_id": self.site_id}
+        if row.get("id"):
+            values["pk"] = int(row["id"])
+        for name, value in row.items():
+            if name in _SPECIAL_KEYS:
+                continue
+            try:
+                field = self.shared_fields[name]
+            except KeyError:
+                if name not in self.translated_fields:
+                    self._warn(f"Ignoring unknown field '{name}'.")
+                continue
+            values[field.attname] = _to_python(field, value)
+
+        author = row.get("author")
+        if author:
+            values["author_id"] = self._authors.get(author)
+
+        return self.model(**values)
+
+    def _build_translation(self, entry, language_code, values):
+        translation = self.translation_model(master_id=entry.pk, language_code=language_code)
+        for name, value in values.items():
+            field = self.translated_fields.get(name)
+            if field is not None:
+                setattr(translation, field.attname, _to_python(field, value))
+        return translation
+
+    def _bulk_create_entries(self, entries):
+        manager = self.model._base_manager.db_manager(self.using)
+        if connections[self.using].features.can_return_rows_from_bulk_insert:
+            manager.bulk_create(entries)
+        else:
+            # The primary keys are needed for the related objects.
+            for entry in entries:
+                entry.save(using=self.using)
+
+    def _reset_sequences(self):
+        # Like loaddata, let the next created entry continue after the explicitly given primary keys.
+        models = [self.model]
+        if self.is_translatable:
+            models.append(self.translation_model)
+
+        connection = connections[self.using]
+        statements = connection.ops.sequence_reset_sql(no_style(), models)
+        if statements:
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
+
+    def _exclude_existing(self, rows):
+        ids = [int(row["id"]) for row in rows if row.get("id")]
+        existing_ids = set(
+            self.model._base_manager.using(self.using)
+            .filter(pk__in=ids)
+            .values_list("pk", flat=True)
+        )
+
+        # Rows without an ID are recognized by their slug.
+        keys = {
+            (row.get("language_code") or self.language_code, row["slug"])
+            for row in rows
+            if not row.get("id") and row.get("slug")
+        }
+        existing_keys = set()
+        if keys:
+            slugs = [slug for __, slug in keys]
+            if self.is_translatable:
+                qs = self.translation_model.objects.using(self.using).filter(slug__in=slugs)
+                values = qs.values_list("language_code", "slug", "master__publication_date")
+            else:
+                qs = self.model._base_manager.using(self.using).filter(slug__in=slugs)
+                values = (
+                    (self.language_code, slug, date)
+                    for slug, date in qs.values_list("slug", "publication_date")
+                )
+            existing_keys = set(values)
+
+        new_rows = []
+        date_field = self.shared_fields.get("publication_date")
+        for row in rows:
+            if row.get("id"):
+                exists = int(row["id"]) in existing_ids
+            else:
+                publication_date = row.get("publication_date")
+                if publication_date is not None and date_field is not None:
+                    publication_date = _to_python(date_field, publication_date)
+                key = (row.get("language_code") or self.language_code, row.get("slug"))
+                exists = (key + (publication_date,)) in existing_keys
+
+            if exists:
+                self.result.skipped += 1
+            else:
+                new_rows.append(row)
+        return new_rows
+
+    def _load_authors(self, rows):
+        usernames = {row["author"] for row in rows if row.get("author")}
+        missing = usernames.difference(self._authors)
+        if not missing:
+            return
+
+        User = get_user_model()
+        found = dict(
+            User._default_manager.filter(**{f"{User.USERNAME_FIELD}__in": missing}).values_list(
+                User.USERNAME_FIELD, "pk"
+            )
+        )
+        for username in missing:
+            if username not in found:
+                self._warn(f"Unknown author '{username}'.")
+            self._authors[username] = found.get(username)
+
+    def _get_category_lookup(self):
+        # Categories are a small table, read it fully once.
+        if self._categories is None:
+            Category = get_category_model()
+            self._categories = {}
+            if issubclass(Category, TranslatableModel):
+                CategoryTranslation = Category._parler_meta.root_model
+                for language_code, slug, pk in CategoryTranslation.objects.values_list(
+                    "language_code", "slug", "master_id"
+                ):
+                    self._categories[(language_code, slug)] = pk
+                    self._categories.setdefault((None, slug), pk)
+            else:
+                for slug, pk in Category.objects.values_list("slug", "pk"):
+                    self._categories[(None, slug)] = pk
+        return self._categories
+
+    def _bulk_add_categories(self, rows, entries):
+        lookup = self._get_category_lookup()
+        field = self.model._meta.get_field("categories")
+        through = field.remote_field.through
+        source_attname = through._meta.get_field(field.m2m_field_name()).attname
+        target_attname = through._meta.get_field(field.m2m_reverse_field_name()).attname
+
+        links = []
+        for row, entry in zip(rows, entries):
+            language_code = row.get("language_code") or self.language_code
+            for slug in set(row.get("categories") or ()):
+                pk = lookup.get((language_code, slug)) or lookup.get((None, slug))
+                if pk is None:
+                    self._warn(f"Unknown category '{slug}'.")
+                    continue
+                links.append(through(**{source_attname: entry.pk, target_attname: pk}))
+        through.objects.using(self.using).bulk_create(links)
+
+    def _load_tags(self, Tag, names):
+        missing = set(names).difference(self._tags)
+        if not missing:
+            return
+
+        qs = Tag.objects.using(self.using)
+        self._tags.update(qs.filter(name__in=missing).values_list("name", "pk"))
+        missing.difference_update(self._tags)
+        if not missing:
+            return
+
+        # Create the new tags, several names could map to the same unique slug.
+        by_slug = {}
+        for name in sorted(missing):
+            by_slug.setdefault(slugify(name), name)
+        existing = set(qs.filter(slug__in=by_slug).values_list("slug", flat=True))
+        qs.bulk_create(
+            [Tag(name=name, slug=slug) for slug, name in by_slug.items() if slug not in existing]
+        )
+        slug_ids = dict(qs.filter(slug__in=by_slug).values_list("slug", "pk"))
+        for name in missing:
+            self._tags[name] = slug_ids.get(slugify(name))
+
+    def _bulk_add_tags(self, rows, entries):
+        through = self.model._meta.get_field("tags").remote_field.through
+        Tag = through._meta.get_field("tag").remote_field.model
+        self._load_tags(Tag, {name for row in rows for name in row.get("tags") or ()})
+
+        if any(f.name == "content_type" for f in through._meta.get_fields()):
+            # Generic tagged item, e.g. the default taggit.models.TaggedItem
+            ct_id = ContentType.objects.get_for_model(self.model).pk
+            object_kwargs = lambda entry: {"content_type_id": ct_id, "object_id": entry.pk}
+        else:
+            object_kwargs = lambda entry: {"content_object_id": entry.pk}
+
+        links = []
+        for row, entry in zip(rows, entries):
+            tag_ids = {self._tags.get(name) for name in row.get("tags") or ()}
+            tag_ids.discard(None)
+            for tag_id in tag_ids:
+                links.append(through(tag_id=tag_id, **object_kwargs(entry)))
+        through.objects.using(self.using).bulk_create(links)
+
+    def _bulk_add_contents(self, rows, entries):
+        from fluent_contents.models import Placeholder
+
+        # Every entry receives a placeholder, like entries saved in the admin.
+        ct_id = ContentType.objects.get_for_model(self.model).pk
+        placeholders = [
+            Placeholder(
+                parent_type_id=ct_id,
+                parent_id=entry.pk,
+                slot="blog_contents",
+                role=Placeholder.MAIN,
+                title="Blog Contents",
+            )
+            for entry in entries
+        ]
+        Placeholder.objects.using(self.using).bulk_create(placeholders)
+
+        todo = []
+        for row, placeholder in zip(rows, placeholders):
+            for language_code, values in self._get_row_translations(row):
+                if values.get("contents"):
+                    todo.append((placeholder, language_code, values["contents"]))
+        if not todo:
+            return
+
+        if self.content_item_model is None:
+            self._warn("No text plugin installed, contents are not imported.")
+            return
+        if placeholders[0].pk is None:
+            # No returned IDs on this database backend
+            by_parent = {
+                placeholder.parent_id: placeholder
+                for placeholder in Placeholder.objects.using(self.using).filter(
+                    parent_type_id=ct_id,
+                    parent_id__in=[entry.pk for entry in entries],
+                    slot="blog_contents",
+                )
+            }
+            todo = [(by_parent[p.parent_id], lang, html) for p, lang, html in todo]
+
+        for placeholder, language_code, html in todo:
+            self.content_item_model.objects.using(self.using).create(
+                placeholder=placeholder,
+                parent_type_id=ct_id,
+                parent_id=placeholder.parent_id,
+                sort_order=1,
+                language_code=language_code,
+                **{self.content_item_field: html},
+            )
+
+    def _warn(self, message):
+        if message not in self.result.warnings:
+            self.result.warnings.append(message)
+
+
+def import_entries(rows, **kwargs):
+    """
+    Import blog entries from an iterable of dictionaries.
+    The keyword arguments are passed to :class:`EntryImporter`.
+
+    :rtype: ImportResult
+    """
+    progress = kwargs.pop("progress", None)
+    return EntryImporter(**kwargs).run(rows, progress=progress)
+
+
+def _get_value_fields(model):
+    # The concrete fields that can be assigned from a row value.
+    return {
+        field.name: field
+        for field in model._meta.concrete_fields
+        if not field.primary_key
+        and not field.is_relation
+        and field.name not in ("language_code", "creation_date", "modification_date")
+    }
+
+
+def _to_python(field, value):
+    value = field.to_python(value)
+    if isinstance(value, datetime) and is_naive(value):
+        # Naive datetime strings are interpreted in the current timezone.
+        value = make_aware(value)
+    return value
+
+
+def _get_content_item_model():
+    if apps.is_installed("fluent_contents.plugins.text"):
+        from fluent_contents.plugins.text.models import TextItem
+
+        return TextItem, "text"
+    elif apps.is_installed("fluent_contents.plugins.rawhtml"):
+        from fluent_contents.plugins.rawhtml.models import RawHtmlItem
+
+        return RawHtmlItem, "html"
+    else:
+        return None, None
@@ -0,0 +1,224 @@
+"""
+Opt-in instrumentation of the blog views, feeds and sitemaps.
+
+When :ref:`FLUENT_BLOGS_INSTRUMENTATION` is enabled, every request records
+the number of SQL queries, the SQL time, cache hits and misses and the template render time.
+The results are:
+
+* sent with the :data:`~fluent_blogs.signals.view_stats_recorded` signal,
+* passed to the stats sink configured in :ref:`FLUENT_BLOGS_STATS_SINK`,
+* added as ``Server-Timing`` header to the response (unless :ref:`FLUENT_BLOGS_SERVER_TIMING` is disabled).
+
+Note that template responses are rendered within the view when instrumentation is enabled,
+so the queries executed by the templates are included in the statistics.
+"""
+import logging
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+
+from django.db import connections
+from django.template.response import SimpleTemplateResponse
+from django.utils.module_loading import import_string
+
+from fluent_blogs import appsettings
+from fluent_blogs.signals import view_stats_recorded
+
+__all__ = (
+    "BlogStats",
+    "BaseStatsSink",
+    "LoggingStatsSink",
+    "collect_stats",
+    "instrument_view",
+    "InstrumentedSitemapMixin",
+    "record_cache_hit",
+    "record_cache_miss",
+)
+
+logger = logging.getLogger("fluent_blogs.stats")
+
+_current_stats = ContextVar("fluent_blogs_stats", default=None)
+_stats_sink = None
+
+
+class BlogStats:
+    """
+    The collected statistics of a single view, feed or sitemap.
+    """
+
+    def __init__(self, view_name):
+        self.view_name = view_name
+        self.query_count = 0
+        self.query_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.template_time = 0.0
+        self.total_time = 0.0
+
+    def __repr__(self):
+        return "<BlogStats {}: {} queries>".format(self.view_name, self.query_count)
+
+    def __call__(self, execute, sql, params, many, context):
+        # Used as database execute wrapper.
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.query_count += 1
+            self.query_time += perf_counter() - start
+
+    def as_dict(self):
+        """
+        Return the statistics as dictionary, e.g. for JSON logging.
+        """
+        return {
+            "view_name": self.view_name,
+            "query_count": self.query_count,
+            "query_time": self.query_time,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "template_time": self.template_time,
+            "total_time": self.total_time,
+        }
+
+    def get_server_timing(self):
+        """
+        Return the value for the ``Server-Timing`` HTTP header.
+        """
+        return ", ".join(
+            (
+                'sql;dur={:.2f};desc="{} queries"'.format(
+                    self.query_time * 1000, self.query_count
+                ),
+                'cache;desc="{} hits, {} misses"'.format(self.cache_hits, self.cache_misses),
+                "tpl;dur={:.2f}".format(self.template_time * 1000),
+                "blog;dur={:.2f}".format(self.total_time * 1000),
+            )
+        )
+
+
+class BaseStatsSink:
+    """
+    The interface for a stats sink, which receives the statistics of each request.
+    """
+
+    def record(self, stats):
+        raise NotImplementedError
+
+
+class LoggingStatsSink(BaseStatsSink):
+    """
+    Write the statistics to the ``fluent_blogs.stats`` logger.
+    """
+
+    def record(self, stats):
+        logger.info(
+            "%s: %d queries (%.1fms), %d cache hits, %d cache misses, template %.1fms, total %.1fms",
+            stats.view_name,
+            stats.query_count,
+            stats.query_time * 1000,
+            stats.cache_hits,
+            stats.cache_misses,
+            stats.template_time * 1000,
+            stats.total_time * 1000,
+            extra={"blog_stats": stats.as_dict()},
+        )
+
+
+def get_stats_sink():
+    """
+    Return the configured stats sink, or ``None`` when it's disabled.
+    """
+    global _stats_sink
+    if _stats_sink is None and appsettings.FLUENT_BLOGS_STATS_SINK:
+        _stats_sink = import_string(appsettings.FLUENT_BLOGS_STATS_SINK)()
+    return _stats_sink
+
+
+@contextmanager
+def collect_stats(view_name, request=None):
+    """
+    Collect the statistics of the code that runs in this context.
+    """
+    stats = BlogStats(view_name)
+    token = _current_stats.set(stats)
+    start = perf_counter()
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats))
+            yield stats
+    finally:
+        stats.total_time = perf_counter() - start
+        _current_stats.reset(token)
+
+    view_stats_recorded.send(sender=BlogStats, stats=stats, request=request)
+    sink = get_stats_sink()
+    if sink is not None:
+        sink.record(stats)
+
+
+def record_cache_hit():
+    """
+    Register a cache hit for the current request. This is called by the caches of this app.
+    """
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.cache_hits += 1
+
+
+def record_cache_miss():
+    """
+    Register a cache miss for the current request. This is called by the caches of this app.
+    """
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.cache_misses += 1
+
+
+def instrument_view(view_func, view_name=None):
+    """
+    Wrap a view function to record the statistics when instrumentation is enabled.
+    Without a *view_name*, the URL pattern name is used.
+    """
+
+    @wraps(view_func)
+    def _instrumented_view(request, *args, **kwargs):
+        if not appsettings.FLUENT_BLOGS_INSTRUMENTATION:
+            return view_func(request, *args, **kwargs)
+
+        name = view_name
+        if not name:
+            resolver_match = getattr(request, "resolver_match", None)
+            name = getattr(resolver_match, "url_name", None) or view_func.__name__
+
+        with collect_stats(name, request=request) as stats:
+            response = view_func(request, *args, **kwargs)
+            if isinstance(response, SimpleTemplateResponse) and not response.is_rendered:
+                # Render here, so the queries of the template are counted too.
+                start = perf_counter()
+                response.render()
+                stats.template_time = perf_counter() - start
+
+        if appsettings.FLUENT_BLOGS_SERVER_TIMING:
+            response["Server-Timing"] = stats.get_server_timing()
+        return response
+
+    return _instrumented_view
+
+
+class InstrumentedSitemapMixin:
+    """
+    Record the statistics of generating the sitemap URLs.
+    """
+
+    #: The name to report in the statistics.
+    stats_name = None
+
+    def get_urls(self, *args, **kwargs):
+        if not appsettings.FLUENT_BLOGS_INSTRUMENTATION:
+            return super().get_urls(*args, **kwargs)
+
+        with collect_stats(self.stats_name or self.__class__.__name__):
+            return super().get_urls(*args, **kwargs)
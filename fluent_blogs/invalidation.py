@@ -0,0 +1,399 @@
+"""
+Cache invalidation of the blog.
+
+All changes to the blog content are collected by the signal handlers in this module:
+the entries, their translations, categories, tags, authors, contents and the blog pages.
+The changes are merged into a single :class:`Invalidation` per transaction,
+which is sent with the :data:`~fluent_blogs.signals.cache_invalidated` signal after the transaction is committed.
+The generations of the versioned cache keys in :mod:`fluent_blogs.cache` are increased by this signal.
+
+Caches can subscribe to these changes using::
+
+    from fluent_blogs.invalidation import subscribe
+
+    @subscribe
+    def clear_my_cache(invalidation, **kwargs):
+        for site_id in invalidation.site_ids:
+            ...
+"""
+import weakref
+from contextlib import contextmanager
+
+from asgiref.local import Local
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+
+from fluent_blogs.cache import bump_generations
+from fluent_blogs.models import get_entry_model
+from fluent_blogs.signals import cache_invalidated, entries_changed
+
+__all__ = (
+    "Invalidation",
+    "invalidate",
+    "invalidate_entries",
+    "subscribe",
+    "connect_signals",
+)
+
+
+class Invalidation:
+    """
+    The parts of the blog that changed.
+    Each attribute is a set of the affected objects.
+    The :attr:`months` contains ``(site_id, year, month)`` tuples.
+    The :attr:`language_codes` contains the languages of changed translations and contents,
+    changes in the shared fields of an entry affect all languages.
+    """
+
+    fields = (
+        "entry_ids",
+        "site_ids",
+        "language_codes",
+        "months",
+        "category_ids",
+        "tag_ids",
+        "author_ids",
+        "page_ids",
+    )
+
+    def __init__(self, **values):
+        for name in self.fields:
+            setattr(self, name, set(values.get(name, ())))
+        self._unresolved_entry_ids = set()
+
+    def __bool__(self):
+        return any(getattr(self, name) for name in self.fields) or bool(self._unresolved_entry_ids)
+
+    def __repr__(self):
+        values = ", ".join(
+            f"{name}={sorted(getattr(self, name))!r}"
+            for name in self.fields
+            if getattr(self, name)
+        )
+        return f"<Invalidation: {values}>"
+
+    def update(self, other):
+        for name in self.fields:
+            getattr(self, name).update(getattr(other, name))
+        self._unresolved_entry_ids.update(other._unresolved_entry_ids)
+
+    def add_entry(self, entry_id, site_id, publication_date=None, author_id=None):
+        """
+        Add the state of an entry.
+        """
+        self.entry_ids.add(entry_id)
+        self.site_ids.add(site_id)
+        if publication_date is not None:
+            self.months.add((site_id, publication_date.year, publication_date.month))
+        if author_id is not None:
+            self.author_ids.add(author_id)
+
+    def resolve(self):
+        """
+        Read the current state of the entries that were marked as changed.
+        This happens once per transaction, so all changed entries are fetched in a few queries.
+        """
+        entry_ids = self._unresolved_entry_ids
+        if not entry_ids:
+            return
+        self._unresolved_entry_ids = set()
+        self.entry_ids.update(entry_ids)
+
+        EntryModel = get_entry_model()
+        for values in EntryModel._base_manager.filter(pk__in=entry_ids).values(
+            "pk", "parent_site_id", "publication_date", "author_id"
+        ):
+            self.add_entry(
+                values["pk"],
+                values["parent_site_id"],
+                values["publication_date"],
+                values["author_id"],
+            )
+        self.category_ids.update(_get_entry_categories(entry_ids))
+        self.tag_ids.update(_get_entry_tags(entry_ids))
+
+
+def _get_entry_categories(entry_ids):
+    field = _get_m2m_field(get_entry_model(), "categories")
+    if field is None:
+        return ()
+    through = field.remote_field.through
+    return through.objects.filter(**{f"{field.m2m_field_name()}__in": entry_ids}).values_list(
+        field.m2m_reverse_name(), flat=True
+    )
+
+
+def _get_entry_tags(entry_ids):
+    EntryModel = get_entry_model()
+    if "taggit" not in settings.INSTALLED_APPS or getattr(EntryModel, "tags", None) is None:
+        return ()
+    through = EntryModel.tags.through
+    return through.objects.filter(
+        content_type=ContentType.objects.get_for_model(EntryModel), object_id__in=entry_ids
+    ).values_list("tag_id", flat=True)
+
+
+def _get_m2m_field(model, name):
+    for field in model._meta.many_to_many:
+        if field.name == name:
+            return field
+    return None
+
+
+class _PendingInvalidation:
+    """
+    The on-commit callback that sends the collected changes of a transaction.
+    When the transaction is rolled back, Django discards this callback together with its data.
+    """
+
+    def __init__(self):
+        self.invalidation = Invalidation()
+        self.is_sent = False
+
+    def __call__(self):
+        self.is_sent = True
+        _send(self.invalidation)
+
+
+# The pending callback of each database connection, as weak reference.
+# Connections are local to the thread or async context, and so is this holder.
+_holder = Local()
+
+
+@contextmanager
+def _pending(using=None):
+    """
+    Collect changes in the invalidation of the current transaction.
+    Outside a transaction, the changes are sent directly.
+    """
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        invalidation = Invalidation()
+        yield invalidation
+        _send(invalidation)
+        return
+
+    # Reuse the callback that was registered earlier in this transaction.
+    # When the transaction or the savepoint of that callback was rolled back,
+    # Django dropped the callback, so the weak reference no longer resolves.
+    # A callback of an outer block may collect changes that are rolled back later, which only invalidates too much.
+    pending_refs = getattr(_holder, "pending", None)
+    if pending_refs is None:
+        pending_refs = _holder.pending = {}
+    ref = pending_refs.get(connection.alias)
+    callback = ref() if ref is not None else None
+    if callback is None or callback.is_sent:
+        callback = _PendingInvalidation()
+        pending_refs[connection.alias] = weakref.ref(callback)
+        transaction.on_commit(callback, using=connection.alias)
+    yield callback.invalidation
+
+
+def _send(invalidation):
+    if invalidation:
+        invalidation.resolve()
+        cache_invalidated.send(sender=Invalidation, invalidation=invalidation)
+
+
+def invalidate(using=None, **values):
+    """
+    Mark parts of the blog as changed, e.g. ``invalidate(category_ids=[1])``.
+    The keyword arguments are the attributes of :class:`Invalidation`.
+    The changes are sent when the current transaction is committed.
+    """
+    with _pending(using) as pending:
+        pending.update(Invalidation(**values))
+
+
+def invalidate_entries(entry_ids, language_codes=(), using=None):
+    """
+    Mark entries as changed. Their site, month, author, categories and tags are looked up afterwards.
+    """
+    with _pending(using) as pending:
+        pending._unresolved_entry_ids.update(entry_ids)
+        pending.language_codes.update(language_codes)
+
+
+def subscribe(func):
+    """
+    Register a function that is called with the ``invalidation`` argument when the blog content changed.
+    This can be used as decorator.
+    The function is registered by its import path, so subscribing it again doesn't call it twice.
+    """
+    cache_invalidated.connect(
+        func,
+        sender=Invalidation,
+        weak=False,
+        dispatch_uid=f"{func.__module__}.{func.__qualname__}",
+    )
+    return func
+
+
+# ---- signal handlers
+
+
+def _on_entry_pre_save(sender, instance, raw=False, using=None, **kwargs):
+    if raw or instance.pk is None:
+        return
+
+    # Also invalidate the old month and author when they are changed.
+    old = (
+        sender._base_manager.using(using)
+        .filter(pk=instance.pk)
+        .values("parent_site_id", "publication_date", "author_id")
+        .first()
+    )
+    if old is not None:
+        with _pending(using) as pending:
+            pending.add_entry(
+                instance.pk, old["parent_site_id"], old["publication_date"], old["author_id"]
+            )
+
+
+def _on_entry_saved(sender, instance, raw=False, using=None, **kwargs):
+    if not raw:
+        invalidate_entries([instance.pk], using=using)
+
+
+def _on_entry_deleted(sender, instance, using=None, **kwargs):
+    # Read the relations before they are removed.
+    with _pending(using) as pending:
+        pending.add_entry(
+            instance.pk, instance.parent_site_id, instance.publication_date, instance.author_id
+        )
+        pending.category_ids.update(_get_entry_categories([instance.pk]))
+        pending.tag_ids.update(_get_entry_tags([instance.pk]))
+
+
+def _on_translation_changed(sender, instance, raw=False, using=None, **kwargs):
+    if not raw:
+        invalidate_entries([instance.master_id], [instance.language_code], using=using)
+
+
+def _on_entry_m2m_changed(sender, instance, action, reverse, model, pk_set, using=None, **kwargs):
+    EntryModel = get_entry_model()
+    categories_field = _get_m2m_field(EntryModel, "categories")
+    is_categories = (
+        categories_field is not None and sender is categories_field.remote_field.through
+    )
+    if action not in ("pre_clear", "post_add", "post_remove", "post_clear"):
+        return
+
+    if reverse:
+        # e.g. category.entry_set.add(...), the pk_set contains the entries.
+        if not is_categories:
+            return
+        if action == "pre_clear":
+            pk_set = sender.objects.filter(
+                **{categories_field.m2m_reverse_field_name(): instance.pk}
+            ).values_list(categories_field.m2m_field_name(), flat=True)
+        with _pending(using) as pending:
+            pending.category_ids.add(instance.pk)
+            pending._unresolved_entry_ids.update(pk_set or ())
+    else:
+        if not isinstance(instance, EntryModel):
+            return  # The tags are shared with other models.
+
+        if action == "pre_clear":
+            # The removed objects are not known after clearing.
+            related = instance.categories if is_categories else instance.tags
+            pk_set = related.values_list("pk", flat=True)
+        with _pending(using) as pending:
+            related_ids = pending.category_ids if is_categories else pending.tag_ids
+            related_ids.update(pk_set or ())
+            pending._unresolved_entry_ids.add(instance.pk)
+
+
+def _on_category_changed(sender, instance, raw=False, using=None, **kwargs):
+    if not raw:
+        invalidate(category_ids=[instance.pk], using=using)
+
+
+def _on_category_translation_changed(sender, instance, raw=False, using=None, **kwargs):
+    # Renaming a category only saves the translation, which changes the slugs and titles.
+    if not raw:
+        invalidate(category_ids=[instance.master_id], using=using)
+
+
+def _on_tag_changed(sender, instance, raw=False, using=None, **kwargs):
+    if not raw:
+        invalidate(tag_ids=[instance.pk], using=using)
+
+
+def _on_author_changed(sender, instance, raw=False, using=None, update_fields=None, **kwargs):
+    # Logging in only updates the last_login field.
+    if raw or (update_fields and set(update_fields) <= {"last_login"}):
+        return
+    invalidate(author_ids=[instance.pk], using=using)
+
+
+def _on_contentitem_changed(sender, instance, raw=False, using=None, **kwargs):
+    if raw:
+        return
+
+    # Only handle the contents of blog entries.
+    entry_ct = ContentType.objects.get_for_model(get_entry_model())
+    if instance.parent_type_id == entry_ct.pk and instance.parent_id is not None:
+        invalidate_entries([instance.parent_id], [instance.language_code], using=using)
+
+
+def _on_entries_changed(sender, entry_ids, **kwargs):
+    invalidate_entries(entry_ids)
+
+
+def _on_cache_invalidated(sender, invalidation, **kwargs):
+    # Let the versioned cache keys of the blog use new generations.
+    bump_generations(invalidation)
+
+
+def connect_signals():
+    """
+    Connect the signal handlers. This is called by the ``AppConfig.ready()`` method.
+    """
+    EntryModel = get_entry_model()
+    subscribe(_on_cache_invalidated)
+    pre_save.connect(_on_entry_pre_save, sender=EntryModel)
+    post_save.connect(_on_entry_saved, sender=EntryModel)
+    pre_delete.connect(_on_entry_deleted, sender=EntryModel)
+    entries_changed.connect(_on_entries_changed, sender=EntryModel)
+
+    if hasattr(EntryModel, "_parler_meta"):
+        translation_model = EntryModel._parler_meta.root_model
+        post_save.connect(_on_translation_changed, sender=translation_model)
+        post_delete.connect(_on_translation_changed, sender=translation_model)
+
+    categories_field = _get_m2m_field(EntryModel, "categories")
+    if categories_field is not None:
+        CategoryModel = categories_field.remote_field.model
+        m2m_changed.connect(_on_entry_m2m_changed, sender=categories_field.remote_field.through)
+        post_save.connect(_on_category_changed, sender=CategoryModel)
+        post_delete.connect(_on_category_changed, sender=CategoryModel)
+
+        if hasattr(CategoryModel, "_parler_meta"):
+            translation_model = CategoryModel._parler_meta.root_model
+            post_save.connect(_on_category_translation_changed, sender=translation_model)
+            post_delete.connect(_on_category_translation_changed, sender=translation_model)
+
+    if "taggit" in settings.INSTALLED_APPS and getattr(EntryModel, "tags", None) is not None:
+        from taggit.models import Tag
+
+        m2m_changed.connect(_on_entry_m2m_changed, sender=EntryModel.tags.through)
+        post_save.connect(_on_tag_changed, sender=Tag)
+        post_delete.connect(_on_tag_changed, sender=Tag)
+
+    User = get_user_model()
+    post_save.connect(_on_author_changed, sender=User)
+    post_delete.connect(_on_author_changed, sender=User)
+
+    if "fluent_contents" in settings.INSTALLED_APPS:
+        from fluent_contents.models import ContentItem
+
+        # The content items are polymorphic models, each plugin sends signals with its own model.
+        for model in apps.get_models():
+            if issubclass(model, ContentItem):
+                post_save.connect(_on_contentitem_changed, sender=model)
+                post_delete.connect(_on_contentitem_changed, sender=model)
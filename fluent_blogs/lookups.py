@@ -0,0 +1,120 @@
+"""
+Cached lookups of the URL slugs of categories, tags and authors.
+
+The archive pages and feeds of a category, tag or author find their object by the slug in the URL.
+Instead of searching the slug in the database for each request (which is a join with the translations
+for translated categories), a small snapshot of the object is stored in the cache for each slug.
+The object is rebuilt from this snapshot, so a cache hit doesn't need a database query.
+For authors, only the username and name are stored, so no e-mail addresses or passwords are kept
+in the shared cache. Other fields are deferred, and loaded from the database when they are read.
+The translations of categories are cached by django-parler itself.
+The cache keys are versioned, so they are refreshed after the categories, tags or authors changed.
+
+When the slug doesn't exist, this is also cached for a short time
+(``FLUENT_BLOGS_SLUG_NOT_FOUND_CACHE_TIMEOUT``), so requests for unknown URLs don't reach the database.
+"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router
+from django.utils.translation import get_language
+from parler.models import TranslatableModel
+
+from fluent_blogs import appsettings
+from fluent_blogs.cache import ALL_SITES, get_versioned_cache_key
+from fluent_blogs.models import get_category_model
+from fluent_blogs.models.query import get_category_for_slug
+from fluent_blogs.replicas import for_read, get_read_database
+
+__all__ = (
+    "lookup_category",
+    "lookup_tag",
+    "lookup_author",
+)
+
+_NOT_FOUND = "not_found"
+
+# The user fields which are displayed by the author archive and feeds.
+_AUTHOR_FIELDS = ("first_name", "last_name")
+
+
+def lookup_category(slug, language_code=None):
+    """
+    Find the category for a slug, like :func:`~fluent_blogs.models.query.get_category_for_slug` does.
+    This raises the ``DoesNotExist`` exception of the category model when the slug is not found.
+    """
+    Category = get_category_model()
+    if issubclass(Category, TranslatableModel):
+        # The slugs of the fallback language are also accepted, like active_translations() does.
+        language_code = language_code or get_language()
+        return _lookup(
+            Category,
+            "category",
+            slug,
+            get_object=lambda: get_category_for_slug(slug, language_code),
+            language_code=language_code,
+        )
+    else:
+        return _lookup(Category, "category", slug, get_object=lambda: get_category_for_slug(slug))
+
+
+def lookup_tag(slug):
+    """
+    Find the tag for a slug.
+    This raises :class:`Tag.DoesNotExist <taggit.models.Tag>` when the slug is not found.
+    """
+    from taggit.models import Tag  # django-taggit is optional, hence imported here.
+
+    return _lookup(Tag, "tag", slug, get_object=lambda: for_read(Tag.objects.all()).get(slug=slug))
+
+
+def lookup_author(username):
+    """
+    Find the author for a username.
+    This raises the ``DoesNotExist`` exception of the user model when the user is not found.
+    """
+    User = get_user_model()
+    return _lookup(
+        User,
+        "author",
+        username,
+        get_object=lambda: for_read(User.objects.all()).get(**{User.USERNAME_FIELD: username}),
+        field_names=(User._meta.pk.name, User.USERNAME_FIELD) + _AUTHOR_FIELDS,
+    )
+
+
+def _get_snapshot(obj, field_names=None):
+    # The values of the concrete fields, keyed by attname as Model.from_db() expects.
+    return {
+        field.attname: getattr(obj, field.attname)
+        for field in obj._meta.concrete_fields
+        if field_names is None or field.name in field_names
+    }
+
+
+def _from_snapshot(model, snapshot):
+    db = get_read_database() or router.db_for_read(model)
+    return model.from_db(db, list(snapshot), list(snapshot.values()))
+
+
+def _lookup(model, dimension, slug, get_object, language_code=None, field_names=None):
+    key = get_versioned_cache_key(
+        f"{dimension}_slug",
+        slug,
+        depends_on=[dimension],
+        site_id=ALL_SITES,
+        language_code=language_code,
+    )
+    snapshot = cache.get(key)
+    if snapshot == _NOT_FOUND:
+        raise model.DoesNotExist(f"No {model._meta.verbose_name} found for '{slug}'.")
+    elif snapshot is not None:
+        return _from_snapshot(model, snapshot)
+
+    try:
+        obj = get_object()
+    except model.DoesNotExist:
+        cache.set(key, _NOT_FOUND, appsettings.FLUENT_BLOGS_SLUG_NOT_FOUND_CACHE_TIMEOUT)
+        raise
+
+    cache.set(key, _get_snapshot(obj, field_names), appsettings.FLUENT_BLOGS_SLUG_CACHE_TIMEOUT)
+    return obj
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from fluent_blogs.cache import bump_generation
+
+
+class Command(BaseCommand):
+    """
+    Invalidate the cached blog content.
+
+    The cached data is not deleted, instead the generation numbers in the cache keys are increased.
+    Run this after a deployment that changes the templates or ``FLUENT_BLOGS_ENTRY_LINK_STYLE``.
+    """
+
+    help = "Invalidate all cached blog content, or the content of a single site, category, tag or author."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--site", type=int, help="Only invalidate the content of this site ID."
+        )
+        parser.add_argument("--category", type=int, help="Only invalidate this category ID.")
+        parser.add_argument("--tag", type=int, help="Only invalidate this tag ID.")
+        parser.add_argument("--author", type=int, help="Only invalidate this author ID.")
+
+    def handle(self, *args, **options):
+        bumped = False
+        if options["site"]:
+            bump_generation("site", site_id=options["site"])
+            bumped = True
+        for dimension in ("category", "tag", "author"):
+            if options[dimension]:
+                bump_generation(dimension, options[dimension])
+                bumped = True
+
+        if not bumped:
+            bump_generation("global")
+            if options["verbosity"] >= 1:
+                self.stdout.write("Invalidated all cached blog content.")
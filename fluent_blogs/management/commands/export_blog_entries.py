@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+
+from fluent_blogs.exporter import EntryExporter, write_jsonl
+from fluent_blogs.utils import parse_since_option
+
+
+class Command(BaseCommand):
+    """
+    Export all blog entries as JSON Lines.
+
+    The entries are streamed in chunks, so the memory usage stays constant.
+    Use ``--since`` for incremental exports.
+    """
+
+    help = "Export blog entries as JSON Lines, including translations, categories and tags."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "-o",
+            "--output",
+            help="The file to write to, by default the output is written to stdout.",
+        )
+        parser.add_argument(
+            "--since",
+            help="Only export entries modified after this date or datetime (ISO 8601 format).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="The number of entries to read in a single query.",
+        )
+        parser.add_argument(
+            "--no-contents", action="store_true", help="Don't render the entry contents."
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            since = parse_since_option(options["since"])
+
+        exporter = EntryExporter(
+            since=since,
+            batch_size=options["batch_size"],
+            include_contents=not options["no_contents"],
+        )
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as fileobj:
+                count = write_jsonl(exporter, fileobj)
+            self.stderr.write(f"Exported {count} entries.")
+        else:
+            write_jsonl(exporter, self.stdout)
@@ -0,0 +1,80 @@
+import sys
+
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+
+from fluent_blogs.importer import EntryImporter, read_csv, read_jsonl
+
+_READERS = {
+    "jsonl": read_jsonl,
+    "csv": read_csv,
+}
+
+
+class Command(BaseCommand):
+    """
+    Import blog entries from a JSON Lines or CSV file.
+
+    The file is read as a stream, and written in batches.
+    Use ``--resume`` to continue an import that was interrupted;
+    entries that already exist will be skipped.
+    """
+
+    help = "Import blog entries from a JSON Lines or CSV file."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("filename", help="The file to import, use '-' for stdin.")
+        parser.add_argument(
+            "--format",
+            choices=sorted(_READERS),
+            help="The file format, by default detected from the file extension.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="The number of entries to write in a single batch.",
+        )
+        parser.add_argument("--site", type=int, help="The site ID to import the entries in.")
+        parser.add_argument(
+            "--language", help="The language of rows that don't define a 'language_code'."
+        )
+        parser.add_argument(
+            "--resume", action="store_true", help="Skip entries that were already imported."
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+        filename = options["filename"]
+        format = options["format"]
+        if not format:
+            format = "csv" if filename.lower().endswith(".csv") else "jsonl"
+
+        site = None
+        if options["site"]:
+            try:
+                site = Site.objects.get(pk=options["site"])
+            except Site.DoesNotExist:
+                raise CommandError(f"Site {options['site']} does not exist")
+
+        importer = EntryImporter(
+            site=site,
+            language_code=options["language"],
+            batch_size=options["batch_size"],
+            resume=options["resume"],
+        )
+
+        if filename == "-":
+            result = importer.run(_READERS[format](sys.stdin), progress=self._progress)
+        else:
+            with open(filename, encoding="utf-8", newline="") as fileobj:
+                result = importer.run(_READERS[format](fileobj), progress=self._progress)
+
+        for warning in result.warnings:
+            self.stderr.write(f"Warning: {warning}")
+        self.stdout.write(f"Imported {result.created} entries, skipped {result.skipped}.")
+
+    def _progress(self, result):
+        if self.verbosity >= 2:
+            self.stdout.write(f"* {result.created} entries imported...")
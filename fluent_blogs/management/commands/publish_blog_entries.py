@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from fluent_blogs.scheduler import run_schedule
+from fluent_blogs.utils import parse_since_option
+
+
+class Command(BaseCommand):
+    """
+    Process the scheduled publication of blog entries.
+
+    This sends the ``entry_published`` and ``entry_expired`` signals for all entries
+    which crossed their publication window since the previous run.
+    Run it from cron, or use ``--interval`` to keep it running.
+    """
+
+    help = "Send the signals for entries that went live or expired since the previous run."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--since",
+            help="Process the entries since this date or datetime (ISO 8601 format),"
+            " instead of the time of the previous run.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Keep running, and check the schedule every given number of seconds.",
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            since = parse_since_option(options["since"])
+
+        while True:
+            result = run_schedule(since=since)
+            if options["verbosity"] >= 1 and (
+                result.published or result.expired or not options["interval"]
+            ):
+                self.stdout.write(
+                    f"Published {len(result.published)} entries, expired {len(result.expired)} entries."
+                )
+
+            if not options["interval"]:
+                break
+
+            since = None  # continue from the previous run.
+            time.sleep(options["interval"])
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from fluent_blogs.counts import rebuild_counts
+
+
+class Command(BaseCommand):
+    """
+    Recalculate the number of published entries per category and tag.
+
+    The counters are updated automatically when the blog content changes.
+    Run this after changing the ``FLUENT_BLOGS_LANGUAGES`` setting, or after bulk updates
+    which didn't send the ``entries_changed`` signal.
+    """
+
+    help = "Recalculate the number of published entries per category and tag."
+
+    def handle(self, *args, **options):
+        rebuild_counts()
+        if options["verbosity"] >= 1:
+            self.stdout.write("Updated the entry counts.")
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from fluent_blogs.permalinks import rebuild_permalinks
+
+
+class Command(BaseCommand):
+    """
+    Add the current permalinks of all entries to the permalink index.
+
+    The index is updated automatically when entries are saved.
+    Run this after installing the index, or after changing ``FLUENT_BLOGS_ENTRY_LINK_STYLE``.
+    The previous permalinks are kept, so the old URLs redirect to the new ones.
+    """
+
+    help = "Add the current permalinks of all entries to the permalink index."
+
+    def handle(self, *args, **options):
+        rebuild_permalinks()
+        if options["verbosity"] >= 1:
+            self.stdout.write("Updated the entry permalinks.")
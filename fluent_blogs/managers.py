@@ -1,15 +1,17 @@
 """
 The manager class for the CMS models
 """
-from django.conf import settings
 from django.db import models
-from django.db.models.query import QuerySet
+from django.db.models.query import ModelIterable, QuerySet
 from django.db.models.query_utils import Q
 from django.utils.timezone import now
+from parler.cache import MISSING
 from parler.managers import TranslatableManager, TranslatableQuerySet
 from parler.models import TranslatableModel
 
 from fluent_blogs import appsettings
+from fluent_blogs.replicas import for_read
+from fluent_blogs.sites import get_current_site_id
 
 
 class EntryQuerySet(QuerySet):
@@ -26,26 +28,33 @@ class EntryQuerySet(QuerySet):
     def published(self, for_user=None, include_hidden=False):
         """
         Return only published entries for the current site.
+        These are read from the ``FLUENT_BLOGS_READ_DATABASE`` when it's configured.
         """
         if appsettings.FLUENT_BLOGS_FILTER_SITE_ID:
-            qs = self.parent_site(settings.SITE_ID)
+            qs = self.parent_site(get_current_site_id())
         else:
             qs = self
 
         if for_user is not None and for_user.is_staff:
+            # Staff previews read from the primary database, to see their latest changes.
             return qs
 
+        qs = for_read(qs)
+        return qs.filter(self._get_published_filter(include_hidden=include_hidden))
+
+    def _get_published_filter(self, include_hidden=False):
+        # The status and publication window, without the site filter.
         if include_hidden:
             filters = Q(status__in=(self.model.PUBLISHED, self.model.HIDDEN))
         else:
             filters = Q(status=self.model.PUBLISHED)
 
-        filters &= (Q(publication_date__isnull=True) | Q(publication_date__lte=now())) & (
-            Q(publication_date__isnull=True) | Q(publication_date__lte=now())
+        date = now()
+        return filters & (
+            (Q(publication_date__isnull=True) | Q(publication_date__lte=date))
+            & (Q(publication_end_date__isnull=True) | Q(publication_end_date__gt=date))
         )
 
-        return qs.filter(filters)
-
     def authors(self, *usernames):
         """
         Return the entries written by the given usernames
@@ -98,6 +107,13 @@ class EntryQuerySet(QuerySet):
         else:
             return self.filter(tags__slug__in=tag_slugs).distinct()
 
+    def fetch_translations(self, language_code=None):
+        """
+        Load the translations of the active language and its fallbacks in a single query.
+        This is a no-op for models without translations.
+        """
+        return self
+
     def _get_active_rel_languages(self):
         return ()
 
@@ -106,12 +122,54 @@ class TranslatableEntryQuerySet(TranslatableQuerySet, EntryQuerySet):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._rel_language_codes = None
+        self._fetch_language_codes = None
 
     def _clone(self, *args, **kw):
-        c = super(TranslatableQuerySet, self)._clone(*args, **kw)
+        c = super()._clone(*args, **kw)
         c._rel_language_codes = self._rel_language_codes
+        c._fetch_language_codes = self._fetch_language_codes
         return c
 
+    def fetch_translations(self, language_code=None):
+        """
+        Load the translations of the active language and its fallbacks in a single query.
+        The translations are stored in the translation cache of each object,
+        so reading ``entry.title`` or ``entry.url`` doesn't perform a query per object.
+        """
+        c = self._clone()
+        c._fetch_language_codes = appsettings.FLUENT_BLOGS_LANGUAGES.get_active_choices(
+            language_code
+        )
+        return c
+
+    def _fetch_all(self):
+        is_fetched = self._result_cache is not None
+        super()._fetch_all()
+        if not is_fetched and self._fetch_language_codes and self._iterable_class is ModelIterable:
+            self._fetch_translation_objects(self._result_cache, self._fetch_language_codes)
+
+    def _fetch_translation_objects(self, objects, language_codes):
+        objects = [obj for obj in objects if obj.pk is not None]
+        if not objects:
+            return
+
+        translated_model = self.model._parler_meta.root_model
+        master_field = translated_model._meta.get_field("master")
+        found = {}
+        for translation in translated_model.objects.using(self.db).filter(
+            master_id__in={obj.pk for obj in objects}, language_code__in=language_codes
+        ):
+            found[(translation.master_id, translation.language_code)] = translation
+
+        for obj in objects:
+            local_cache = obj._translations_cache[translated_model]
+            for language_code in language_codes:
+                # Also store which languages don't exist, so the fallback is used without querying.
+                translation = found.get((obj.pk, language_code), MISSING)
+                if translation is not MISSING:
+                    master_field.set_cached_value(translation, obj)
+                local_cache.setdefault(language_code, translation)
+
     def active_translations(self, language_code=None, **translated_fields):
         # overwritten to honor our settings instead of the django-parler defaults
         language_codes = appsettings.FLUENT_BLOGS_LANGUAGES.get_active_choices(language_code)
@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("fluent_blogs", "0003_author_on_delete_set_null"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="entry",
+            index=models.Index(
+                fields=["parent_site", "status", "publication_date"],
+                name="fluent_blogs_entry_site_pub",
+            ),
+        ),
+    ]
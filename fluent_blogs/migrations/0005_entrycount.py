@@ -0,0 +1,54 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sites", "0001_initial"),
+        ("fluent_blogs", "0004_entry_site_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EntryCount",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "relation",
+                    models.CharField(
+                        choices=[("category", "Category"), ("tag", "Tag")],
+                        max_length=10,
+                        verbose_name="relation",
+                    ),
+                ),
+                ("object_id", models.PositiveIntegerField(verbose_name="object ID")),
+                (
+                    "language_code",
+                    models.CharField(blank=True, max_length=15, verbose_name="language"),
+                ),
+                ("count", models.PositiveIntegerField(default=0, verbose_name="count")),
+                (
+                    "parent_site",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="sites.site"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Entry count",
+                "verbose_name_plural": "Entry counts",
+                "unique_together": {("relation", "object_id", "parent_site", "language_code")},
+                "indexes": [
+                    models.Index(
+                        fields=["parent_site", "language_code", "relation"],
+                        name="fluent_blogs_count_site_lang",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sites", "0001_initial"),
+        ("fluent_blogs", "0005_entrycount"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EntryPermalink",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(blank=True, max_length=15, verbose_name="language"),
+                ),
+                ("path", models.CharField(max_length=300, verbose_name="path")),
+                (
+                    "entry_id",
+                    models.PositiveIntegerField(db_index=True, verbose_name="entry ID"),
+                ),
+                ("is_current", models.BooleanField(default=True, verbose_name="is current")),
+                (
+                    "parent_site",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="sites.site"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Entry permalink",
+                "verbose_name_plural": "Entry permalinks",
+                "unique_together": {("parent_site", "language_code", "path")},
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("fluent_blogs", "0006_entrypermalink"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScheduleRun",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("last_run", models.DateTimeField(verbose_name="last run")),
+            ],
+            options={
+                "verbose_name": "Schedule run",
+                "verbose_name_plural": "Schedule runs",
+            },
+        ),
+    ]
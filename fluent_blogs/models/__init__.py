@@ -1,12 +1,23 @@
 from ..base_models import AbstractEntry, AbstractTranslatableEntry, AbstractTranslatedFieldsEntry
 from ..managers import EntryManager, TranslatableEntryManager  # noqa, old import paths
-from .db import Entry, Entry_Translation, get_category_model, get_entry_model
+from .db import (
+    Entry,
+    Entry_Translation,
+    EntryCount,
+    EntryPermalink,
+    ScheduleRun,
+    get_category_model,
+    get_entry_model,
+)
 from .query import get_category_for_slug
 
 __all__ = (
     # Default translated models.
     "Entry",
     "Entry_Translation",
+    "EntryCount",
+    "EntryPermalink",
+    "ScheduleRun",
     # Default base models for classic and translated models.
     "AbstractEntry",
     "AbstractTranslatableEntry",
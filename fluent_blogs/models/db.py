@@ -1,5 +1,5 @@
 from django.apps import apps
-from django.conf import settings
+from django.contrib.sites.models import Site
 from django.core.exceptions import ImproperlyConfigured
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -8,7 +8,6 @@ from fluent_blogs import appsettings
 from fluent_blogs.base_models import (
     AbstractTranslatableEntry,
     AbstractTranslatedFieldsEntry,
-    CommentsEntryMixin,
 )
 
 
@@ -26,6 +25,13 @@ class Entry(AbstractTranslatableEntry):
     class Meta:
         app_label = "fluent_blogs"  # required for models subfolder
         ordering = ("-publication_date",)  # This is not inherited
+        indexes = [
+            # Entries are always filtered by site first, see EntryQuerySet.published()
+            models.Index(
+                fields=["parent_site", "status", "publication_date"],
+                name="fluent_blogs_entry_site_pub",
+            ),
+        ]
         verbose_name = _("Blog entry")
         verbose_name_plural = _("Blog entries")
 
@@ -46,6 +52,88 @@ class Entry_Translation(AbstractTranslatedFieldsEntry):
         verbose_name_plural = _("Blog entry translations")
 
 
+class EntryCount(models.Model):
+    """
+    The number of published entries of a category or tag, per site and language.
+
+    The entries of a language include the entries that are displayed in its fallback language.
+    These counters are maintained by :mod:`fluent_blogs.counts`, and can be rebuild
+    with ``manage.py rebuild_blog_counts``.
+    """
+
+    CATEGORY = "category"
+    TAG = "tag"
+    RELATION_CHOICES = (
+        (CATEGORY, _("Category")),
+        (TAG, _("Tag")),
+    )
+
+    relation = models.CharField(_("relation"), max_length=10, choices=RELATION_CHOICES)
+    object_id = models.PositiveIntegerField(_("object ID"))
+    parent_site = models.ForeignKey(Site, on_delete=models.CASCADE)
+    language_code = models.CharField(_("language"), max_length=15, blank=True)
+    count = models.PositiveIntegerField(_("count"), default=0)
+
+    class Meta:
+        app_label = "fluent_blogs"
+        unique_together = (("relation", "object_id", "parent_site", "language_code"),)
+        indexes = [
+            models.Index(
+                fields=["parent_site", "language_code", "relation"],
+                name="fluent_blogs_count_site_lang",
+            ),
+        ]
+        verbose_name = _("Entry count")
+        verbose_name_plural = _("Entry counts")
+
+    def __str__(self):
+        return f"{self.relation} #{self.object_id}: {self.count}"
+
+
+class EntryPermalink(models.Model):
+    """
+    The permalink paths of the entries, per site and language.
+
+    The detail view resolves the entry with a single lookup in this table.
+    Previous paths are kept after the slug or publication date changes, to redirect to the current URL.
+    This table is maintained by :mod:`fluent_blogs.permalinks`.
+    """
+
+    parent_site = models.ForeignKey(Site, on_delete=models.CASCADE)
+    language_code = models.CharField(_("language"), max_length=15, blank=True)
+    path = models.CharField(_("path"), max_length=300)
+    entry_id = models.PositiveIntegerField(_("entry ID"), db_index=True)
+    is_current = models.BooleanField(_("is current"), default=True)
+
+    class Meta:
+        app_label = "fluent_blogs"
+        unique_together = (("parent_site", "language_code", "path"),)
+        verbose_name = _("Entry permalink")
+        verbose_name_plural = _("Entry permalinks")
+
+    def __str__(self):
+        return self.path
+
+
+class ScheduleRun(models.Model):
+    """
+    The time of the previous run of :func:`~fluent_blogs.scheduler.run_schedule`.
+
+    This is stored in the database, so the next run continues where the previous run stopped,
+    even when each run is a new (cron) process or the cache is cleared.
+    """
+
+    last_run = models.DateTimeField(_("last run"))
+
+    class Meta:
+        app_label = "fluent_blogs"
+        verbose_name = _("Schedule run")
+        verbose_name_plural = _("Schedule runs")
+
+    def __str__(self):
+        return str(self.last_run)
+
+
 _EntryModel = None
 
 
@@ -55,13 +143,13 @@ def get_entry_model():
 
     This function reads the :ref:`FLUENT_BLOGS_ENTRY_MODEL` setting to find the model.
     The model is automatically registered with *django-fluent-comments*
-    and *django-any-urlfield* when it's installed.
+    and *django-any-urlfield* when it's installed, see :class:`~fluent_blogs.apps.FluentBlogsConfig`.
     """
     global _EntryModel
 
     if _EntryModel is None:
-        # This method is likely called the first time when the admin initializes, the sitemaps module is imported, or BaseBlogMixin is used.
-        # Either way, it needs to happen after all apps have initialized, to make sure the model can be imported.
+        # This method is called the first time in AppConfig.ready(),
+        # after all apps have initialized, to make sure the model can be imported.
         if not appsettings.FLUENT_BLOGS_ENTRY_MODEL:
             _EntryModel = Entry
         else:
@@ -71,25 +159,6 @@ def get_entry_model():
             if _EntryModel is None:
                 raise ImportError(f"{app_label}.{model_name} could not be imported.")
 
-        # Auto-register with django-fluent-comments moderation
-        if "fluent_comments" in settings.INSTALLED_APPS and issubclass(
-            _EntryModel, CommentsEntryMixin
-        ):
-            from fluent_comments.moderation import moderate_model
-
-            moderate_model(
-                _EntryModel,
-                publication_date_field="publication_date",
-                enable_comments_field="enable_comments",
-            )
-
-        # Auto-register with django-any-urlfield
-        if "any_urlfield" in settings.INSTALLED_APPS:
-            from any_urlfield.forms.widgets import SimpleRawIdWidget
-            from any_urlfield.models import AnyUrlField
-
-            AnyUrlField.register_model(_EntryModel, widget=SimpleRawIdWidget(_EntryModel))
-
     return _EntryModel
 
 
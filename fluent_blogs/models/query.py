@@ -5,19 +5,18 @@ from calendar import monthrange
 from datetime import datetime, timedelta
 
 import django
-from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.contrib.contenttypes.models import ContentType
-from django.db.models.aggregates import Count
 from django.utils.timezone import get_current_timezone
 from parler.models import TranslatableModel
 
 from fluent_blogs import appsettings
 from fluent_blogs.models.db import get_category_model, get_entry_model
-
+from fluent_blogs.replicas import for_read
+from fluent_blogs.sites import get_current_site_id
 
 __all__ = (
     "query_entries",
+    "query_categories",
     "query_tags",
 )
 
@@ -36,6 +35,12 @@ ENTRY_ORDER_BY_FIELDS = {
 }
 
 
+CATEGORY_ORDER_BY_FIELDS = {
+    "slug": ("slug",),
+    "title": ("title",),
+    "count": ("count",),
+}
+
 TAG_ORDER_BY_FIELDS = {
     "slug": ("slug",),
     "name": ("name",),
@@ -102,7 +107,7 @@ def query_entries(
         queryset = get_entry_model().objects.all()
 
     if appsettings.FLUENT_BLOGS_FILTER_SITE_ID:
-        queryset = queryset.parent_site(settings.SITE_ID)
+        queryset = queryset.parent_site(get_current_site_id())
 
     if not future:
         queryset = queryset.published()
@@ -158,27 +163,43 @@ def query_entries(
     return queryset
 
 
+def query_categories(order=None, orderby=None, limit=None):
+    """
+    Query the categories that have published entries, with the entry count included.
+    This interface is mainly used by the ``get_categories`` template tag.
+    """
+    from fluent_blogs.counts import with_entry_counts
+
+    Category = get_category_model()
+    queryset = with_entry_counts(for_read(Category.objects.all()), "category")
+
+    # Ordering
+    if orderby:
+        order_by = list(_get_order_by(order, orderby, CATEGORY_ORDER_BY_FIELDS))
+        if orderby in ("slug", "title") and issubclass(Category, TranslatableModel):
+            # Sort on the fields of the current language
+            queryset = queryset.translated()
+            order_by = [name.replace(orderby, f"translations__{orderby}") for name in order_by]
+        queryset = queryset.order_by(*order_by)
+
+    # Limit
+    if limit:
+        queryset = queryset[:limit]
+
+    return queryset
+
+
 def query_tags(order=None, orderby=None, limit=None):
     """
     Query the tags, with usage count included.
     This interface is mainly used by the ``get_tags`` template tag.
     """
-    from taggit.models import Tag, TaggedItem  # feature is still optional
-
-    # Get queryset filters for published entries
-    EntryModel = get_entry_model()
-    ct = ContentType.objects.get_for_model(EntryModel)  # take advantage of local caching.
-
-    entry_filter = {"status": EntryModel.PUBLISHED}
-    if appsettings.FLUENT_BLOGS_FILTER_SITE_ID:
-        entry_filter["parent_site"] = settings.SITE_ID
+    from taggit.models import Tag  # feature is still optional
 
-    entry_qs = EntryModel.objects.filter(**entry_filter).values_list("pk")
+    from fluent_blogs.counts import with_entry_counts
 
-    # get tags
-    queryset = Tag.objects.filter(
-        taggit_taggeditem_items__content_type=ct, taggit_taggeditem_items__object_id__in=entry_qs
-    ).annotate(count=Count("taggit_taggeditem_items"))
+    # The counts of published entries are maintained by fluent_blogs.counts
+    queryset = with_entry_counts(for_read(Tag.objects.all()), "tag")
 
     # Ordering
     if orderby:
@@ -199,9 +220,9 @@ def get_category_for_slug(slug, language_code=None):
     """
     Category = get_category_model()
     if issubclass(Category, TranslatableModel):
-        return Category.objects.active_translations(language_code, slug=slug).get()
+        return for_read(Category.objects.active_translations(language_code, slug=slug)).get()
     else:
-        return Category.objects.get(slug=slug)
+        return for_read(Category.objects.all()).get(slug=slug)
 
 
 def get_date_range(year=None, month=None, day=None):
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
 from fluent_pages.integration.fluent_contents.admin import FluentContentsPageAdmin
 
 from .models import BlogPage
@@ -11,3 +12,20 @@ class BlogPageAdmin(FluentContentsPageAdmin):
     """
 
     placeholder_layout_template = "fluent_blogs/entry_archive_index.html"
+
+    FIELDSET_ENTRIES = (
+        _("Entries"),
+        {
+            "fields": ("categories", "authors", "tag_slugs"),
+            "classes": ("collapse",),
+        },
+    )
+
+    base_fieldsets = (
+        FluentContentsPageAdmin.FIELDSET_GENERAL,
+        FluentContentsPageAdmin.FIELDSET_SEO,
+        FIELDSET_ENTRIES,
+        FluentContentsPageAdmin.FIELDSET_MENU,
+        FluentContentsPageAdmin.FIELDSET_PUBLICATION,
+    )
+    filter_horizontal = ("categories", "authors")
@@ -0,0 +1,145 @@
+from django.apps import AppConfig
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+from fluent_blogs.signals import entries_changed
+
+
+class BlogPageConfig(AppConfig):
+    name = "fluent_blogs.pagetypes.blogpage"
+    label = "blogpage"
+    default_auto_field = "django.db.models.AutoField"
+
+    def ready(self):
+        # Keep the entries of filtered blog pages up to date.
+        from fluent_blogs.models import get_entry_model
+
+        from .models import BlogPage
+
+        EntryModel = get_entry_model()
+        post_save.connect(_on_entry_saved, sender=EntryModel)
+        post_delete.connect(_on_entry_deleted, sender=EntryModel)
+        entries_changed.connect(_on_entries_changed, sender=EntryModel)
+        if hasattr(EntryModel, "categories"):
+            m2m_changed.connect(_on_entry_m2m_changed, sender=EntryModel.categories.through)
+        if "taggit" in settings.INSTALLED_APPS and getattr(EntryModel, "tags", None) is not None:
+            # The TaggedItem model is shared by all models, so the handler checks the instance.
+            m2m_changed.connect(_on_entry_m2m_changed, sender=EntryModel.tags.through)
+
+        post_save.connect(_on_page_saved, sender=BlogPage)
+        m2m_changed.connect(_on_page_m2m_changed, sender=BlogPage.categories.through)
+        m2m_changed.connect(_on_page_m2m_changed, sender=BlogPage.authors.through)
+
+        # Deleting a category, author or tag removes the M2M rows without sending m2m_changed.
+        # The pages that filter on the deleted object are rebuilt afterwards.
+        related_models = [BlogPage.categories.field.remote_field.model, get_user_model()]
+        if "taggit" in settings.INSTALLED_APPS:
+            from taggit.models import Tag
+
+            related_models.append(Tag)
+        for model in related_models:
+            pre_delete.connect(_on_filter_object_pre_delete, sender=model)
+            post_delete.connect(_on_filter_object_deleted, sender=model)
+
+
+def _on_entry_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        from .membership import update_entry_pages
+
+        update_entry_pages([instance.pk])
+
+
+def _on_entry_deleted(sender, instance, **kwargs):
+    from .membership import delete_entry_pages
+
+    delete_entry_pages([instance.pk])
+
+
+def _on_entries_changed(sender, entry_ids, **kwargs):
+    from .membership import update_entry_pages
+
+    update_entry_pages(entry_ids)
+
+
+def _on_entry_m2m_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    from fluent_blogs.models import get_entry_model
+
+    from .membership import rebuild_all_page_entries, update_entry_pages
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        if isinstance(instance, get_entry_model()):
+            update_entry_pages([instance.pk])
+    elif pk_set:
+        # e.g. category.entry_set.add(...)
+        update_entry_pages(pk_set)
+    else:
+        # A reverse clear doesn't tell which entries were affected.
+        rebuild_all_page_entries()
+
+
+def _on_page_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        from fluent_blogs.invalidation import invalidate
+
+        from .membership import rebuild_page_entries
+
+        rebuild_page_entries(instance)
+        invalidate(page_ids=[instance.pk], site_ids=[instance.parent_site_id])
+
+
+def _on_page_m2m_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    from fluent_blogs.invalidation import invalidate
+
+    from .membership import rebuild_all_page_entries, rebuild_page_entries
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        rebuild_page_entries(instance)
+        invalidate(page_ids=[instance.pk], site_ids=[instance.parent_site_id])
+    else:
+        # The category or author was added to pages.
+        rebuild_all_page_entries()
+
+
+def _get_filtering_pages(instance):
+    from fluent_blogs.models import get_category_model
+
+    from .models import BlogPage
+
+    if isinstance(instance, get_category_model()):
+        return BlogPage.objects.filter(categories=instance)
+    elif isinstance(instance, get_user_model()):
+        return BlogPage.objects.filter(authors=instance)
+    else:
+        # The tags are stored as slugs.
+        return [
+            page
+            for page in BlogPage.objects.filter(is_filtered=True).exclude(tag_slugs="")
+            if instance.slug in page.get_tag_slugs()
+        ]
+
+
+def _on_filter_object_pre_delete(sender, instance, **kwargs):
+    # Find the pages before the cascade removes the M2M rows.
+    instance._blogpage_ids = [page.pk for page in _get_filtering_pages(instance)]
+
+
+def _on_filter_object_deleted(sender, instance, **kwargs):
+    from fluent_blogs.invalidation import invalidate
+
+    from .membership import rebuild_page_entries
+    from .models import BlogPage
+
+    page_ids = getattr(instance, "_blogpage_ids", None)
+    if not page_ids:
+        return
+
+    for page in BlogPage.objects.filter(pk__in=page_ids):
+        rebuild_page_entries(page)
+        invalidate(page_ids=[page.pk], site_ids=[page.parent_site_id])
@@ -0,0 +1,134 @@
+"""
+Maintenance of the entries that are shown at a filtered blog page.
+
+A :class:`~fluent_blogs.pagetypes.blogpage.models.BlogPage` can select categories, authors and tags.
+Each selection limits the entries shown at that page, an entry has to match one of the selected options.
+The matching entries are stored in the :class:`~fluent_blogs.pagetypes.blogpage.models.BlogPageEntry` table,
+so the views, feeds and sitemaps only need a single indexed lookup.
+The signal handlers in :class:`~fluent_blogs.pagetypes.blogpage.apps.BlogPageConfig` keep this table up to date.
+"""
+from django.conf import settings
+from django.db import transaction
+
+from fluent_blogs.models import get_entry_model
+
+from .models import BlogPage, BlogPageEntry
+
+__all__ = (
+    "get_entry_filters",
+    "rebuild_page_entries",
+    "rebuild_all_page_entries",
+    "update_entry_pages",
+    "delete_entry_pages",
+)
+
+
+def _has_field(model, name):
+    return any(field.name == name for field in model._meta.get_fields())
+
+
+def get_entry_filters(page):
+    """
+    Return the queryset filters for the entries which are shown at the page.
+    An empty dict is returned when the page shows all entries.
+    """
+    EntryModel = get_entry_model()
+    filters = {}
+
+    if _has_field(EntryModel, "categories"):
+        category_ids = list(page.categories.values_list("pk", flat=True))
+        if category_ids:
+            filters["categories__in"] = category_ids
+
+    author_ids = list(page.authors.values_list("pk", flat=True))
+    if author_ids:
+        filters["author__in"] = author_ids
+
+    tag_slugs = page.get_tag_slugs()
+    if tag_slugs and "taggit" in settings.INSTALLED_APPS and _has_field(EntryModel, "tags"):
+        filters["tags__slug__in"] = tag_slugs
+
+    return filters
+
+
+def _get_matching_entries(page, filters):
+    EntryModel = get_entry_model()
+    return (
+        EntryModel._base_manager.filter(parent_site=page.parent_site_id, **filters)
+        .order_by()
+        .values_list("pk", flat=True)
+        .distinct()
+    )
+
+
+def rebuild_page_entries(page):
+    """
+    Recalculate which entries are shown at the page.
+    """
+    filters = get_entry_filters(page)
+    with transaction.atomic():
+        BlogPageEntry.objects.filter(page=page).delete()
+        if filters:
+            BlogPageEntry.objects.bulk_create(
+                [
+                    BlogPageEntry(page=page, entry_id=entry_id)
+                    for entry_id in _get_matching_entries(page, filters)
+                ],
+                batch_size=500,
+            )
+
+        is_filtered = bool(filters)
+        if page.is_filtered != is_filtered:
+            BlogPage.objects.filter(pk=page.pk).update(is_filtered=is_filtered)
+            page.is_filtered = is_filtered
+
+
+def rebuild_all_page_entries():
+    """
+    Recalculate the entries of all filtered pages.
+    """
+    for page in BlogPage.objects.filter(is_filtered=True):
+        rebuild_page_entries(page)
+
+
+def update_entry_pages(entry_ids):
+    """
+    Update the pages where the given entries are shown, after they are created or changed.
+    """
+    entry_ids = list(entry_ids)
+    if not entry_ids:
+        return
+
+    # Only the pages of the same site can show the entries.
+    EntryModel = get_entry_model()
+    entry_sites = {}
+    for entry_id, site_id in EntryModel._base_manager.filter(pk__in=entry_ids).values_list(
+        "pk", "parent_site_id"
+    ):
+        entry_sites.setdefault(site_id, []).append(entry_id)
+
+    with transaction.atomic():
+        for site_id, site_entry_ids in entry_sites.items():
+            # The entry may have been moved to this site.
+            BlogPageEntry.objects.filter(entry_id__in=site_entry_ids).exclude(
+                page__parent_site=site_id
+            ).delete()
+
+        for page in BlogPage.objects.filter(is_filtered=True, parent_site__in=list(entry_sites)):
+            filters = get_entry_filters(page)
+            matching = set(_get_matching_entries(page, filters).filter(pk__in=entry_ids))
+
+            BlogPageEntry.objects.filter(page=page, entry_id__in=entry_ids).exclude(
+                entry_id__in=matching
+            ).delete()
+            BlogPageEntry.objects.bulk_create(
+                [BlogPageEntry(page=page, entry_id=entry_id) for entry_id in matching],
+                ignore_conflicts=True,
+            )
+
+
+def delete_entry_pages(entry_ids):
+    """
+    Remove the deleted entries from all pages.
+    """
+    BlogPageEntry.objects.filter(entry_id__in=list(entry_ids)).delete()
@@ -0,0 +1,80 @@
+from django.conf import settings
+from django.db import migrations, models
+
+import fluent_blogs.appsettings
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blogpage", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        migrations.swappable_dependency(fluent_blogs.appsettings.FLUENT_BLOGS_CATEGORY_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpage",
+            name="authors",
+            field=models.ManyToManyField(
+                blank=True,
+                help_text="When selected, only entries written by these authors are shown.",
+                related_name="+",
+                db_table="pagetype_blogpage_blogpage_authors",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Authors",
+            ),
+        ),
+        migrations.AddField(
+            model_name="blogpage",
+            name="categories",
+            field=models.ManyToManyField(
+                blank=True,
+                help_text="When selected, only entries in these categories are shown.",
+                related_name="+",
+                db_table="pagetype_blogpage_blogpage_categories",
+                to=fluent_blogs.appsettings.FLUENT_BLOGS_CATEGORY_MODEL,
+                verbose_name="Categories",
+            ),
+        ),
+        migrations.AddField(
+            model_name="blogpage",
+            name="is_filtered",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="blogpage",
+            name="tag_slugs",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="A comma separated list of tag slugs. When filled in, only entries with these tags are shown.",
+                max_length=255,
+                verbose_name="Tags",
+            ),
+        ),
+        migrations.CreateModel(
+            name="BlogPageEntry",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("entry_id", models.IntegerField(db_index=True)),
+                (
+                    "page",
+                    models.ForeignKey(
+                        on_delete=models.CASCADE,
+                        related_name="entry_links",
+                        to="blogpage.blogpage",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Blog module entry",
+                "verbose_name_plural": "Blog module entries",
+                "unique_together": {("page", "entry_id")},
+            },
+        ),
+    ]
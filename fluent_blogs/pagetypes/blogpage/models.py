@@ -1,12 +1,47 @@
+from django.conf import settings
+from django.db import models
 from django.utils.translation import gettext_lazy as _
 from fluent_pages.integration.fluent_contents.models import FluentContentsPage
 from parler.models import TranslatableModel
 from parler.utils.context import switch_language
 
+from fluent_blogs import appsettings
 from fluent_blogs.models import get_entry_model
 
 
 class BlogPage(FluentContentsPage):
+    # Filters to limit the entries shown at this mount point.
+    # Within each filter, an entry has to match one of the options.
+    # The M2M tables are named explicitly, as the page metaclass renames the page table afterwards.
+    categories = models.ManyToManyField(
+        appsettings.FLUENT_BLOGS_CATEGORY_MODEL,
+        verbose_name=_("Categories"),
+        blank=True,
+        related_name="+",
+        db_table="pagetype_blogpage_blogpage_categories",
+        help_text=_("When selected, only entries in these categories are shown."),
+    )
+    authors = models.ManyToManyField(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("Authors"),
+        blank=True,
+        related_name="+",
+        db_table="pagetype_blogpage_blogpage_authors",
+        help_text=_("When selected, only entries written by these authors are shown."),
+    )
+    tag_slugs = models.CharField(
+        _("Tags"),
+        max_length=255,
+        blank=True,
+        default="",
+        help_text=_(
+            "A comma separated list of tag slugs. When filled in, only entries with these tags are shown."
+        ),
+    )
+
+    # Updated by rebuild_page_entries(), avoids checking the filters for every request.
+    is_filtered = models.BooleanField(default=False, editable=False)
+
     class Meta:
         verbose_name = _("Blog module")
         verbose_name_plural = _("Blog modules")
@@ -16,9 +51,8 @@ class BlogPage(FluentContentsPage):
         """
         Return the entries that are published under this node.
         """
-        # Since there is currently no filtering in place, return all entries.
         EntryModel = get_entry_model()
-        qs = get_entry_model().objects.order_by("-publication_date")
+        qs = self._filter_entries(get_entry_model().objects.order_by("-publication_date"))
 
         # Only limit to current language when this makes sense.
         if issubclass(EntryModel, TranslatableModel):
@@ -29,24 +63,77 @@ class BlogPage(FluentContentsPage):
 
         return qs
 
+    def get_tag_slugs(self):
+        """
+        Return the tags that are selected as filter.
+        """
+        return [slug.strip() for slug in self.tag_slugs.split(",") if slug.strip()]
+
     def get_entry_queryset(self, view_url_name, for_user=None, include_hidden=False):
         """
         Return the base queryset that will be shown at this blog page.
         This allows subclasses of the `BlogPage` to limit which pages
         are shown at a particular mount point.
         """
-        return get_entry_model().objects.published(
-            for_user=for_user, include_hidden=include_hidden
-        )
+        qs = get_entry_model().objects.published(for_user=for_user, include_hidden=include_hidden)
+        return self._filter_entries(qs)
+
+    def _filter_entries(self, qs):
+        if not self.is_filtered:
+            return qs
+
+        # The matching entries are stored in the BlogPageEntry table,
+        # so the filters don't need to be joined for every request.
+        entry_ids = BlogPageEntry.objects.filter(page=self).values("entry_id")
+        return qs.filter(pk__in=entry_ids)
 
     def get_entry_url(self, entry):
         """
         Return the URL of a blog entry, relative to this page.
         """
-        # It could be possible this page is fetched as fallback, while the 'entry' does have a translation.
-        # - Currently django-fluent-pages 1.0b3 `Page.objects.get_for_path()` assigns the language of retrieval
-        #   as current object language. The page is not assigned a fallback language instead.
-        # - With i18n_patterns() that would make strange URLs, such as '/en/blog/2016/05/dutch-entry-title/'
-        # Hence, respect the entry language as starting point to make the language consistent.
-        with switch_language(self, entry.get_current_language()):
-            return self.get_absolute_url() + entry.get_relative_url()
+        return self.get_entry_urls([entry])[0]
+
+    def get_entry_urls(self, entries, page_urls=None):
+        """
+        Return the URLs of multiple blog entries, relative to this page.
+        The URL of this page is only resolved once per language.
+        The optional *page_urls* dict is used to store these URLs, so it can be reused in the next call.
+        """
+        if page_urls is None:
+            page_urls = {}
+
+        urls = []
+        for entry in entries:
+            # It could be possible this page is fetched as fallback, while the 'entry' does have a translation.
+            # - Currently django-fluent-pages 1.0b3 `Page.objects.get_for_path()` assigns the language of retrieval
+            #   as current object language. The page is not assigned a fallback language instead.
+            # - With i18n_patterns() that would make strange URLs, such as '/en/blog/2016/05/dutch-entry-title/'
+            # Hence, respect the entry language as starting point to make the language consistent.
+            language_code = entry.get_current_language()
+            try:
+                page_url = page_urls[language_code]
+            except KeyError:
+                with switch_language(self, language_code):
+                    page_url = page_urls[language_code] = self.get_absolute_url()
+
+            urls.append(page_url + entry.get_relative_url())
+        return urls
+
+
+class BlogPageEntry(models.Model):
+    """
+    The entries that are shown at a filtered :class:`BlogPage`.
+    This table is maintained by :mod:`fluent_blogs.pagetypes.blogpage.membership`.
+    """
+
+    page = models.ForeignKey(BlogPage, on_delete=models.CASCADE, related_name="entry_links")
+    # Not a foreign key, as the entry model can be swapped with FLUENT_BLOGS_ENTRY_MODEL.
+    entry_id = models.IntegerField(db_index=True)
+
+    class Meta:
+        verbose_name = _("Blog module entry")
+        verbose_name_plural = _("Blog module entries")
+        unique_together = (("page", "entry_id"),)
+
+    def __str__(self):
+        return f"{self.page_id}: {self.entry_id}"
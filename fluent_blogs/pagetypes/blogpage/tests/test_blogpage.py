@@ -6,6 +6,7 @@ from django.contrib.admin.templatetags.admin_urls import admin_urlname
 from django.contrib.auth import get_user_model
 from django.contrib.sites.models import Site
 from django.core.cache import cache
+from django.template import Context, Template
 from django.test import RequestFactory, TestCase
 from django.test.utils import override_settings
 from django.urls import reverse
@@ -84,6 +85,47 @@ class BlogPageTests(TestCase):
             entry.create_translation("nl", slug="hello-nl")
             self.assertEqual(entry.default_url, "/nl/blogpage/2016/05/hello-nl/")
 
+    def test_blogpage_entry_urls(self):
+        """
+        The URLs of multiple entries are generated with a single page URL lookup per language.
+        """
+        page = BlogPage.objects.language("en").create(
+            author=self.user, status=BlogPage.PUBLISHED, slug="blogpage"
+        )
+        date = datetime(year=2016, month=5, day=1)
+        entries = [
+            Entry.objects.language("en").create(
+                author=self.user, slug=f"entry-{i}", publication_date=date
+            )
+            for i in range(3)
+        ]
+
+        page_urls = {}
+        with self.assertNumQueries(0):
+            urls = page.get_entry_urls(entries, page_urls=page_urls)
+        self.assertEqual(page_urls, {"en": "/en/blogpage/"})
+        self.assertEqual(urls[0], "/en/blogpage/2016/05/entry-0/")
+        self.assertEqual(page.get_entry_url(entries[2]), "/en/blogpage/2016/05/entry-2/")
+
+        # The template tag remembers the page URL during the rendering.
+        template = Template(
+            "{% load fluent_blogs_tags %}{% for entry in entries %}{% get_entry_url entry %} {% endfor %}"
+        )
+        html = template.render(Context({"page": page, "entries": entries}))
+        self.assertEqual(html.split(), [f"/en/blogpage/2016/05/entry-{i}/" for i in range(3)])
+
+        # The remembered URL follows the current page variable.
+        other = BlogPage.objects.language("en").create(
+            author=self.user, status=BlogPage.PUBLISHED, slug="other"
+        )
+        template = Template(
+            "{% load fluent_blogs_tags %}{% for page in pages %}{% get_entry_url entry %} {% endfor %}"
+        )
+        html = template.render(Context({"pages": [page, other], "entry": entries[0]}))
+        self.assertEqual(
+            html.split(), ["/en/blogpage/2016/05/entry-0/", "/en/other/2016/05/entry-0/"]
+        )
+
     def test_no_blogpage_admin(self):
         """
         When there is no page type mounted, the admin page should still be accessable.
@@ -0,0 +1,173 @@
+from datetime import datetime
+
+from categories_i18n.models import Category
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils.timezone import make_aware
+
+from fluent_blogs.importer import import_entries
+from fluent_blogs.models import Entry
+from fluent_blogs.pagetypes.blogpage.models import BlogPage, BlogPageEntry
+from fluent_blogs.sitemaps import EntrySitemap
+
+
+@override_settings(ROOT_URLCONF="fluent_blogs.pagetypes.blogpage.tests.urls", LANGUAGE_CODE="en")
+class BlogPageMembershipTests(TestCase):
+    """
+    Testing the entries that are shown at a filtered ``BlogPage``.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.get_or_create(
+            id=settings.SITE_ID,
+            defaults=dict(domain="django.localhost", name="django at localhost"),
+        )
+        cls.user = get_user_model().objects.create_user("author")
+        cls.news = Category.objects.language("en").create(title="News", slug="news")
+        cls.other = Category.objects.language("en").create(title="Other", slug="other")
+
+    def setUp(self):
+        cache.clear()  # BlogPage URLs are stored in cache
+        self.page = BlogPage.objects.language("en").create(
+            author=self.user, status=BlogPage.PUBLISHED, slug="news"
+        )
+
+    def create_entry(self, slug, categories=()):
+        entry = Entry.objects.language("en").create(
+            author=self.user,
+            slug=slug,
+            status=Entry.PUBLISHED,
+            publication_date=make_aware(datetime(2016, 5, 1)),
+        )
+        entry.categories.set(categories)
+        return entry
+
+    def get_slugs(self):
+        qs = self.page.get_entry_queryset(view_url_name="entry_archive_index")
+        return sorted(qs.values_list("translations__slug", flat=True))
+
+    def test_unfiltered(self):
+        """
+        A page without filters shows all entries, without storing them.
+        """
+        self.create_entry("first")
+        self.assertFalse(self.page.is_filtered)
+        self.assertEqual(self.get_slugs(), ["first"])
+        self.assertFalse(BlogPageEntry.objects.exists())
+
+    def test_page_changes(self):
+        """
+        Selecting a category updates the entries of the page.
+        """
+        self.create_entry("first", [self.news])
+        self.create_entry("second", [self.other])
+
+        self.page.categories.add(self.news)
+        self.assertTrue(self.page.is_filtered)
+        self.assertEqual(self.get_slugs(), ["first"])
+
+        self.page.categories.clear()
+        self.assertFalse(self.page.is_filtered)
+        self.assertEqual(self.get_slugs(), ["first", "second"])
+
+    def test_entry_changes(self):
+        """
+        Changing the categories of an entry updates the pages it appears on.
+        """
+        self.page.categories.add(self.news)
+        entry = self.create_entry("first", [self.news])
+        self.assertEqual(self.get_slugs(), ["first"])
+
+        entry.categories.set([self.other])
+        self.assertEqual(self.get_slugs(), [])
+
+        self.other.entry_set.remove(entry)
+        self.news.entry_set.add(entry)
+        self.assertEqual(self.get_slugs(), ["first"])
+
+        entry.delete()
+        self.assertFalse(BlogPageEntry.objects.exists())
+
+    def test_filter_deleted(self):
+        """
+        Deleting a selected category or author rebuilds the page.
+        The cascade removes the M2M rows without sending ``m2m_changed``.
+        """
+        other_user = get_user_model().objects.create_user("other")
+        self.create_entry("first", [self.news])
+        self.create_entry("second", [self.other])
+        self.page.categories.add(self.news, self.other)
+        self.page.authors.add(self.user, other_user)
+        self.assertEqual(self.get_slugs(), ["first", "second"])
+
+        self.other.delete()
+        self.assertEqual(self.get_slugs(), ["first"])
+
+        other_user.delete()
+        self.assertEqual(self.get_slugs(), ["first"])
+        self.news.delete()
+        self.page.refresh_from_db()
+        self.assertTrue(self.page.is_filtered)  # Still filtered on the author.
+        self.assertEqual(self.get_slugs(), ["first", "second"])
+
+    def test_other_site(self):
+        """
+        Only the pages of the entry's site are updated, an entry that moves to another site is removed.
+        """
+        other_site = Site.objects.create(domain="other.localhost", name="other")
+        self.page.categories.add(self.news)
+        entry = self.create_entry("first", [self.news])
+        self.assertEqual(self.get_slugs(), ["first"])
+
+        entry.parent_site = other_site
+        entry.save()
+        self.assertEqual(self.get_slugs(), [])
+        self.assertFalse(BlogPageEntry.objects.filter(entry_id=entry.pk).exists())
+
+    def test_filters_combined(self):
+        """
+        An entry has to match every type of filter.
+        """
+        other_user = get_user_model().objects.create_user("other")
+        self.create_entry("first", [self.news])
+        Entry.objects.filter(translations__slug="first").update(author=other_user)
+        self.create_entry("second", [self.news])
+
+        self.page.categories.add(self.news)
+        self.page.authors.add(self.user)
+        self.assertEqual(self.get_slugs(), ["second"])
+
+    def test_import(self):
+        """
+        Imported entries are added to the pages, even though ``bulk_create()`` sends no signals.
+        """
+        self.page.categories.add(self.news)
+        import_entries(
+            [
+                {"slug": "imported", "title": "Imported", "status": "p", "categories": ["news"]},
+                {"slug": "skipped", "title": "Skipped", "status": "p", "categories": ["other"]},
+            ],
+            language_code="en",
+        )
+        self.assertEqual(
+            list(BlogPageEntry.objects.values_list("page", flat=True)), [self.page.pk]
+        )
+
+    def test_sitemap(self):
+        """
+        The sitemap of a page lists the entries of that page.
+        """
+        self.create_entry("first", [self.news])
+        self.create_entry("second", [self.other])
+        self.page.categories.add(self.news)
+
+        sitemap = EntrySitemap(page=self.page)
+        self.assertEqual(
+            [sitemap.location(entry) for entry in sitemap.items()],
+            ["/en/news/2016/05/first/"],
+        )
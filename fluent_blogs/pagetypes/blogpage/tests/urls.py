@@ -1,9 +1,14 @@
 import fluent_pages.urls
 from django.conf.urls.i18n import i18n_patterns
 from django.contrib import admin
+from django.contrib.sitemaps.views import sitemap
 from django.urls import include, path
 
-urlpatterns = i18n_patterns(
+from fluent_blogs.tests.testapp.urls import sitemaps
+
+urlpatterns = [
+    path("sitemap-<section>.xml", sitemap, {"sitemaps": sitemaps}, name="sitemap"),
+] + i18n_patterns(
     path("admin/", admin.site.urls),
     path("", include(fluent_pages.urls)),
 )
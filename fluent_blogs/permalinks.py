@@ -0,0 +1,174 @@
+"""
+The permalink index of the blog entries.
+
+The detail view finds entries by their slug and publication date range, which requires a join
+on the translations table. Instead, the :class:`~fluent_blogs.models.EntryPermalink` table maps
+the permalink path of each site and language to the entry ID, so the view only performs a unique index lookup.
+
+Previous permalinks are kept when the slug or publication date changes,
+so the old URLs are answered with a permanent redirect.
+The index is updated after each transaction that changes entries, and can be rebuild with
+``manage.py rebuild_blog_permalinks``. Entries that are not indexed yet are still found by their slug.
+"""
+from django.core.cache import cache
+from django.db import transaction
+from parler.models import TranslatableModel
+from parler.utils.context import switch_language
+
+from fluent_blogs import appsettings
+from fluent_blogs.cache import get_versioned_cache_key
+from fluent_blogs.invalidation import subscribe
+from fluent_blogs.models import EntryPermalink, get_entry_model
+from fluent_blogs.replicas import for_read
+
+__all__ = (
+    "get_permalink_path",
+    "resolve_permalink",
+    "update_permalinks",
+    "rebuild_permalinks",
+    "connect_signals",
+)
+
+REDIRECT_TIMEOUT = 24 * 3600
+
+
+def get_permalink_path(**kwargs):
+    """
+    Return the normalized permalink path for the URL arguments of the detail view.
+    """
+    return appsettings.FLUENT_BLOGS_ENTRY_LINK_STYLE.lstrip("/").format(**kwargs)
+
+
+def _get_entry_paths(entry):
+    # Return the current path of each language.
+    if "{year}" in appsettings.FLUENT_BLOGS_ENTRY_LINK_STYLE and entry.publication_date is None:
+        return {}  # e.g. draft, there is no URL yet
+
+    if not isinstance(entry, TranslatableModel):
+        return {"": entry.get_relative_url()}
+
+    paths = {}
+    for translation in entry.translations.all():
+        with switch_language(entry, translation.language_code):
+            paths[translation.language_code] = entry.get_relative_url()
+    return paths
+
+
+def resolve_permalink(path, site_id, language_code=""):
+    """
+    Find the entry of a permalink path.
+    This returns ``(entry_id, redirect_path)``, where ``redirect_path`` is the current path
+    when an old permalink is requested. This returns ``(None, None)`` for unknown paths.
+    """
+    row = (
+        for_read(EntryPermalink.objects.all())
+        .filter(parent_site=site_id, language_code=language_code, path=path)
+        .values_list("entry_id", "is_current")
+        .first()
+    )
+    if row is None:
+        return None, None
+
+    entry_id, is_current = row
+    if is_current:
+        return entry_id, None
+
+    # The redirect is cached until the entry is changed.
+    key = get_versioned_cache_key(
+        "permalink_redirect",
+        path,
+        site_id=site_id,
+        language_code=language_code,
+        depends_on=[("entry", entry_id)],
+    )
+    redirect_path = cache.get(key)
+    if redirect_path is None:
+        redirect_path = (
+            for_read(EntryPermalink.objects.all())
+            .filter(
+                parent_site=site_id,
+                language_code=language_code,
+                entry_id=entry_id,
+                is_current=True,
+            )
+            .values_list("path", flat=True)
+            .first()
+        )
+        if redirect_path is None:
+            return None, None
+        cache.set(key, redirect_path, REDIRECT_TIMEOUT)
+    return entry_id, redirect_path
+
+
+def update_permalinks(entry_ids):
+    """
+    Update the permalinks of the given entries.
+    The previous paths are kept as redirect, the links of deleted entries are removed.
+    """
+    EntryModel = get_entry_model()
+    entries = EntryModel._default_manager.filter(pk__in=entry_ids)
+    if issubclass(EntryModel, TranslatableModel):
+        entries = entries.prefetch_related("translations")
+
+    with transaction.atomic():
+        existing = {}
+        for link in EntryPermalink.objects.filter(entry_id__in=entry_ids).select_for_update():
+            existing.setdefault(link.entry_id, []).append(link)
+
+        found = set()
+        for entry in entries:
+            found.add(entry.pk)
+            _update_entry(entry, existing.get(entry.pk, ()))
+
+        deleted = set(entry_ids) - found
+        if deleted:
+            EntryPermalink.objects.filter(entry_id__in=deleted).delete()
+
+
+def _update_entry(entry, links):
+    paths = _get_entry_paths(entry)
+
+    # Links of removed translations, or links of another site are no longer valid.
+    stale = [
+        link.pk
+        for link in links
+        if link.parent_site_id != entry.parent_site_id or link.language_code not in paths
+    ]
+    if stale:
+        EntryPermalink.objects.filter(pk__in=stale).delete()
+
+    for language_code, path in paths.items():
+        # Mark the previous paths as redirect.
+        EntryPermalink.objects.filter(
+            entry_id=entry.pk, language_code=language_code, is_current=True
+        ).exclude(parent_site=entry.parent_site_id, path=path).update(is_current=False)
+
+        # The path may have belonged to another entry before.
+        EntryPermalink.objects.update_or_create(
+            parent_site_id=entry.parent_site_id,
+            language_code=language_code,
+            path=path,
+            defaults={"entry_id": entry.pk, "is_current": True},
+        )
+
+
+def rebuild_permalinks(batch_size=500):
+    """
+    Add the current permalinks of all entries. The previous paths are kept.
+    """
+    EntryModel = get_entry_model()
+    entry_ids = list(EntryModel._default_manager.order_by("pk").values_list("pk", flat=True))
+    for i in range(0, len(entry_ids), batch_size):
+        update_permalinks(entry_ids[i : i + batch_size])
+
+
+def _on_cache_invalidated(sender, invalidation, **kwargs):
+    if invalidation.entry_ids:
+        update_permalinks(invalidation.entry_ids)
+
+
+def connect_signals():
+    """
+    Update the permalinks when entries are changed. This is called by the ``AppConfig.ready()`` method.
+    """
+    subscribe(_on_cache_invalidated)
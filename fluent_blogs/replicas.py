@@ -0,0 +1,83 @@
+"""
+Read-replica support.
+
+When ``FLUENT_BLOGS_READ_DATABASE`` is set, the public read paths of the blog
+(archives, feeds, sitemaps and template tags) query that database alias instead of the primary.
+Staff previews and the admin keep using the primary database.
+
+Add the :class:`ReadReplicaMiddleware` to keep all reads at the primary database for requests that write data.
+With ``FLUENT_BLOGS_READ_PRIMARY_AFTER_WRITE``, the following requests of that visitor also read from the primary
+for a few seconds, so they see their own changes while the replica catches up.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from fluent_blogs import appsettings
+
+__all__ = (
+    "get_read_database",
+    "for_read",
+    "use_primary",
+    "ReadReplicaMiddleware",
+)
+
+PINNING_COOKIE_NAME = "fluent_blogs_primary"
+
+_use_primary = ContextVar("fluent_blogs_use_primary", default=False)
+
+
+def get_read_database():
+    """
+    Return the database alias for read-only blog queries.
+    This returns ``None`` when the default database routing should be used.
+    """
+    if _use_primary.get():
+        return None
+    return appsettings.FLUENT_BLOGS_READ_DATABASE
+
+
+def for_read(queryset):
+    """
+    Let a queryset read from the replica database, unless an explicit database was chosen.
+    """
+    alias = get_read_database()
+    if alias and queryset._db is None:
+        return queryset.using(alias)
+    return queryset
+
+
+@contextmanager
+def use_primary():
+    """
+    Temporary read all blog data from the primary database, e.g. directly after saving data.
+    """
+    token = _use_primary.set(True)
+    try:
+        yield
+    finally:
+        _use_primary.reset(token)
+
+
+class ReadReplicaMiddleware:
+    """
+    Keep the reads at the primary database for requests that write data,
+    and for a short window afterwards when ``FLUENT_BLOGS_READ_PRIMARY_AFTER_WRITE`` is set.
+    """
+
+    safe_methods = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        is_write = request.method not in self.safe_methods
+        if not is_write and PINNING_COOKIE_NAME not in request.COOKIES:
+            return self.get_response(request)
+
+        with use_primary():
+            response = self.get_response(request)
+
+        window = appsettings.FLUENT_BLOGS_READ_PRIMARY_AFTER_WRITE
+        if is_write and window:
+            response.set_cookie(PINNING_COOKIE_NAME, "1", max_age=window, httponly=True)
+        return response
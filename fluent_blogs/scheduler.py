@@ -0,0 +1,96 @@
+"""
+Scheduled publication of blog entries.
+
+Entries with a future ``publication_date`` or a ``publication_end_date`` become visible or invisible
+when the clock passes these dates, without saving the entry. The :func:`run_schedule` function finds
+the entries that crossed their publication window since the previous run, and sends the
+:data:`~fluent_blogs.signals.entry_published` and :data:`~fluent_blogs.signals.entry_expired` signals.
+Afterwards, :data:`~fluent_blogs.signals.entries_changed` is sent once for all entries,
+so the caches can be invalidated in a single batch.
+
+Run ``manage.py publish_blog_entries`` from cron, or with ``--interval`` as long-running process.
+The time of the previous run is stored in the :class:`~fluent_blogs.models.ScheduleRun` table.
+"""
+from datetime import timedelta
+
+from django.utils.timezone import now
+
+from fluent_blogs.models import ScheduleRun, get_entry_model
+from fluent_blogs.signals import entries_changed, entry_expired, entry_published
+
+__all__ = (
+    "ScheduleResult",
+    "get_scheduled_entries",
+    "run_schedule",
+)
+
+#: How far to look back when the schedule runs for the first time.
+DEFAULT_LOOKBACK = timedelta(days=1)
+
+# The schedule is processed for all sites at once, so there is a single row.
+_SCHEDULE_RUN_ID = 1
+
+
+class ScheduleResult:
+    """
+    The entries that changed visibility in a schedule run.
+    """
+
+    def __init__(self, since, until):
+        self.since = since
+        self.until = until
+        self.published = []
+        self.expired = []
+
+    def __repr__(self):
+        return "<ScheduleResult: {} published, {} expired>".format(
+            len(self.published), len(self.expired)
+        )
+
+
+def get_scheduled_entries(since, until):
+    """
+    Return the entries that went live, and the entries that expired between *since* and *until*.
+    Both queries use the index of the ``publication_date`` and ``publication_end_date`` fields.
+    """
+    EntryModel = get_entry_model()
+    qs = EntryModel._default_manager.filter(status=EntryModel.PUBLISHED).order_by()
+
+    published = qs.filter(publication_date__gt=since, publication_date__lte=until).exclude(
+        publication_end_date__lte=until
+    )
+    expired = qs.filter(publication_end_date__gt=since, publication_end_date__lte=until)
+    return published, expired
+
+
+def run_schedule(since=None, until=None):
+    """
+    Send the signals for all entries which crossed their publication window since the last run.
+    """
+    if until is None:
+        until = now()
+    if since is None:
+        last_run = (
+            ScheduleRun.objects.filter(pk=_SCHEDULE_RUN_ID)
+            .values_list("last_run", flat=True)
+            .first()
+        )
+        since = last_run or (until - DEFAULT_LOOKBACK)
+
+    result = ScheduleResult(since, until)
+    published, expired = get_scheduled_entries(since, until)
+    result.published = list(published)
+    result.expired = list(expired)
+
+    EntryModel = get_entry_model()
+    for entry in result.published:
+        entry_published.send(sender=EntryModel, entry=entry)
+    for entry in result.expired:
+        entry_expired.send(sender=EntryModel, entry=entry)
+
+    entry_ids = {entry.pk for entry in result.published + result.expired}
+    if entry_ids:
+        entries_changed.send(sender=EntryModel, entry_ids=sorted(entry_ids))
+
+    ScheduleRun.objects.update_or_create(pk=_SCHEDULE_RUN_ID, defaults={"last_run": until})
+    return result
@@ -0,0 +1,36 @@
+"""
+Signals sent by django-fluent-blogs.
+"""
+from django.dispatch import Signal
+
+__all__ = (
+    "cache_invalidated",
+    "entries_changed",
+    "entry_published",
+    "entry_expired",
+    "view_stats_recorded",
+)
+
+#: Sent when an instrumented blog view, feed or sitemap finished.
+#: The handler receives the ``stats`` (a :class:`~fluent_blogs.instrumentation.BlogStats` object)
+#: and ``request`` arguments. The request is ``None`` for sitemaps.
+#: This is only sent when :ref:`FLUENT_BLOGS_INSTRUMENTATION` is enabled.
+view_stats_recorded = Signal()
+
+#: Sent when entries are created or updated in bulk, which doesn't send the model signals.
+#: This is also sent when the scheduled publication changed the visibility of entries.
+#: The handler receives the ``entry_ids`` argument. The sender is the entry model.
+entries_changed = Signal()
+
+#: Sent by the scheduler when the ``publication_date`` of an entry has passed.
+#: The handler receives the ``entry`` argument. The sender is the entry model.
+entry_published = Signal()
+
+#: Sent by the scheduler when the ``publication_end_date`` of an entry has passed.
+#: The handler receives the ``entry`` argument. The sender is the entry model.
+entry_expired = Signal()
+
+#: Sent after a transaction that changed the blog content is committed.
+#: The handler receives the ``invalidation`` argument, an :class:`~fluent_blogs.invalidation.Invalidation` object.
+#: Use :func:`fluent_blogs.invalidation.subscribe` to connect to this signal.
+cache_invalidated = Signal()
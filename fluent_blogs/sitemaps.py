@@ -2,27 +2,73 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sitemaps import Sitemap
+from django.db.models import OuterRef, Subquery
 from parler.models import TranslatableModel
 
+from fluent_blogs import appsettings
+from fluent_blogs.instrumentation import InstrumentedSitemapMixin
 from fluent_blogs.models import get_category_model, get_entry_model
+from fluent_blogs.replicas import for_read
 from fluent_blogs.urlresolvers import blog_reverse
 
-User = get_user_model()
-EntryModel = get_entry_model()
-CategoryModel = get_category_model()
 
+def _last_modification(**filters):
+    # Fetch the last modification date as subquery, instead of running a query per sitemap item.
+    lastitems = (
+        get_entry_model()
+        .objects.published()
+        .filter(**filters)
+        .order_by("-modification_date")
+        .values("modification_date")
+    )
+    return Subquery(lastitems[:1])
 
-class EntrySitemap(Sitemap):
+
+class EntrySitemap(InstrumentedSitemapMixin, Sitemap):
     """
     The sitemap definition for the pages created with django-fluent-blogs.
+
+    When a *page* is given, only the entries of that blog page are listed,
+    using the URLs relative to that page.
+
+    With *hreflang* enabled, each entry is listed once per translation,
+    and every URL links to the other translations with ``<xhtml:link rel="alternate" hreflang="..">`` elements.
+    The entries are read with all their translations in a single query per sitemap page.
     """
 
+    stats_name = "entry_sitemap"
+
+    #: Whether the URLs of all translations are listed, with links to each other.
+    hreflang = False
+
+    def __init__(self, page=None, hreflang=None):
+        self.page = page
+        self._page_urls = {}  # page URL per language, reset for every sitemap request.
+        self._entry_urls = {}
+        if hreflang is not None:
+            self.hreflang = hreflang
+        if self.hreflang and self.limit == Sitemap.limit:
+            # Each entry gives a URL per language, keep the sitemap pages within the 50.000 URLs limit.
+            self.limit = Sitemap.limit // max(1, _get_max_languages())
+
+    def get_queryset(self):
+        if self.page is not None:
+            return self.page.get_entry_queryset(view_url_name="entry_detail")
+        return get_entry_model().objects.published()
+
     def items(self):
-        qs = EntryModel.objects.published().order_by("-publication_date")
+        self._page_urls = {}
+        self._entry_urls = {}
+        EntryModel = get_entry_model()
+        qs = self.get_queryset().order_by("-publication_date")
 
         if issubclass(EntryModel, TranslatableModel):
+            if self.hreflang:
+                # Each page of the sitemap reads the entries, and all their translations in one query.
+                return qs.prefetch_related("translations").order_by("-publication_date", "pk")
+
             # Note that .active_translations() can't be combined with other filters for translations__.. fields.
-            qs = qs.active_translations()
+            qs = qs.active_translations().fetch_translations()
             return qs.order_by("-publication_date", "translations__language_code")
         else:
             return qs.order_by("-publication_date")
@@ -33,23 +79,83 @@ class EntrySitemap(Sitemap):
 
     def location(self, urlnode):
         """Return url of an entry."""
+        if self.hreflang and isinstance(urlnode, TranslatableModel):
+            # The URL of the first translation, get_urls() adds the other languages.
+            return next(iter(self.get_translated_urls(urlnode).values()), "")
+        if self.page is not None:
+            return self.page.get_entry_urls([urlnode], page_urls=self._page_urls)[0]
         return urlnode.url
 
+    def get_urls(self, page=1, site=None, protocol=None):
+        urls = super().get_urls(page=page, site=site, protocol=protocol)
+        if not self.hreflang:
+            return urls
+
+        result = []
+        for url_info in urls:
+            entry = url_info["item"]
+            if not isinstance(entry, TranslatableModel):
+                result.append(url_info)
+                continue
+
+            translated_urls = self.get_translated_urls(entry)
+            if not translated_urls:
+                continue
+
+            # The domain and protocol are the start of the location.
+            first_url = next(iter(translated_urls.values()))
+            prefix = url_info["location"][: -len(first_url)]
+            alternates = [
+                {"location": prefix + url, "lang_code": language_code}
+                for language_code, url in translated_urls.items()
+            ]
+            if self.x_default:
+                default_url = translated_urls.get(appsettings.FLUENT_BLOGS_DEFAULT_LANGUAGE_CODE)
+                if default_url:
+                    alternates.append({"location": prefix + default_url, "lang_code": "x-default"})
+
+            for url in translated_urls.values():
+                result.append(dict(url_info, location=prefix + url, alternates=alternates))
+        return result
+
+    def get_translated_urls(self, entry):
+        """
+        Return the URL of each translation of the entry, as ``{language_code: url}``.
+        The blog URL of each language is only resolved once per sitemap.
+        """
+        try:
+            return self._entry_urls[entry.pk]
+        except KeyError:
+            urls = entry.get_translated_urls(page=self.page, page_urls=self._page_urls)
+            self._entry_urls[entry.pk] = urls
+            return urls
+
+
+def _get_max_languages():
+    return max(
+        (
+            len(languages)
+            for site_id, languages in appsettings.FLUENT_BLOGS_LANGUAGES.items()
+            if site_id != "default"
+        ),
+        default=1,
+    )
+
+
+class CategoryArchiveSitemap(InstrumentedSitemapMixin, Sitemap):
+    stats_name = "category_archive_sitemap"
 
-class CategoryArchiveSitemap(Sitemap):
     def items(self):
-        only_ids = EntryModel.objects.published().values("categories").order_by().distinct()
-        return CategoryModel.objects.filter(id__in=only_ids)
+        only_ids = get_entry_model().objects.published().values("categories").order_by().distinct()
+        return (
+            for_read(get_category_model().objects.all())
+            .filter(id__in=only_ids)
+            .annotate(last_modification=_last_modification(categories=OuterRef("pk")))
+        )
 
     def lastmod(self, category):
         """Return the last modification of the entry."""
-        lastitems = (
-            EntryModel.objects.published()
-            .order_by("-modification_date")
-            .filter(categories=category)
-            .only("modification_date")
-        )
-        return lastitems[0].modification_date
+        return category.last_modification
 
     def location(self, category):
         """Return url of an entry."""
@@ -58,20 +164,22 @@ class CategoryArchiveSitemap(Sitemap):
         )
 
 
-class AuthorArchiveSitemap(Sitemap):
+class AuthorArchiveSitemap(InstrumentedSitemapMixin, Sitemap):
+    stats_name = "author_archive_sitemap"
+
     def items(self):
-        only_ids = EntryModel.objects.published().values("author").order_by().distinct()
-        return User.objects.filter(id__in=only_ids).order_by(User.USERNAME_FIELD)
+        User = get_user_model()
+        only_ids = get_entry_model().objects.published().values("author").order_by().distinct()
+        return (
+            for_read(User.objects.all())
+            .filter(id__in=only_ids)
+            .annotate(last_modification=_last_modification(author=OuterRef("pk")))
+            .order_by(User.USERNAME_FIELD)
+        )
 
     def lastmod(self, author):
         """Return the last modification of the entry."""
-        lastitems = (
-            EntryModel.objects.published()
-            .order_by("-modification_date")
-            .filter(author=author)
-            .only("modification_date")
-        )
-        return lastitems[0].modification_date
+        return author.last_modification
 
     def location(self, author):
         """Return url of an entry."""
@@ -80,7 +188,9 @@ class AuthorArchiveSitemap(Sitemap):
         )
 
 
-class TagArchiveSitemap(Sitemap):
+class TagArchiveSitemap(InstrumentedSitemapMixin, Sitemap):
+    stats_name = "tag_archive_sitemap"
+
     def items(self):
         # Tagging is optional. When it's not used, it's ignored.
         if "taggit" not in settings.INSTALLED_APPS:
@@ -88,29 +198,26 @@ class TagArchiveSitemap(Sitemap):
 
         from taggit.models import Tag
 
+        EntryModel = get_entry_model()
         only_instances = EntryModel.objects.published().only("pk")
 
         # Use the same filters as TaggedItem.bulk_lookup_kwargs()
         return (
-            Tag.objects.filter(
+            for_read(Tag.objects.all())
+            .filter(
                 taggit_taggeditem_items__object_id__in=only_instances,
                 taggit_taggeditem_items__content_type=ContentType.objects.get_for_model(
                     EntryModel
                 ),
             )
+            .annotate(last_modification=_last_modification(tags__id=OuterRef("pk")))
             .order_by("slug")
             .distinct()
         )
 
     def lastmod(self, tag):
         """Return the last modification of the entry."""
-        lastitems = (
-            EntryModel.objects.published()
-            .order_by("-modification_date")
-            .filter(tags=tag)
-            .only("modification_date")
-        )
-        return lastitems[0].modification_date
+        return tag.last_modification
 
     def location(self, tag):
         """Return url of an entry."""
@@ -0,0 +1,59 @@
+"""
+Multi-site support.
+
+By default, the entries are filtered by the static ``settings.SITE_ID``.
+When multiple sites are served by the same process, add the :class:`CurrentSiteMiddleware`
+to resolve the site per request. All queries, sitemaps and caches of the blog then use that site.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.contrib.sites.shortcuts import get_current_site
+
+__all__ = (
+    "get_current_site_id",
+    "override_site",
+    "CurrentSiteMiddleware",
+)
+
+_current_site_id = ContextVar("fluent_blogs_current_site_id", default=None)
+
+
+def get_current_site_id():
+    """
+    Return the ID of the site that is currently being served.
+    This falls back to ``settings.SITE_ID`` outside a request, or when the middleware is not used.
+    """
+    site_id = _current_site_id.get()
+    if site_id is None:
+        site_id = getattr(settings, "SITE_ID", None)
+    return site_id
+
+
+@contextmanager
+def override_site(site_id):
+    """
+    Temporary switch the current site, e.g. in management commands or tests.
+    """
+    token = _current_site_id.set(site_id)
+    try:
+        yield
+    finally:
+        _current_site_id.reset(token)
+
+
+class CurrentSiteMiddleware:
+    """
+    Resolve the current site from the request domain,
+    so the blog shows the entries of that site.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        site = get_current_site(request)
+        request.site = site
+        with override_site(site.pk):
+            return self.get_response(request)
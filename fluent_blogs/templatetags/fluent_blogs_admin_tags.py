@@ -2,7 +2,6 @@ from django.template import Library
 from django.urls import reverse
 from django.utils.safestring import mark_safe
 
-from fluent_blogs.admin import EntryAdmin
 from fluent_blogs.models import get_entry_model
 
 register = Library()
@@ -10,11 +9,15 @@ register = Library()
 
 @register.simple_tag()
 def status_column(entry):
+    from fluent_blogs.admin import EntryAdmin  # avoid importing the admin on template loading
+
     return mark_safe(EntryAdmin.get_status_column(entry))
 
 
 @register.simple_tag()
 def actions_column(entry):
+    from fluent_blogs.admin import EntryAdmin
+
     return mark_safe(EntryAdmin.get_actions_column(entry))
 
 
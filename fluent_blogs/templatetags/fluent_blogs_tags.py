@@ -1,11 +1,22 @@
 from datetime import date, datetime
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Model
 from django.template import Library
-from tag_parser.basetags import BaseAssignmentOrInclusionNode, BaseAssignmentOrOutputNode
-
-from fluent_blogs.models import get_entry_model
-from fluent_blogs.models.query import query_entries, query_tags
+from django.utils.translation import get_language
+from tag_parser.basetags import (
+    BaseAssignmentNode,
+    BaseAssignmentOrInclusionNode,
+    BaseAssignmentOrOutputNode,
+    BaseNode,
+)
+
+from fluent_blogs import appsettings
+from fluent_blogs.cache import get_versioned_cache_key
+from fluent_blogs.models import get_category_model, get_entry_model
+from fluent_blogs.models.query import query_categories, query_entries, query_tags
 
 BlogPage = None
 
@@ -56,20 +67,61 @@ class GetEntryUrl(BaseAssignmentOrOutputNode):
         entry = tag_args[0]
 
         if HAS_APP_URLS:
-            # If the application supports mounting a BlogPage in the page tree,
-            # that can be used as relative start point of the entry.
-            page = context.get("page")
-            request = context.get("request")
-            if page is None and request is not None:
-                # HACK: access private django-fluent-pages var
-                page = getattr(request, "_current_fluent_page", None)
-
-            if page is not None and isinstance(page, BlogPage):
-                return page.get_entry_url(entry)
+            # The current page and its URL are remembered during the template rendering,
+            # so a list of entries doesn't resolve the page URL for every item.
+            page, page_urls = _get_entry_url_memo(context)
+            if page is not None:
+                return page.get_entry_urls([entry], page_urls=page_urls)[0]
 
         return entry.get_absolute_url()
 
 
+@register.tag("get_translated_urls")
+class GetTranslatedUrls(BaseAssignmentNode):
+    """
+    Get the URLs of all translations of a blog entry, e.g. for a language switch menu:
+
+    .. code-block:: html+django
+
+        {% get_translated_urls object as translated_urls %}
+        {% for language_code, url in translated_urls.items %}
+            <link rel="alternate" hreflang="{{ language_code }}" href="{{ url }}" />
+        {% endfor %}
+
+    The URL of the blog is only resolved once per language during the template rendering.
+    """
+
+    min_args = 1
+    max_args = 1
+    takes_context = True
+
+    def get_value(self, context, *tag_args, **tag_kwargs):
+        entry = tag_args[0]
+        if HAS_APP_URLS:
+            page, page_urls = _get_entry_url_memo(context)
+            return entry.get_translated_urls(page=page, page_urls=page_urls)
+        return entry.get_translated_urls()
+
+
+def _get_entry_url_memo(context):
+    # If the application supports mounting a BlogPage in the page tree,
+    # that can be used as relative start point of the entry.
+    page = context.get("page")
+    request = context.get("request")
+    if page is None and request is not None:
+        # HACK: access private django-fluent-pages var
+        page = getattr(request, "_current_fluent_page", None)
+
+    if page is not None and not isinstance(page, BlogPage):
+        page = None
+
+    # The page URLs are remembered per page during this template rendering,
+    # as the "page" variable can differ per block (e.g. {% with %} or a loop over pages).
+    memo = context.render_context.setdefault("fluent_blogs_page_urls", {})
+    page_urls = memo.setdefault(page.pk if page is not None else None, {})
+    return page, page_urls
+
+
 @register.filter
 def format_year(year):
     """
@@ -156,16 +208,56 @@ class GetEntriesNode(BlogAssignmentOrInclusionNode):
         "order",
         "limit",
     )
-    model = get_entry_model()
+    model = None  # defaults to get_entry_model()
 
     def get_value(self, context, *tag_args, **tag_kwargs):
         # Query happens in the backend,
         # the templatetag is considered to be a frontend.
-        qs = self.model.objects.all()
+        qs = (self.model or get_entry_model()).objects.all().fetch_translations()
         qs = query_entries(qs, **tag_kwargs)
         return qs
 
 
+@register.tag("get_categories")
+class GetCategoriesNode(BlogAssignmentOrInclusionNode):
+    """
+    Find the categories that have published entries.
+    This template tag supports the following syntax:
+
+    .. code-block:: html+django
+
+        {% get_categories order="count" as categories %}
+        {% for category in categories %}...{% endfor %}
+
+        {% get_categories template="name/of/template.html" %}
+
+    The allowed query parameters are:
+
+    * ``order``: Which field to order on, this can be:
+
+     * ``slug``: The URL name of the category.
+     * ``title``: The title of the category.
+     * ``count``: The number of published entries.
+
+    * ``orderby``: can be ASC/ascending or DESC/descending. The default depends on the ``order`` field.
+    * ``limit``: The maximum number of categories to return.
+
+    The returned category objects have a ``count`` attribute attached
+    with the number of published entries in the current site and language.
+    """
+
+    template_name = "fluent_blogs/templatetags/categories.html"
+    context_value_name = "categories"
+    allowed_kwargs = (
+        "order",
+        "orderby",
+        "limit",
+    )
+
+    def get_value(self, context, *tag_args, **tag_kwargs):
+        return query_categories(**tag_kwargs)
+
+
 @register.tag("get_tags")
 class GetPopularTagsNode(BlogAssignmentOrInclusionNode):
     """
@@ -206,8 +298,139 @@ class GetPopularTagsNode(BlogAssignmentOrInclusionNode):
         return query_tags(**tag_kwargs)
 
 
+@register.tag("blogcache")
+class BlogCacheNode(BaseNode):
+    """
+    Cache a template fragment, until the blog content it displays is changed.
+    This template tag supports the following syntax:
+
+    .. code-block:: html+django
+
+        {% blogcache "entry_item" entry %}...{% endblogcache %}
+
+        {% blogcache "sidebar" "entries" "categories" timeout=3600 %}...{% endblogcache %}
+
+    The first argument is the name of the fragment, the other arguments are the objects it depends on:
+
+    * An entry, category, tag, author or blog page object.
+      An entry also depends on its author, categories and tags, as the fragment usually displays them.
+      Use ``prefetch_related()`` for the categories and tags, otherwise these are read for each fragment.
+    * ``"entries"``: all entries of the current site.
+    * ``"categories"``, ``"tags"`` or ``"authors"``: all objects of that type.
+      These names are only recognized as literal strings in the template, not as the value of a variable.
+
+    Other values (e.g. a page number) are part of the cache key, like the ``{% cache %}`` tag does.
+    The fragment is cached per site and language.
+    The ``timeout`` defaults to the ``FLUENT_BLOGS_FRAGMENT_CACHE_TIMEOUT`` setting.
+    """
+
+    end_tag_name = "endblogcache"
+    min_args = 1
+    max_args = None
+    allowed_kwargs = ("timeout",)
+
+    def __init__(self, tag_name, *args, **kwargs):
+        super().__init__(tag_name, *args, **kwargs)
+        # A variable with the value "tags" is part of the cache key, only the literals are dimensions.
+        self.dimensions = [_get_literal_dimension(arg) for arg in args[1:]]
+
+    def render_tag(self, context, name, *objects, timeout=None):
+        depends_on = []
+        vary_on = []
+        for obj, dimension in zip(objects, self.dimensions):
+            if dimension is not None:
+                depends_on.append(dimension)
+                continue
+
+            dependencies = _get_cache_dependencies(obj)
+            if dependencies is not None:
+                depends_on.extend(dependencies)
+            else:
+                vary_on.append(obj)
+
+        key = get_versioned_cache_key(
+            f"fragment.{name}", *vary_on, depends_on=depends_on, language_code=get_language()
+        )
+        html = cache.get(key)
+        if html is None:
+            html = self.nodelist.render(context)
+            if timeout is None:
+                timeout = appsettings.FLUENT_BLOGS_FRAGMENT_CACHE_TIMEOUT
+            cache.set(key, html, int(timeout))
+        return html
+
+
+_DEPENDENCY_NAMES = {
+    "entries": "site",
+    "categories": "category",
+    "tags": "tag",
+    "authors": "author",
+}
+
+
+def _get_literal_dimension(expression):
+    # The FilterExpression of a quoted string holds the string itself, a variable holds a Variable.
+    if isinstance(expression.var, str) and not expression.filters:
+        return _DEPENDENCY_NAMES.get(expression.var)
+    return None
+
+
+def _get_cache_dependencies(value):
+    # Find the generations that the {% blogcache %} fragment depends on.
+    if not isinstance(value, Model):
+        return None
+
+    if isinstance(value, get_entry_model()):
+        return _get_entry_dependencies(value)
+
+    for model, dimension in _get_dependency_models():
+        if isinstance(value, model):
+            return [(dimension, value.pk)]
+
+    # The fragment would never be updated for other objects.
+    raise ValueError(
+        f"{{% blogcache %}} can't depend on {value._meta.label} objects, "
+        "only on entries, categories, tags, authors and blog pages."
+    )
+
+
+def _get_entry_dependencies(entry):
+    # The fragment of an entry also displays the title of its categories and the name of its author.
+    dependencies = [("entry", entry.pk)]
+    if entry.author_id is not None:
+        dependencies.append(("author", entry.author_id))
+
+    relations = [("categories", "category")]
+    if "taggit" in settings.INSTALLED_APPS:
+        relations.append(("tags", "tag"))
+    field_names = {field.name for field in entry._meta.many_to_many}
+    for name, dimension in relations:
+        if name in field_names:
+            # Uses the prefetched objects when these are available.
+            dependencies.extend((dimension, obj.pk) for obj in getattr(entry, name).all())
+    return dependencies
+
+
+def _get_dependency_models():
+    models = [
+        (get_entry_model(), "entry"),
+        (get_category_model(), "category"),
+        (get_user_model(), "author"),
+    ]
+    if "taggit" in settings.INSTALLED_APPS:
+        from taggit.models import Tag
+
+        models.append((Tag, "tag"))
+    if BlogPage is not None:
+        models.append((BlogPage, "page"))
+    return models
+
+
 if False and __debug__:
     # This only exists to make PyCharm happy.
+    register.tag("blogcache", BlogCacheNode)
+    register.tag("get_categories", GetCategoriesNode)
     register.tag("get_entries", GetEntriesNode)
     register.tag("get_entry_url", GetEntryUrl)
     register.tag("get_tags", GetPopularTagsNode)
+    register.tag("get_translated_urls", GetTranslatedUrls)
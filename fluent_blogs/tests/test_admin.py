@@ -0,0 +1,82 @@
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from fluent_blogs.importer import import_entries
+
+
+@override_settings(LANGUAGE_CODE="en")
+class EntryChangeListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.user = get_user_model().objects.create_superuser(
+                "admin", "admin@example.org", "admin"
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)  # parler caches the translations by ID
+        self.client.force_login(self.user)
+        self.url = reverse("admin:fluent_blogs_entry_changelist")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_entry(2015, "en")
+            self.create_entry(2016, "nl")
+
+    def create_entry(self, year, language_code):
+        import_entries(
+            [
+                {
+                    "language_code": language_code,
+                    "title": f"Entry {year}",
+                    "slug": f"entry-{year}",
+                    "status": "p",
+                    "publication_date": datetime(
+                        year, 5, 1, 15, 0, tzinfo=timezone.utc
+                    ).isoformat(),
+                }
+            ]
+        )
+
+    def test_language_filter(self):
+        """
+        The language filter uses a subquery, instead of a DISTINCT over the joined translations.
+        """
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(self.url, {"translations__language_code": "nl"})
+        self.assertEqual(response.status_code, 200)
+        cl = response.context["cl"]
+        self.assertEqual(cl.result_count, 1)
+        self.assertTrue(cl.result_list[0].has_translation("nl"))
+
+        entry_queries = [q["sql"] for q in captured if 'FROM "fluent_blogs_entry"' in q["sql"]]
+        self.assertTrue(any("EXISTS" in sql for sql in entry_queries))
+        self.assertFalse(any('DISTINCT "fluent_blogs_entry"' in sql for sql in entry_queries))
+
+    def test_cached_sidebar(self):
+        """
+        The filter choices and the dates are cached until the entries change.
+        """
+        response = self.client.get(self.url)
+        self.assertContains(response, "?publication_date__year=2016")
+
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get(self.url)
+        sql = "\n".join(q["sql"] for q in captured)
+        self.assertNotIn("MIN(", sql)
+        self.assertNotIn("DISTINCT", sql)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_entry(2017, "en")
+        response = self.client.get(self.url)
+        self.assertContains(response, "?publication_date__year=2017")
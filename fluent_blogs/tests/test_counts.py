@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+from categories_i18n.models import Category
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import TestCase
+from django.utils import translation
+from django.utils.timezone import now
+
+from fluent_blogs.counts import get_entry_counts
+from fluent_blogs.models import Entry, EntryCount
+from fluent_blogs.models.query import query_categories
+
+
+class EntryCountTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)  # parler caches the translations by ID
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.news = Category.objects.language("en").create(title="News", slug="news")
+            self.events = Category.objects.language("en").create(title="Events", slug="events")
+            self.entry = Entry.objects.language("en").create(
+                slug="entry", status=Entry.PUBLISHED, publication_date=now()
+            )
+            self.dutch = Entry.objects.language("nl").create(
+                slug="bericht", status=Entry.PUBLISHED, publication_date=now()
+            )
+            self.entry.categories.add(self.news, self.events)
+            self.dutch.categories.add(self.news)
+
+    def test_counts(self):
+        """
+        The counts include the entries that are displayed in a fallback language.
+        """
+        self.assertEqual(
+            get_entry_counts("category", language_code="nl"), {self.news.pk: 2, self.events.pk: 1}
+        )
+        self.assertEqual(
+            get_entry_counts("category", language_code="en"), {self.news.pk: 1, self.events.pk: 1}
+        )
+
+    def test_update_counts(self):
+        """
+        The counts are updated when categories are removed, or entries expire.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            self.entry.categories.remove(self.events)
+        self.assertEqual(get_entry_counts("category", language_code="nl"), {self.news.pk: 2})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dutch.publication_end_date = now() - timedelta(minutes=1)
+            self.dutch.save()
+        self.assertEqual(get_entry_counts("category", language_code="nl"), {self.news.pk: 1})
+
+    def test_rebuild_counts(self):
+        EntryCount.objects.all().delete()
+        call_command("rebuild_blog_counts", verbosity=0)
+        self.assertEqual(EntryCount.objects.count(), 4)
+        self.assertEqual(get_entry_counts("category", language_code="nl")[self.news.pk], 2)
+
+    def test_get_categories(self):
+        with translation.override("nl"):
+            categories = list(query_categories(orderby="count"))
+            self.assertEqual(categories, [self.news, self.events])
+            self.assertEqual(categories[0].count, 2)
+
+            html = Template(
+                "{% load fluent_blogs_tags %}{% get_categories orderby='count' as categories %}"
+                "{% for category in categories %}{{ category.pk }}={{ category.count }} {% endfor %}"
+            ).render(Context())
+        self.assertEqual(html, f"{self.news.pk}=2 {self.events.pk}=1 ")
@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.management import call_command
+from django.test import TestCase
+
+from fluent_blogs.exporter import export_entries
+from fluent_blogs.importer import import_entries, read_jsonl
+from fluent_blogs.models import Entry
+
+
+class ExporterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        date = datetime(2016, 5, 1, tzinfo=timezone.utc)
+        for i in range(3):
+            entry = Entry.objects.language("en").create(
+                title=f"Entry {i}", slug=f"entry-{i}", publication_date=date
+            )
+            entry.create_translation("nl", title=f"Bericht {i}", slug=f"bericht-{i}")
+
+    def test_export_entries(self):
+        with self.assertNumQueries(6):
+            # 2 chunks, each reading the entries, translations and categories.
+            rows = list(export_entries(batch_size=2, include_contents=False))
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]["language_code"], "en")
+        self.assertEqual(rows[0]["slug"], "entry-0")
+        self.assertEqual(list(rows[0]["translations"]), ["nl"])
+        self.assertEqual(rows[0]["translations"]["nl"]["slug"], "bericht-0")
+
+    def test_export_since(self):
+        since = Entry.objects.order_by("modification_date").last().modification_date
+        self.assertEqual(list(export_entries(since=since)), [])
+
+    def test_command_round_trip(self):
+        stdout = StringIO()
+        call_command("export_blog_entries", stdout=stdout)
+        Entry.objects.all().delete()
+
+        result = import_entries(read_jsonl(StringIO(stdout.getvalue())))
+        self.assertEqual(result.created, 3)
+        entry = Entry.objects.translated("nl", slug="bericht-1").get()
+        self.assertEqual(entry.safe_translation_getter("title", language_code="nl"), "Bericht 1")
@@ -0,0 +1,88 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from fluent_blogs.importer import import_entries
+from fluent_blogs.views.feeds import LatestEntriesFeed, _make_urls_absolute
+
+
+@override_settings(LANGUAGE_CODE="en")
+class FeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cache.clear()
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        date = datetime(2016, 5, 1, 15, 0, tzinfo=timezone.utc)
+        import_entries(
+            {
+                "language_code": "en",
+                "title": f"Entry {i}",
+                "slug": f"entry-{i}",
+                "status": "p",
+                "publication_date": (date + timedelta(days=i)).isoformat(),
+                "contents": f"<p>Text {i}</p>",
+            }
+            for i in range(5)
+        )
+
+    def tearDown(self):
+        cache.clear()  # parler caches the translations by ID
+
+    def test_json_feed(self):
+        response = self.client.get("/blog/feed.json")
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/feed+json; charset=utf-8")
+
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(data["version"], "https://jsonfeed.org/version/1.1")
+        self.assertEqual(
+            [item["title"] for item in data["items"]], [f"Entry {i}" for i in range(4, -1, -1)]
+        )
+        self.assertEqual(data["items"][0]["url"], "http://example.com/blog/2016/05/entry-4/")
+
+    def test_streaming_chunks(self):
+        """
+        Streaming the feed in chunks gives the same document.
+        """
+        request = RequestFactory().get("/blog/feed.rss2")
+        for format in ("rss2.0", "atom1", "json"):
+            with self.subTest(format):
+                view = LatestEntriesFeed.as_view(format=format)
+                expected = view(request).content
+
+                view = LatestEntriesFeed.as_view(
+                    format=format, streaming=True, stream_chunk_size=2
+                )
+                with CaptureQueriesContext(connection) as captured:
+                    response = view(request)
+                    self.assertEqual(b"".join(response.streaming_content), expected)
+                self.assertFalse(any("OFFSET" in query["sql"] for query in captured))
+
+    def test_full_content(self):
+        """
+        The item contents are read from the cache, with absolute URLs.
+        """
+        request = RequestFactory().get("/blog/feed.rss2")
+        view = LatestEntriesFeed.as_view(format="json", full_content=True)
+        data = json.loads(view(request).content)
+        self.assertEqual(len(data["items"]), 5)
+
+        with CaptureQueriesContext(connection) as captured:
+            self.assertEqual(json.loads(view(request).content), data)
+        self.assertFalse(any("fluent_contents" in query["sql"] for query in captured))
+
+    def test_make_urls_absolute(self):
+        html = '<a href="/about/"><img src=\'/media/a.png\'></a> <a href="//cdn.example.com/">'
+        self.assertEqual(
+            _make_urls_absolute(html, "example.com", secure=True),
+            "<a href=\"https://example.com/about/\"><img src='https://example.com/media/a.png'></a>"
+            ' <a href="//cdn.example.com/">',
+        )
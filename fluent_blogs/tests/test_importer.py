@@ -0,0 +1,85 @@
+from io import StringIO
+from tempfile import NamedTemporaryFile
+from unittest import mock
+
+from categories_i18n.models import Category
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sites.models import Site
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from fluent_contents.models import Placeholder
+
+from fluent_blogs.importer import import_entries, read_jsonl
+from fluent_blogs.models import Entry
+
+JSONL_DATA = """
+{"id": 10, "language_code": "en", "title": "Hello", "slug": "hello", "status": "p", "publication_date": "2016-05-01T10:00:00", "author": "importer", "categories": ["news"], "translations": {"nl": {"title": "Hallo", "slug": "hallo"}}}
+{"language_code": "en", "title": "Second", "slug": "second", "status": "d", "publication_date": "2016-06-01T10:00:00", "author": "unknown", "categories": ["news", "missing"]}
+"""
+
+
+class ImporterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        cls.user = get_user_model().objects.create_user("importer", "importer@example.org")
+        cls.category = Category.objects.language("en").create(title="News", slug="news")
+
+    def test_import_entries(self):
+        result = import_entries(read_jsonl(StringIO(JSONL_DATA)), batch_size=1)
+        self.assertEqual(result.created, 2)
+        self.assertIn("Unknown category 'missing'.", result.warnings)
+
+        entry = Entry.objects.get(pk=10)
+        self.assertEqual(entry.parent_site_id, settings.SITE_ID)
+        self.assertEqual(entry.author, self.user)
+        self.assertEqual(entry.safe_translation_getter("slug", language_code="nl"), "hallo")
+        self.assertEqual(list(entry.categories.all()), [self.category])
+
+        second = Entry.objects.translated("en", slug="second").get()
+        self.assertIsNone(second.author)
+        self.assertEqual(second.status, Entry.DRAFT)
+
+    def test_reset_sequences(self):
+        """
+        After importing explicit IDs, the sequences are reset like ``loaddata`` does.
+        """
+        with mock.patch.object(
+            connection.ops, "sequence_reset_sql", wraps=connection.ops.sequence_reset_sql
+        ) as sequence_reset_sql:
+            import_entries(read_jsonl(StringIO(JSONL_DATA)), batch_size=1)
+        self.assertEqual(sequence_reset_sql.call_count, 1)  # Only the batch with an ID.
+        self.assertEqual(
+            sequence_reset_sql.call_args[0][1], [Entry, Entry._parler_meta.root_model]
+        )
+
+        entry = Entry.objects.language("en").create(title="New", slug="new")
+        self.assertGreater(entry.pk, 10)
+
+    def test_placeholders(self):
+        """
+        Every entry receives a placeholder, also without contents.
+        """
+        import_entries(read_jsonl(StringIO(JSONL_DATA)))
+        self.assertEqual(
+            sorted(Placeholder.objects.values_list("slot", flat=True)), ["blog_contents"] * 2
+        )
+
+    def test_resume(self):
+        import_entries(read_jsonl(StringIO(JSONL_DATA)))
+        result = import_entries(read_jsonl(StringIO(JSONL_DATA)), resume=True)
+        self.assertEqual(result.created, 0)
+        self.assertEqual(result.skipped, 2)
+        self.assertEqual(Entry.objects.count(), 2)
+
+    def test_command(self):
+        with NamedTemporaryFile("w", suffix=".jsonl") as fileobj:
+            fileobj.write(JSONL_DATA)
+            fileobj.flush()
+            stdout = StringIO()
+            call_command("import_blog_entries", fileobj.name, stdout=stdout, stderr=StringIO())
+        self.assertIn("Imported 2 entries", stdout.getvalue())
@@ -0,0 +1,60 @@
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.test import TestCase
+
+from fluent_blogs import appsettings
+from fluent_blogs.instrumentation import BaseStatsSink
+from fluent_blogs.signals import view_stats_recorded
+
+
+class ListStatsSink(BaseStatsSink):
+    recorded = []
+
+    def record(self, stats):
+        self.recorded.append(stats)
+
+
+class InstrumentationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+
+    def test_disabled(self):
+        response = self.client.get("/blog/")
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("Server-Timing"))
+
+    @mock.patch.object(appsettings, "FLUENT_BLOGS_INSTRUMENTATION", True)
+    @mock.patch.object(appsettings, "FLUENT_BLOGS_STATS_SINK", None)
+    def test_view_stats(self):
+        received = []
+
+        def _receiver(sender, stats, request, **kwargs):
+            received.append(stats)
+
+        view_stats_recorded.connect(_receiver)
+        try:
+            response = self.client.get("/blog/")
+        finally:
+            view_stats_recorded.disconnect(_receiver)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("sql;dur=", response["Server-Timing"])
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].view_name, "entry_archive_index")
+        self.assertGreater(received[0].query_count, 0)
+
+    @mock.patch.object(appsettings, "FLUENT_BLOGS_INSTRUMENTATION", True)
+    @mock.patch.object(appsettings, "FLUENT_BLOGS_STATS_SINK", f"{__name__}.ListStatsSink")
+    @mock.patch("fluent_blogs.instrumentation._stats_sink", None)
+    def test_feed_stats_sink(self):
+        ListStatsSink.recorded.clear()
+        response = self.client.get("/blog/feed.rss2")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [stats.view_name for stats in ListStatsSink.recorded], ["entry_archive_index_rss"]
+        )
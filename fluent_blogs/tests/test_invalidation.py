@@ -0,0 +1,142 @@
+from datetime import datetime
+
+from categories_i18n.models import Category
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+from django.utils.timezone import make_aware
+
+from fluent_blogs.cache import bump_generation, get_versioned_cache_key
+from fluent_blogs.invalidation import Invalidation, invalidate, subscribe
+from fluent_blogs.models import Entry
+from fluent_blogs.signals import cache_invalidated
+
+
+class InvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user = get_user_model().objects.create_user("author")
+            self.category = Category.objects.language("en").create(title="News", slug="news")
+            self.entry = Entry.objects.language("en").create(
+                author=self.user,
+                slug="entry",
+                status=Entry.PUBLISHED,
+                publication_date=make_aware(datetime(2016, 5, 1)),
+            )
+
+        self.received = []
+        cache_invalidated.connect(self.receiver, sender=Invalidation)
+        self.addCleanup(cache_invalidated.disconnect, self.receiver, sender=Invalidation)
+
+    def receiver(self, invalidation, **kwargs):
+        self.received.append(invalidation)
+
+    def test_entry_changes(self):
+        """
+        The changes of a transaction are sent as a single invalidation after the commit.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.entry.publication_date = make_aware(datetime(2016, 6, 1))
+                self.entry.save()
+                self.entry.categories.add(self.category)
+                self.entry.create_translation("nl", slug="bericht")
+            self.assertEqual(self.received, [])
+
+        self.assertEqual(len(self.received), 1)
+        invalidation = self.received[0]
+        self.assertEqual(invalidation.entry_ids, {self.entry.pk})
+        self.assertEqual(invalidation.site_ids, {settings.SITE_ID})
+        self.assertEqual(
+            invalidation.months, {(settings.SITE_ID, 2016, 5), (settings.SITE_ID, 2016, 6)}
+        )
+        self.assertEqual(invalidation.category_ids, {self.category.pk})
+        self.assertEqual(invalidation.author_ids, {self.user.pk})
+        self.assertIn("nl", invalidation.language_codes)
+
+    def test_entry_delete(self):
+        """
+        The relations of deleted entries are also invalidated.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            self.entry.categories.add(self.category)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.entry.delete()
+
+        self.assertEqual(self.received[-1].category_ids, {self.category.pk})
+        self.assertEqual(self.received[-1].months, {(settings.SITE_ID, 2016, 5)})
+
+    def test_rollback(self):
+        """
+        The changes of a rolled back savepoint are not sent, and don't hide later changes.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    invalidate(tag_ids=[1])
+                    raise ValueError("rollback")
+            except ValueError:
+                pass
+            invalidate(tag_ids=[2])
+            invalidate(category_ids=[3])
+
+        self.assertEqual(len(self.received), 1)
+        self.assertEqual(self.received[0].tag_ids, {2})
+        self.assertEqual(self.received[0].category_ids, {3})
+
+    def test_invalidate(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate(tag_ids=[1])
+        self.assertEqual(self.received[0].tag_ids, {1})
+
+    def test_subscribe(self):
+        """
+        Subscribing a function again doesn't register it twice.
+        """
+        calls = []
+
+        def receiver(invalidation, **kwargs):
+            calls.append(invalidation)
+
+        subscribe(receiver)
+        subscribe(receiver)
+        self.addCleanup(
+            cache_invalidated.disconnect,
+            sender=Invalidation,
+            dispatch_uid=f"{receiver.__module__}.{receiver.__qualname__}",
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate(tag_ids=[1])
+        self.assertEqual(len(calls), 1)
+
+    def test_versioned_cache_key(self):
+        """
+        The versioned cache keys change when the content they depend on changes.
+        """
+        depends_on = [("category", self.category.pk), "site"]
+        key = get_versioned_cache_key("categories", depends_on=depends_on)
+        self.assertEqual(key, get_versioned_cache_key("categories", depends_on=depends_on))
+        other_key = get_versioned_cache_key("tags", depends_on=[("tag", 1)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.entry.categories.add(self.category)
+
+        new_key = get_versioned_cache_key("categories", depends_on=depends_on)
+        self.assertNotEqual(key, new_key)
+        self.assertEqual(other_key, get_versioned_cache_key("tags", depends_on=[("tag", 1)]))
+
+        bump_generation("category", self.category.pk)
+        self.assertNotEqual(new_key, get_versioned_cache_key("categories", depends_on=depends_on))
+
+    def test_bump_blog_cache(self):
+        key = get_versioned_cache_key("tags", depends_on=[("tag", 1)])
+        call_command("bump_blog_cache", verbosity=0)
+        self.assertNotEqual(key, get_versioned_cache_key("tags", depends_on=[("tag", 1)]))
@@ -0,0 +1,95 @@
+from categories_i18n.models import Category
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils.timezone import now
+
+from fluent_blogs.cache import ALL_SITES, get_versioned_cache_key
+from fluent_blogs.lookups import lookup_author, lookup_category
+from fluent_blogs.models import Entry
+
+
+class SlugLookupTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)  # parler caches the translations by ID
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.author = User.objects.create(username="author")
+            self.news = Category.objects.language("en").create(title="News", slug="news")
+            self.news.set_current_language("nl")
+            self.news.title = "Nieuws"
+            self.news.slug = "nieuws"
+            self.news.save()
+            self.entry = Entry.objects.language("en").create(
+                slug="entry", status=Entry.PUBLISHED, publication_date=now(), author=self.author
+            )
+            self.entry.categories.add(self.news)
+
+    def test_lookup_category(self):
+        """
+        The category is rebuilt from the cache without queries, also for the fallback language.
+        """
+        category = lookup_category("nieuws", "nl")
+        self.assertEqual(category.safe_translation_getter("title", language_code="nl"), "Nieuws")
+        with self.assertNumQueries(0):
+            category = lookup_category("nieuws", "nl")
+            self.assertEqual(category, self.news)
+            self.assertEqual(
+                category.safe_translation_getter("slug", language_code="nl"), "nieuws"
+            )
+        self.assertEqual(lookup_category("news", "nl"), self.news)
+
+        self.assertEqual(lookup_category("news", "en"), self.news)
+        self.assertRaises(Category.DoesNotExist, lookup_category, "nieuws", "en")
+
+    def test_cached_values(self):
+        """
+        Only the username and name of the author are stored in the cache.
+        """
+        self.assertEqual(lookup_author("author"), self.author)
+        key = get_versioned_cache_key(
+            "author_slug", "author", depends_on=["author"], site_id=ALL_SITES
+        )
+        self.assertEqual(
+            cache.get(key),
+            {"id": self.author.pk, "username": "author", "first_name": "", "last_name": ""},
+        )
+
+        with self.assertNumQueries(0):
+            author = lookup_author("author")
+            self.assertEqual(author.get_username(), "author")
+            self.assertEqual(author.get_full_name(), "")
+        with self.assertNumQueries(1):
+            self.assertEqual(author.email, "")  # Deferred, so not cached.
+
+    def test_not_found(self):
+        """
+        Unknown slugs are cached too, until the objects change.
+        """
+        self.assertRaises(User.DoesNotExist, lookup_author, "other")
+        with self.assertNumQueries(0):
+            self.assertRaises(User.DoesNotExist, lookup_author, "other")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other = User.objects.create(username="other")
+        self.assertEqual(lookup_author("other"), other)
+
+    def test_rename_category(self):
+        """
+        Saving only the translation of a category also refreshes the slugs.
+        """
+        self.assertEqual(lookup_category("news", "en"), self.news)
+        self.assertRaises(Category.DoesNotExist, lookup_category, "updates", "en")
+
+        translation = self.news.translations.get(language_code="en")
+        translation.slug = "updates"
+        with self.captureOnCommitCallbacks(execute=True):
+            translation.save()
+
+        self.assertRaises(Category.DoesNotExist, lookup_category, "news", "en")
+        self.assertEqual(lookup_category("updates", "en"), self.news)
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase
 
 from fluent_blogs.models import Entry, get_entry_model
@@ -6,3 +7,18 @@ from fluent_blogs.models import Entry, get_entry_model
 class ModelTests(TestCase):
     def test_get_entry_model(self):
         self.assertIs(get_entry_model(), Entry)
+
+    def test_fetch_translations(self):
+        """
+        The active and fallback translations are fetched in a single query.
+        """
+        cache.clear()  # parler caches translations by ID
+        for i in range(3):
+            entry = Entry.objects.language("en").create(title=f"Entry {i}", slug=f"entry-{i}")
+        entry.create_translation("nl", title="Bericht 2", slug="bericht-2")
+
+        with self.assertNumQueries(2):
+            entries = list(Entry.objects.language("nl").fetch_translations("nl").order_by("pk"))
+        with self.assertNumQueries(0):
+            titles = [entry.title for entry in entries]
+        self.assertEqual(titles, ["Entry 0", "Entry 1", "Bericht 2"])
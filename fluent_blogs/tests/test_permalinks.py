@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from fluent_contents.models import Placeholder
+
+from fluent_blogs.models import Entry, EntryPermalink
+
+
+@override_settings(LANGUAGE_CODE="en")
+class PermalinkTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)  # parler caches the translations by ID
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.entry = Entry.objects.language("en").create(
+                title="Entry",
+                slug="entry",
+                status=Entry.PUBLISHED,
+                publication_date=datetime(2016, 5, 1, 15, 0, tzinfo=timezone.utc),
+            )
+        Placeholder.objects.create_for_object(self.entry, "blog_contents")
+
+    def test_index(self):
+        """
+        The detail view finds the entry by its primary key.
+        """
+        link = EntryPermalink.objects.get(entry_id=self.entry.pk)
+        self.assertEqual(
+            (link.parent_site_id, link.language_code, link.path, link.is_current),
+            (settings.SITE_ID, "en", "2016/05/entry/", True),
+        )
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get("/blog/2016/05/entry/")
+        self.assertEqual(response.context["object"], self.entry)
+        self.assertIn("fluent_blogs_entrypermalink", captured[0]["sql"])
+        self.assertIn(f'"fluent_blogs_entry"."id" = {self.entry.pk}', captured[1]["sql"])
+
+    def test_redirect(self):
+        """
+        Old permalinks redirect to the current URL.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            self.entry.slug = "renamed"
+            self.entry.publication_date = datetime(2016, 6, 1, 15, 0, tzinfo=timezone.utc)
+            self.entry.save()
+
+        response = self.client.get("/blog/2016/05/entry/?page=2")
+        self.assertRedirects(
+            response,
+            "/blog/2016/06/renamed/?page=2",
+            status_code=301,
+            fetch_redirect_response=False,
+        )
+        self.assertEqual(self.client.get("/blog/2016/06/renamed/").status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.entry.status = Entry.DRAFT
+            self.entry.save()
+        self.assertEqual(self.client.get("/blog/2016/05/entry/").status_code, 404)
+
+    def test_delete(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.entry.delete()
+        self.assertFalse(EntryPermalink.objects.exists())
@@ -0,0 +1,236 @@
+"""
+Query count regression tests.
+
+Every public URL is rendered with 5 and with 50 entries on the page.
+The number of queries should be identical, otherwise something performs a query per entry.
+"""
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from categories_i18n.models import Category
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from django.utils import translation
+from fluent_contents.templatetags.fluent_contents_tags import RenderPlaceholderNode
+
+import fluent_blogs.urls
+from fluent_blogs.importer import import_entries
+from fluent_blogs.urlresolvers import blog_reverse
+from fluent_blogs.views.entries import BaseArchiveMixin
+
+START_DATE = datetime(2016, 5, 1, 15, 0, tzinfo=timezone.utc)
+
+#: The arguments to render each URL of ``fluent_blogs.urls``.
+URL_KWARGS = {
+    "entry_archive_index": {},
+    "entry_archive_index_paginated": {"page": 1},
+    "entry_archive_index_rss": {},
+    "entry_archive_index_atom": {},
+    "entry_archive_index_json": {},
+    "entry_archive_year": {"year": "2016"},
+    "entry_archive_month": {"year": "2016", "month": "05"},
+    "entry_archive_day": {"year": "2016", "month": "05", "day": "01"},
+    "entry_archive_category": {"slug": "news"},
+    "entry_archive_category_paginated": {"slug": "news", "page": "1"},
+    "entry_archive_category_rss": {"slug": "news"},
+    "entry_archive_category_atom": {"slug": "news"},
+    "entry_archive_category_json": {"slug": "news"},
+    "entry_archive_author": {"slug": "author"},
+    "entry_archive_author_paginated": {"slug": "author", "page": "1"},
+    "entry_archive_author_rss": {"slug": "author"},
+    "entry_archive_author_atom": {"slug": "author"},
+    "entry_archive_author_json": {"slug": "author"},
+    "entry_archive_tag": {"slug": "tag"},
+    "entry_archive_tag_paginated": {"slug": "tag", "page": "1"},
+    "entry_archive_tag_rss": {"slug": "tag"},
+    "entry_archive_tag_atom": {"slug": "tag"},
+    "entry_archive_tag_json": {"slug": "tag"},
+    "entry_shortlink": {"pk": 1},
+    "entry_detail": {"year": "2016", "month": "05", "slug": "entry-0"},
+}
+
+
+class QueryCountTestMixin:
+    """
+    Render all URLs with 5 and 50 entries, and compare the query counts.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        cls.user = get_user_model().objects.create_superuser(
+            "author", "author@example.org", "admin"
+        )
+        Category.objects.language("en").create(title="News", slug="news")
+
+    def setUp(self):
+        super().setUp()
+        patchers = [
+            mock.patch.object(BaseArchiveMixin, "paginate_by", 100),
+            mock.patch("fluent_blogs.views.feeds._max_items", 100),
+            # The archives and feeds render the placeholder of each entry,
+            # which django-fluent-contents reads with a few queries per entry.
+            # These are skipped, so any other query per entry is noticed.
+            mock.patch.object(RenderPlaceholderNode, "render", return_value=""),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def create_entries(self, start, end):
+        import_entries(
+            (
+                {
+                    "id": i + 1,
+                    "language_code": "en",
+                    "title": f"Entry {i}",
+                    "slug": f"entry-{i}",
+                    "status": "p",
+                    "publication_date": (START_DATE + timedelta(minutes=i)).isoformat(),
+                    "author": "author",
+                    "categories": ["news"],
+                    "tags": ["tag"],
+                    "translations": {"nl": {"title": f"Bericht {i}", "slug": f"entry-{i}"}},
+                }
+                for i in range(start, end)
+            )
+        )
+
+    def get_paths(self):
+        """
+        Return the paths to test, by name.
+        """
+        raise NotImplementedError
+
+    def get_query_counts(self):
+        counts = {}
+        for name, path in self.get_paths().items():
+            cache.clear()
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(path)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+            self.assertIn(response.status_code, (200, 302), f"{name}: {path}")
+            counts[name] = captured.captured_queries
+        return counts
+
+    def test_query_counts(self):
+        self.client.force_login(self.user)
+        self.create_entries(0, 5)
+        self.get_query_counts()  # warm up process-wide caches, e.g. ContentType lookups.
+        few = self.get_query_counts()
+        self.create_entries(5, 50)
+        many = self.get_query_counts()
+
+        for name, queries in few.items():
+            with self.subTest(name):
+                self.assertEqual(
+                    len(many[name]),
+                    len(queries),
+                    "{} has {} queries for 5 entries, {} for 50 entries:\n{}".format(
+                        name,
+                        len(queries),
+                        len(many[name]),
+                        "\n".join(query["sql"] for query in many[name]),
+                    ),
+                )
+
+
+class UrlQueryCountTests(QueryCountTestMixin, TestCase):
+    """
+    Query counts for the URLs of ``fluent_blogs.urls``, which are included in the URLconf directly.
+    """
+
+    def test_all_urls_covered(self):
+        names = {pattern.name for pattern in fluent_blogs.urls.urlpatterns}
+        self.assertFalse(names - set(URL_KWARGS))
+
+    def get_paths(self):
+        paths = {
+            pattern.name: reverse(pattern.name, kwargs=URL_KWARGS[pattern.name])
+            for pattern in fluent_blogs.urls.urlpatterns
+        }
+        for section in ("blog_entries", "blog_categories", "blog_authors", "blog_tags"):
+            paths[f"sitemap_{section}"] = reverse("sitemap", kwargs={"section": section})
+        paths["admin_changelist"] = reverse("admin:fluent_blogs_entry_changelist")
+        return paths
+
+
+@override_settings(ROOT_URLCONF="fluent_blogs.pagetypes.blogpage.tests.urls", LANGUAGE_CODE="en")
+class BlogPageQueryCountTests(QueryCountTestMixin, TestCase):
+    """
+    Query counts for the same URLs, mounted in a ``BlogPage``.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        from fluent_blogs.pagetypes.blogpage.models import BlogPage
+
+        BlogPage.objects.language("en").create(
+            author=cls.user, status=BlogPage.PUBLISHED, slug="blog"
+        )
+
+    def tearDown(self):
+        cache.clear()  # BlogPage URLs are stored in cache
+        super().tearDown()
+
+    def get_paths(self):
+        with translation.override("en"):
+            paths = {
+                pattern.name: blog_reverse(pattern.name, kwargs=URL_KWARGS[pattern.name])
+                for pattern in fluent_blogs.urls.urlpatterns
+            }
+            paths["admin_changelist"] = reverse("admin:fluent_blogs_entry_changelist")
+        return paths
+
+
+@override_settings(LANGUAGE_CODE="en")
+class DetailQueryCountTests(TestCase):
+    """
+    The detail page fetches the related objects of the entry in a fixed number of queries.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)  # parler caches the translations by ID
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        slugs = ["news", "events", "blog"]
+        for slug in slugs:
+            Category.objects.language("en").create(title=slug.title(), slug=slug)
+        get_user_model().objects.create(username="author")
+
+        import_entries(
+            {
+                "language_code": "en",
+                "title": f"Entry {i}",
+                "slug": f"entry-{i}",
+                "status": "p",
+                "publication_date": (START_DATE + timedelta(minutes=i)).isoformat(),
+                "author": "author",
+                "categories": slugs[: i * 2 + 1],
+            }
+            for i in range(2)
+        )
+
+    def test_detail_queries(self):
+        counts = []
+        for i in range(2):
+            cache.clear()
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(f"/blog/2016/05/entry-{i}/")
+            self.assertContains(response, "Events" if i else "News")
+            counts.append(len(captured))
+
+        self.assertEqual(counts[0], counts[1])
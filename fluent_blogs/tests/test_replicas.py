@@ -0,0 +1,57 @@
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from fluent_blogs import appsettings
+from fluent_blogs.models import Entry
+from fluent_blogs.models.query import query_entries
+from fluent_blogs.replicas import (
+    PINNING_COOKIE_NAME,
+    ReadReplicaMiddleware,
+    get_read_database,
+    use_primary,
+)
+
+
+@mock.patch.object(appsettings, "FLUENT_BLOGS_READ_DATABASE", "replica")
+class ReadReplicaTests(SimpleTestCase):
+    """
+    The querysets are only constructed, so no database is accessed.
+    """
+
+    def test_published(self):
+        """
+        The public queries read from the replica, staff previews from the primary.
+        """
+        self.assertEqual(Entry.objects.published().db, "replica")
+        self.assertEqual(Entry.objects.published(for_user=AnonymousUser()).db, "replica")
+        self.assertEqual(query_entries().db, "replica")
+        self.assertEqual(Entry.objects.published(for_user=User(is_staff=True)).db, "default")
+        self.assertEqual(Entry.objects.using("other").published().db, "other")
+
+        with use_primary():
+            self.assertEqual(Entry.objects.published().db, "default")
+
+    @mock.patch.object(appsettings, "FLUENT_BLOGS_READ_PRIMARY_AFTER_WRITE", 5)
+    def test_middleware(self):
+        """
+        Requests that post data are pinned to the primary, including the next requests.
+        """
+        seen = []
+
+        def get_response(request):
+            seen.append(get_read_database())
+            return HttpResponse()
+
+        middleware = ReadReplicaMiddleware(get_response)
+        factory = RequestFactory()
+
+        middleware(factory.get("/"))
+        response = middleware(factory.post("/"))
+        self.assertEqual(response.cookies[PINNING_COOKIE_NAME]["max-age"], 5)
+
+        factory.cookies[PINNING_COOKIE_NAME] = "1"
+        middleware(factory.get("/"))
+        self.assertEqual(seen, ["replica", None, None])
@@ -0,0 +1,83 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils.timezone import now
+
+from fluent_blogs.models import Entry
+from fluent_blogs.scheduler import run_schedule
+from fluent_blogs.signals import entries_changed, entry_expired, entry_published
+
+
+class SchedulerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        date = now()
+        create = Entry.objects.language("en").create
+        cls.old = create(
+            slug="old", status=Entry.PUBLISHED, publication_date=date - timedelta(days=7)
+        )
+        cls.live = create(
+            slug="live", status=Entry.PUBLISHED, publication_date=date - timedelta(minutes=5)
+        )
+        cls.expired = create(
+            slug="expired",
+            status=Entry.PUBLISHED,
+            publication_date=date - timedelta(days=7),
+            publication_end_date=date - timedelta(minutes=5),
+        )
+        cls.future = create(
+            slug="future", status=Entry.PUBLISHED, publication_date=date + timedelta(days=1)
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_published(self):
+        """
+        The publication window is respected.
+        """
+        self.assertEqual(set(Entry.objects.published()), {self.old, self.live})
+
+    def test_run_schedule(self):
+        """
+        The signals are sent for the entries that crossed their publication window.
+        """
+        received = []
+
+        def receiver(signal, **kwargs):
+            received.append((signal, kwargs.get("entry") or kwargs["entry_ids"]))
+
+        for signal in (entry_published, entry_expired, entries_changed):
+            signal.connect(receiver, sender=Entry)
+            self.addCleanup(signal.disconnect, receiver, sender=Entry)
+
+        result = run_schedule(since=now() - timedelta(hours=1))
+        self.assertEqual(result.published, [self.live])
+        self.assertEqual(result.expired, [self.expired])
+        self.assertEqual(
+            received,
+            [
+                (entry_published, self.live),
+                (entry_expired, self.expired),
+                (entries_changed, sorted([self.live.pk, self.expired.pk])),
+            ],
+        )
+
+        # The next run continues where the previous run stopped, also in a new process.
+        received.clear()
+        cache.clear()
+        result = run_schedule()
+        self.assertEqual((result.published, result.expired, received), ([], [], []))
+
+    def test_command(self):
+        out = StringIO()
+        call_command("publish_blog_entries", since="2000-01-01", stdout=out)
+        self.assertEqual(out.getvalue().strip(), "Published 2 entries, expired 1 entries.")
@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from fluent_blogs.models import Entry
+
+
+@override_settings(LANGUAGE_CODE="en")
+class ShortLinkTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)  # parler caches the translations by ID
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.entry = Entry.objects.language("en").create(
+                title="Entry",
+                slug="entry",
+                status=Entry.PUBLISHED,
+                publication_date=datetime(2016, 5, 1, 15, 0, tzinfo=timezone.utc),
+            )
+
+    def test_cached_redirect(self):
+        """
+        The short link is answered from the cache until the entry changes.
+        """
+        path = f"/blog/{self.entry.pk}/"
+        response = self.client.get(path)
+        self.assertRedirects(response, "/blog/2016/05/entry/", fetch_redirect_response=False)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(path)
+        self.assertEqual(response["Location"], "/blog/2016/05/entry/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.entry.slug = "renamed"
+            self.entry.save()
+        self.assertEqual(self.client.get(path)["Location"], "/blog/2016/05/renamed/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.entry.status = Entry.DRAFT
+            self.entry.save()
+        self.assertEqual(self.client.get(path).status_code, 404)
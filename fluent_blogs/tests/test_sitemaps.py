@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from fluent_blogs.importer import import_entries
+from fluent_blogs.sitemaps import EntrySitemap
+
+
+@override_settings(LANGUAGE_CODE="en")
+class EntrySitemapTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)  # parler caches the translations by ID
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        date = datetime(2016, 5, 1, 15, 0, tzinfo=timezone.utc)
+        import_entries(
+            {
+                "language_code": "en",
+                "title": f"Entry {i}",
+                "slug": f"entry-{i}",
+                "status": "p",
+                "publication_date": date.replace(day=i + 1).isoformat(),
+                "translations": {"nl": {"title": f"Bericht {i}", "slug": f"bericht-{i}"}},
+            }
+            for i in range(3)
+        )
+
+    def test_hreflang(self):
+        """
+        Each translation is listed, with links to the other translations.
+        """
+        sitemap = EntrySitemap(hreflang=True)
+        site = Site.objects.get_current()
+        with self.assertNumQueries(3):
+            # Count, entries and their translations.
+            urls = sitemap.get_urls(site=site, protocol="https")
+
+        self.assertEqual(len(urls), 6)
+        alternates = [
+            {"location": "https://example.com/blog/2016/05/entry-2/", "lang_code": "en"},
+            {"location": "https://example.com/blog/2016/05/bericht-2/", "lang_code": "nl"},
+        ]
+        self.assertEqual(
+            {url["location"] for url in urls[:2]},
+            {alternate["location"] for alternate in alternates},
+        )
+        self.assertEqual(sorted(urls[0]["alternates"], key=repr), sorted(alternates, key=repr))
+        self.assertEqual(urls[0]["alternates"], urls[1]["alternates"])
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
+
+from fluent_blogs.cache import get_cache_key
+from fluent_blogs.models import Entry
+from fluent_blogs.sites import CurrentSiteMiddleware, get_current_site_id, override_site
+
+
+class SiteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.site = Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )[0]
+        cls.other_site = Site.objects.create(domain="other.localhost", name="other")
+        Entry.objects.language("en").create(slug="main", status=Entry.PUBLISHED)
+        with override_site(cls.other_site.pk):
+            Entry.objects.language("en").create(slug="other", status=Entry.PUBLISHED)
+
+    def test_published(self):
+        """
+        The entries are filtered by the current site.
+        """
+        self.assertEqual(
+            list(Entry.objects.published().values_list("translations__slug", flat=True)),
+            ["main"],
+        )
+        with override_site(self.other_site.pk):
+            self.assertEqual(
+                list(Entry.objects.published().values_list("translations__slug", flat=True)),
+                ["other"],
+            )
+
+    @override_settings(ALLOWED_HOSTS=["other.localhost"])
+    def test_middleware(self):
+        """
+        The middleware resolves the site by domain name.
+        """
+        seen = []
+        middleware = CurrentSiteMiddleware(lambda request: seen.append(get_current_site_id()))
+        with override_settings(SITE_ID=None):
+            del settings.SITE_ID  # let Django resolve the site by domain
+            middleware(RequestFactory().get("/", HTTP_HOST="other.localhost"))
+        self.assertEqual(seen, [self.other_site.pk])
+        self.assertEqual(get_current_site_id(), settings.SITE_ID)
+
+    def test_cache_key(self):
+        self.assertEqual(get_cache_key("tags", language_code="en"), "fluent_blogs.tags.site4.en")
+        with override_site(self.other_site.pk):
+            self.assertNotEqual(get_cache_key("tags"), get_cache_key("tags", site_id=4))
@@ -0,0 +1,156 @@
+from datetime import datetime, timezone
+
+from categories_i18n.models import Category
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import TestCase
+from django.utils import translation
+from django.utils.timezone import now
+
+from fluent_blogs.cache import bump_generation
+from fluent_blogs.models import Entry
+
+
+class BlogCacheTagTests(TestCase):
+    template = Template(
+        "{% load fluent_blogs_tags %}"
+        "{% blogcache 'item' entry page %}{{ entry.title }} {{ page }}{% endblogcache %}"
+    )
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)  # parler caches the translations by ID
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.entry = Entry.objects.language("en").create(
+                title="First", slug="first", status=Entry.PUBLISHED, publication_date=now()
+            )
+            self.other = Entry.objects.language("en").create(
+                title="Other", slug="other", status=Entry.PUBLISHED, publication_date=now()
+            )
+
+    def render(self, template, **context):
+        with translation.override("en"):
+            return template.render(Context(context))
+
+    def test_entry(self):
+        """
+        The fragment is cached until the entry changes.
+        """
+        self.assertEqual(self.render(self.template, entry=self.entry, page=1), "First 1")
+        self.entry.title = "Changed"
+        self.assertEqual(self.render(self.template, entry=self.entry, page=1), "First 1")
+        self.assertEqual(self.render(self.template, entry=self.entry, page=2), "Changed 2")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.save()
+        self.assertEqual(self.render(self.template, entry=self.entry, page=1), "First 1")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.entry.save()
+        self.assertEqual(self.render(self.template, entry=self.entry, page=1), "Changed 1")
+
+    def test_all_entries(self):
+        template = Template(
+            "{% load fluent_blogs_tags %}"
+            "{% blogcache 'sidebar' 'entries' 'categories' %}{{ value }}{% endblogcache %}"
+        )
+        self.assertEqual(self.render(template, value=1), "1")
+        self.assertEqual(self.render(template, value=2), "1")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Category.objects.language("en").create(title="News", slug="news")
+        self.assertEqual(self.render(template, value=3), "3")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.save()
+        self.assertEqual(self.render(template, value=4), "4")
+
+    def test_entry_relations(self):
+        """
+        The fragment of an entry is also refreshed when its categories or author are changed.
+        """
+        template = Template(
+            "{% load fluent_blogs_tags %}{% blogcache 'item' entry %}"
+            "{{ entry.author.get_full_name }}:{% for c in entry.categories.all %}{{ c }}{% endfor %}"
+            "{% endblogcache %}"
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            author = get_user_model().objects.create(username="author", first_name="Jane")
+            category = Category.objects.language("en").create(title="News", slug="news")
+            Entry.objects.filter(pk=self.entry.pk).update(author=author)
+            self.entry.refresh_from_db()
+            self.entry.categories.add(category)
+        self.assertEqual(self.render(template, entry=self.entry), "Jane:News")
+
+        category_translation = category.translations.get(language_code="en")
+        category_translation.title = "Updates"
+        with self.captureOnCommitCallbacks(execute=True):
+            category_translation.save()
+        entry = Entry.objects.prefetch_related("categories").get(pk=self.entry.pk)
+        self.assertEqual(self.render(template, entry=entry), "Jane:Updates")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.render(template, entry=entry), "Jane:Updates")
+
+        author.first_name = "John"
+        with self.captureOnCommitCallbacks(execute=True):
+            author.save()
+        entry = Entry.objects.get(pk=self.entry.pk)
+        self.assertEqual(self.render(template, entry=entry), "John:Updates")
+
+    def test_variable_names(self):
+        """
+        Only the literal names are dimensions, the value of a variable is part of the cache key.
+        """
+        template = Template(
+            "{% load fluent_blogs_tags %}{% blogcache 'list' kind %}{{ value }}{% endblogcache %}"
+        )
+        self.assertEqual(self.render(template, kind="categories", value=1), "1")
+        self.assertEqual(self.render(template, kind="tags", value=2), "2")
+
+        bump_generation("category")
+        self.assertEqual(self.render(template, kind="categories", value=3), "1")
+
+    def test_unsupported_object(self):
+        template = Template(
+            "{% load fluent_blogs_tags %}{% blogcache 'site' site %}{% endblogcache %}"
+        )
+        with self.assertRaises(ValueError):
+            self.render(template, site=Site.objects.get_current())
+
+
+class TranslatedUrlsTagTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)  # parler caches the translations by ID
+        Site.objects.get_or_create(
+            id=settings.SITE_ID, defaults=dict(domain="django.localhost", name="localhost")
+        )
+        entry = Entry.objects.language("en").create(
+            title="Entry",
+            slug="entry",
+            status=Entry.PUBLISHED,
+            publication_date=datetime(2016, 5, 1, 15, 0, tzinfo=timezone.utc),
+        )
+        entry.set_current_language("nl")
+        entry.title = "Bericht"
+        entry.slug = "bericht"
+        entry.save()
+
+    def test_get_translated_urls(self):
+        """
+        The URLs of all languages are built from the prefetched translations.
+        """
+        entry = Entry.objects.prefetch_related("translations").get()
+        template = Template(
+            "{% load fluent_blogs_tags %}{% get_translated_urls entry as urls %}"
+            "{% for language_code, url in urls.items %}{{ language_code }}={{ url }} {% endfor %}"
+        )
+        with self.assertNumQueries(0), translation.override("en"):
+            html = template.render(Context({"entry": entry}))
+        self.assertEqual(html, "nl=/blog/2016/05/bericht/ en=/blog/2016/05/entry/ ")
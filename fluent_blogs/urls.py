@@ -43,6 +43,11 @@ urlpatterns = [
     re_path(
         r"^feed.atom$", LatestEntriesFeed.as_view(format="atom1"), name="entry_archive_index_atom"
     ),
+    re_path(
+        r"^feed.json$",
+        LatestEntriesFeed.as_view(format="json", streaming=True),
+        name="entry_archive_index_json",
+    ),
     # Archives
     re_path(r"^(?P<year>\d{4})/$", EntryYearArchive.as_view(), name="entry_archive_year"),
     re_path(
@@ -76,6 +81,11 @@ urlpatterns = [
         LatestCategoryEntriesFeed.as_view(format="atom1"),
         name="entry_archive_category_atom",
     ),
+    re_path(
+        r"^categories/(?P<slug>[-\w]+)/feed.json$",
+        LatestCategoryEntriesFeed.as_view(format="json", streaming=True),
+        name="entry_archive_category_json",
+    ),
     # Authors
     re_path(
         r"^authors/(?P<slug>[-_@.\w]+)/$",
@@ -97,6 +107,11 @@ urlpatterns = [
         LatestAuthorEntriesFeed.as_view(format="atom1"),
         name="entry_archive_author_atom",
     ),
+    re_path(
+        r"^authors/(?P<slug>[-_@.\w]+)/feed.json$",
+        LatestAuthorEntriesFeed.as_view(format="json", streaming=True),
+        name="entry_archive_author_json",
+    ),
     # Short link
     path(
         "<int:pk>/", EntryShortLink.as_view(), name="entry_shortlink"
@@ -124,4 +139,9 @@ if "taggit" in settings.INSTALLED_APPS:
             LatestTagEntriesFeed.as_view(format="atom1"),
             name="entry_archive_tag_atom",
         ),
+        re_path(
+            r"^tags/(?P<slug>[-\w]+)/feed.json$",
+            LatestTagEntriesFeed.as_view(format="json", streaming=True),
+            name="entry_archive_tag_json",
+        ),
     ]
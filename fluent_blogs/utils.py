@@ -0,0 +1,24 @@
+"""
+Internal utilities, shared by the management commands.
+"""
+from datetime import datetime
+
+from django.core.management.base import CommandError
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.timezone import is_naive, make_aware
+
+
+def parse_since_option(value):
+    """
+    Parse the ``--since`` option of a management command.
+    This is a date or datetime in ISO 8601 format.
+    """
+    since = parse_datetime(value)
+    if since is None:
+        date = parse_date(value)
+        if date is None:
+            raise CommandError(f"Invalid --since value: {value}")
+        since = datetime(date.year, date.month, date.day)
+    if is_naive(since):
+        since = make_aware(since)
+    return since
@@ -1,8 +1,8 @@
 from django.conf import settings
-from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
-from django.http import Http404
-from django.shortcuts import get_object_or_404
+from django.db.models import Prefetch
+from django.http import Http404, HttpResponsePermanentRedirect
 from django.utils import translation
 from django.views.generic.base import RedirectView
 from django.views.generic.dates import (
@@ -18,8 +18,23 @@ from parler.utils.context import switch_language
 from parler.views import TranslatableSlugMixin
 
 from fluent_blogs import appsettings
-from fluent_blogs.models import get_entry_model
-from fluent_blogs.models.query import get_category_for_slug, get_date_range
+from fluent_blogs.cache import get_versioned_cache_key
+from fluent_blogs.instrumentation import instrument_view
+from fluent_blogs.lookups import lookup_author, lookup_category, lookup_tag
+from fluent_blogs.models import get_category_model, get_entry_model
+from fluent_blogs.models.query import get_date_range
+from fluent_blogs.permalinks import get_permalink_path, resolve_permalink
+from fluent_blogs.sites import get_current_site_id
+
+
+class PermalinkMoved(Exception):
+    """
+    Internal exception, to redirect an old permalink to the current URL of the entry.
+    """
+
+    def __init__(self, url):
+        super().__init__(url)
+        self.url = url
 
 
 class BaseBlogMixin(CurrentPageMixin):
@@ -28,11 +43,20 @@ class BaseBlogMixin(CurrentPageMixin):
     view_url_name_paginated = None
     include_hidden = False
 
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Allow to measure the queries and render time of all blog views.
+        view = super().as_view(**initkwargs)
+        return instrument_view(view, view_name=cls.view_url_name)
+
     def get_base_queryset(self, for_user=None):
         """The base queryset that all views derive from"""
         try:
             page = self.get_current_page()
         except AttributeError:
+            page = None  # No django-fluent-pages
+
+        if page is None:
             # URL mounted view
             return get_entry_model().objects.published(
                 for_user=for_user, include_hidden=self.include_hidden
@@ -107,6 +131,11 @@ class BaseArchiveMixin(BaseBlogMixin):
         queryset = queryset.active_translations(
             self.get_language()
         )  # NOTE: can't combine with other filters on translations__ relation.
+        queryset = queryset.fetch_translations(self.get_language())
+
+        # The categories are displayed for every entry in the archive.
+        if any(field.name == "categories" for field in queryset.model._meta.many_to_many):
+            queryset = queryset.prefetch_related("categories")
 
         # Reapply ordering of MultipleObjectMixin that was skipped;
         # The BaseDateListView.get_ordering() turns this into a default DESC on the date field.
@@ -132,6 +161,13 @@ class BaseDetailMixin(TranslatableSlugMixin, BaseBlogMixin):
     prefetch_translations = appsettings.FLUENT_BLOGS_PREFETCH_TRANSLATIONS
     include_hidden = True  # only visible with direct link
 
+    #: The relations that are fetched in the same query as the entry.
+    select_related = ("author",)
+    #: The relations that are fetched with one extra query each.
+    #: This can be extended in a subclass, with ``as_view(prefetch_related=...)``
+    #: or the ``FLUENT_BLOGS_DETAIL_PREFETCH_RELATED`` setting, instead of overriding :meth:`get_queryset`.
+    prefetch_related = ("categories", "tags")
+
     def get_queryset(self):
         # The DetailView redefines get_queryset() to show detail pages for staff members.
         # All other overviews won't show the draft pages yet.
@@ -139,6 +175,12 @@ class BaseDetailMixin(TranslatableSlugMixin, BaseBlogMixin):
         if self.prefetch_translations:
             qs = qs.prefetch_related("translations")
 
+        select_related, prefetch_related = self.get_prefetch_plan(qs.model)
+        if select_related:
+            qs = qs.select_related(*select_related)
+        if prefetch_related:
+            qs = qs.prefetch_related(*prefetch_related)
+
         # Allow same slug in different dates
         # The available arguments depend on the FLUENT_BLOGS_ENTRY_LINK_STYLE setting.
         year = int(self.kwargs["year"]) if "year" in self.kwargs else None
@@ -151,7 +193,46 @@ class BaseDetailMixin(TranslatableSlugMixin, BaseBlogMixin):
 
         return qs
 
+    def get_prefetch_plan(self, model):
+        """
+        Return the ``select_related`` and ``prefetch_related`` lookups to fetch the entry with.
+        Relations that the entry model doesn't have (e.g. tags without django-taggit) are skipped.
+        """
+        relations = {field.name for field in model._meta.get_fields() if field.is_relation}
+        select_related = [
+            lookup for lookup in self.select_related if lookup.split("__")[0] in relations
+        ]
+
+        prefetch_related = []
+        for lookup in (*self.prefetch_related, *appsettings.FLUENT_BLOGS_DETAIL_PREFETCH_RELATED):
+            if isinstance(lookup, str):
+                if lookup.split("__")[0] not in relations:
+                    continue
+                if lookup == "categories":
+                    lookup = self._get_categories_prefetch()
+            prefetch_related.append(lookup)
+        return select_related, prefetch_related
+
+    def _get_categories_prefetch(self):
+        # The category names are displayed, so fetch their translations too.
+        Category = get_category_model()
+        queryset = Category.objects.all()
+        if issubclass(Category, TranslatableModel):
+            queryset = queryset.prefetch_related("translations")
+        return Prefetch("categories", queryset=queryset)
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except PermalinkMoved as e:
+            return HttpResponsePermanentRedirect(e.url)
+
     def get_object(self, queryset=None):
+        # Most entries are found in the permalink index, by their primary key.
+        obj = self.get_indexed_object(queryset)
+        if obj is not None:
+            return obj
+
         if issubclass(get_entry_model(), TranslatableModel):
             # Filter by slug and language
             # Note that translation support is still optional,
@@ -161,6 +242,47 @@ class BaseDetailMixin(TranslatableSlugMixin, BaseBlogMixin):
             # Regular slug check, skip TranslatableSlugMixin
             return SingleObjectMixin.get_object(self, queryset)
 
+    def get_indexed_object(self, queryset=None):
+        """
+        Find the object using the permalink index.
+        This returns ``None`` when the permalink is not indexed, so the object is found by its slug instead.
+        """
+        if issubclass(get_entry_model(), TranslatableModel):
+            language_code = self.get_language_choices()[0]
+        else:
+            language_code = ""
+
+        try:
+            path = get_permalink_path(**self.kwargs)
+        except KeyError:
+            return None  # URL pattern that doesn't follow FLUENT_BLOGS_ENTRY_LINK_STYLE
+
+        entry_id, redirect_path = resolve_permalink(path, get_current_site_id(), language_code)
+        if entry_id is None:
+            return None
+
+        if redirect_path is not None:
+            # Old permalink, redirect to the current URL if the entry is still visible.
+            request_path = self.request.path
+            if not request_path.endswith(path):
+                return None
+            if not self.get_base_queryset(for_user=self.request.user).filter(pk=entry_id).exists():
+                raise Http404("Entry is no longer available")
+
+            url = request_path[: len(request_path) - len(path)] + redirect_path
+            if self.request.META.get("QUERY_STRING"):
+                url += "?" + self.request.META["QUERY_STRING"]
+            raise PermalinkMoved(url)
+
+        if queryset is None:
+            queryset = self.get_queryset()
+        if language_code:
+            queryset = queryset.language(language_code)
+        try:
+            return queryset.get(pk=entry_id)
+        except ObjectDoesNotExist:
+            raise Http404("Entry is not published")
+
     def get_language_choices(self):
         return appsettings.FLUENT_BLOGS_LANGUAGES.get_active_choices()
 
@@ -213,7 +335,25 @@ class EntryShortLink(SingleObjectMixin, RedirectView):
         return get_entry_model().objects.published()
 
     def get_redirect_url(self, **kwargs):
-        entry = self.get_object()
+        # Short links receive bursts of traffic, so the URL is cached until the entry changes.
+        pk = self.kwargs[self.pk_url_kwarg]
+        key = get_versioned_cache_key(
+            "shortlink",
+            pk,
+            language_code=translation.get_language(),
+            depends_on=[("entry", pk), "site"],
+        )
+        url = cache.get(key)
+        if url is None:
+            url = self.get_entry_url()
+            cache.set(key, url, appsettings.FLUENT_BLOGS_SHORTLINK_CACHE_TIMEOUT)
+        return url
+
+    def get_entry_url(self):
+        # Only fetch the fields that the URL is constructed from.
+        queryset = self.get_queryset()
+        queryset = queryset.only(queryset.model._meta.pk.name, "publication_date")
+        entry = self.get_object(queryset)
         try:
             return entry.get_absolute_url()
         except TranslationDoesNotExist as e:
@@ -243,7 +383,7 @@ class EntryCategoryArchive(BaseArchiveMixin, ArchiveIndexView):
         Get the category object
         """
         try:
-            return get_category_for_slug(slug)
+            return lookup_category(slug)
         except ObjectDoesNotExist as e:
             raise Http404(str(e))
 
@@ -253,7 +393,7 @@ class EntryCategoryArchive(BaseArchiveMixin, ArchiveIndexView):
         if isinstance(self.category, TranslatableModel):
             kwargs = kwargs.copy()
             with switch_language(self.category, translation.get_language()):
-                kwargs['slug'] = self.category.slug
+                kwargs["slug"] = self.category.slug
 
         return kwargs
 
@@ -276,8 +416,10 @@ class EntryAuthorArchive(BaseArchiveMixin, ArchiveIndexView):
         return super().get_queryset().filter(author=self.author)
 
     def get_user(self, slug):
-        User = get_user_model()
-        return get_object_or_404(User, **{User.USERNAME_FIELD: slug})
+        try:
+            return lookup_author(slug)
+        except ObjectDoesNotExist as e:
+            raise Http404(str(e))
 
 
 class EntryTagArchive(BaseArchiveMixin, ArchiveIndexView):
@@ -298,6 +440,7 @@ class EntryTagArchive(BaseArchiveMixin, ArchiveIndexView):
         return super().get_queryset().filter(tags=self.tag)
 
     def get_tag(self, slug):
-        from taggit.models import Tag  # django-taggit is optional, hence imported here.
-
-        return get_object_or_404(Tag, slug=slug)
+        try:
+            return lookup_tag(slug)
+        except ObjectDoesNotExist as e:
+            raise Http404(str(e))
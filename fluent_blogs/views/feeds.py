@@ -1,23 +1,33 @@
-from django.contrib.auth import get_user_model
+import contextvars
+import re
+from itertools import islice
+
 from django.contrib.sites.shortcuts import get_current_site
-from django.contrib.syndication.views import Feed
-from django.shortcuts import get_object_or_404
+from django.contrib.syndication.views import Feed, add_domain
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import QuerySet
+from django.http import Http404, StreamingHttpResponse
 from django.template import TemplateDoesNotExist
-from django.template.loader import get_template
-from django.utils import feedgenerator
+from django.template.loader import get_template, select_template
+from django.utils import translation
 from django.utils.encoding import force_str
+from django.utils.http import http_date
 from django.utils.translation import gettext
 from django.views.generic import View
 
-from fluent_blogs import appsettings
+from fluent_blogs import appsettings, feedgenerators
+from fluent_blogs.cache import get_versioned_cache_keys
+from fluent_blogs.instrumentation import instrument_view
+from fluent_blogs.lookups import lookup_author, lookup_category, lookup_tag
 from fluent_blogs.models import get_entry_model
-from fluent_blogs.models.query import get_category_for_slug
 from fluent_blogs.urlresolvers import blog_reverse
 
 _FEED_FORMATS = {
-    "atom1": feedgenerator.Atom1Feed,
-    "rss0.91": feedgenerator.RssUserland091Feed,
-    "rss2.0": feedgenerator.Rss201rev2Feed,
+    "atom1": feedgenerators.Atom1Feed,
+    "json": feedgenerators.JsonFeed,
+    "rss0.91": feedgenerators.RssUserland091Feed,
+    "rss2.0": feedgenerators.Rss201rev2Feed,
 }
 
 __all__ = (
@@ -28,11 +38,21 @@ __all__ = (
 )
 
 
-def get_entry_queryset():
+def get_entry_queryset(page=None):
     # Avoid being cached at module level, always return a new queryset.
-    return (
-        get_entry_model().objects.published().active_translations().order_by("-publication_date")
-    )
+    EntryModel = get_entry_model()
+    if page is not None and hasattr(page, "get_entry_queryset"):
+        # Feed of a BlogPage, which can limit the entries.
+        qs = page.get_entry_queryset(view_url_name=None)
+    else:
+        qs = EntryModel.objects.published()
+    qs = qs.active_translations().order_by("-publication_date")
+
+    # Avoid a query per item for the translations, author and categories of the feed items.
+    qs = qs.fetch_translations().select_related("author")
+    if any(field.name == "categories" for field in EntryModel._meta.many_to_many):
+        qs = qs.prefetch_related("categories")
+    return qs
 
 
 _max_items = appsettings.FLUENT_BLOGS_MAX_FEED_ITEMS
@@ -46,6 +66,13 @@ class FeedView(View, Feed):
 
     format = "rss2.0"
 
+    #: Whether the feed is sent while the items are read from the database.
+    #: This keeps the memory usage low for feeds with many items.
+    streaming = False
+    #: The number of items that is read at once for a streaming feed.
+    stream_chunk_size = 100
+    _feed_items = None
+
     def __init__(self, **kwargs):
         View.__init__(self, **kwargs)
 
@@ -60,9 +87,120 @@ class FeedView(View, Feed):
                 )
             )
 
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Allow to measure the queries and render time of the feeds, tagged by URL name.
+        return instrument_view(super().as_view(**initkwargs))
+
     def get(self, request, *args, **kwargs):
-        # Pass flow to the original Feed.__call__
-        return self.__call__(request, *args, **kwargs)
+        if not self.streaming:
+            # Pass flow to the original Feed.__call__
+            return self.__call__(request, *args, **kwargs)
+
+        try:
+            obj = self.get_object(request, *args, **kwargs)
+        except ObjectDoesNotExist:
+            raise Http404("Feed object does not exist.")
+        return self.get_streaming_response(obj, request)
+
+    def get_streaming_response(self, obj, request):
+        """
+        Return the feed as :class:`~django.http.StreamingHttpResponse`.
+        The items are read and written in chunks of :attr:`stream_chunk_size` items.
+        """
+        chunks = _iter_chunks(self._get_dynamic_attr("items", obj), self.stream_chunk_size)
+        feedgen = self._get_feed_for_items(obj, request, next(chunks, []))
+        next_feeds = (self._get_feed_for_items(obj, request, items) for items in chunks)
+
+        response = StreamingHttpResponse(
+            _stream_in_context(feedgen.stream(next_feeds, "utf-8")),
+            content_type=feedgen.content_type,
+        )
+        if feedgen.items and (hasattr(self, "item_pubdate") or hasattr(self, "item_updateddate")):
+            # The items are ordered by date, so the first chunk has the latest post.
+            response.headers["Last-Modified"] = http_date(feedgen.latest_post_date().timestamp())
+        return response
+
+    def _get_feed_for_items(self, obj, request, items):
+        # Let the Feed class construct the feed for a part of the items.
+        self._feed_items = items
+        try:
+            return self.get_feed(obj, request)
+        finally:
+            self._feed_items = None
+
+    def _get_dynamic_attr(self, attname, obj, default=None):
+        if attname == "items" and self._feed_items is not None:
+            return self._feed_items
+        return super()._get_dynamic_attr(attname, obj, default=default)
+
+
+_description_template = None
+_URL_ATTRIBUTE_RE = re.compile(r"""(\s(?:src|href)=["'])(/(?!/)[^"']*)""", re.IGNORECASE)
+
+
+def _get_description_template():
+    # The template is resolved only once, as it depends on the entry model.
+    global _description_template
+    if _description_template is None:
+        EntryModel = get_entry_model()
+        templates = [
+            f"{EntryModel._meta.app_label}/{EntryModel._meta.object_name.lower()}_feed_description.html",
+            "fluent_blogs/entry_feed_description.html",  # New name
+            "fluent_blogs/feeds/entry/description.html",  # Old name
+        ]
+        try:
+            _description_template = select_template(templates).template.name
+        except TemplateDoesNotExist:
+            return None
+    return _description_template
+
+
+def _make_urls_absolute(html, domain, secure):
+    # Feed readers display the contents outside the site, so relative URLs don't work.
+    return _URL_ATTRIBUTE_RE.sub(
+        lambda match: match.group(1) + add_domain(domain, match.group(2), secure), html
+    )
+
+
+def _iter_chunks(items, size):
+    if isinstance(items, QuerySet):
+        # The primary keys are read with a single query, and the objects per chunk.
+        # Unlike slicing, this doesn't need an OFFSET which becomes slower for every next chunk.
+        # The objects are read by the queryset itself,
+        # so their translations and prefetches are also read per chunk.
+        queryset = items.all()
+        queryset.query.clear_limits()
+        iterator = items.values_list("pk", flat=True).iterator(chunk_size=size)
+    else:
+        queryset = None
+        iterator = iter(items)
+
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        if queryset is not None:
+            objects = {obj.pk: obj for obj in queryset.filter(pk__in=chunk)}
+            chunk = [objects[pk] for pk in chunk if pk in objects]
+        yield chunk
+
+
+def _stream_in_context(iterator):
+    # The response is consumed after the middleware finished,
+    # keep the current site and language of the request while reading the items.
+    context = contextvars.copy_context()
+    language_code = translation.get_language()
+
+    def step():
+        with translation.override(language_code):
+            return next(iterator, None)
+
+    while True:
+        data = context.run(step)
+        if data is None:
+            return
+        yield data
 
 
 class EntryFeedBase(FeedView):
@@ -70,8 +208,28 @@ class EntryFeedBase(FeedView):
     Base class for all feeds returning blog entries.
     """
 
+    #: Read the contents of the items from the cache, see ``FLUENT_BLOGS_FEED_FULL_CONTENT``.
+    full_content = appsettings.FLUENT_BLOGS_FEED_FULL_CONTENT
+    _item_descriptions = None
+
+    #: The maximum number of items, defaults to ``FLUENT_BLOGS_MAX_FEED_ITEMS``.
+    #: Use ``0`` for all entries, e.g. for a full archive feed with ``streaming=True``.
+    max_items = None
+
     def items(self, object=None):
-        return get_entry_queryset()[:_max_items]
+        return self.limit_items(self.get_queryset())
+
+    def limit_items(self, queryset):
+        max_items = _max_items if self.max_items is None else self.max_items
+        return queryset[:max_items] if max_items else queryset
+
+    def get_queryset(self):
+        """
+        Return the entries of the feed, taking the current blog page into account.
+        """
+        # TODO: django-fluent-pages needs a public API to get the current page.
+        current_page = getattr(self.request, "_current_fluent_page", None)
+        return get_entry_queryset(current_page)
 
     def reverse(self, viewname, args=None, kwargs=None):
         """
@@ -89,21 +247,73 @@ class EntryFeedBase(FeedView):
 
     @property
     def description_template(self):
-        EntryModel = get_entry_model()
-        templates = [
-            f"{EntryModel._meta.app_label}/{EntryModel._meta.object_name.lower()}_feed_description.html",
-            "fluent_blogs/entry_feed_description.html",  # New name
-            "fluent_blogs/feeds/entry/description.html",  # Old name
-        ]
-        # The value is passed to get_template by the Feed class, so reduce the list here manually.
-        for name in templates:
-            try:
-                get_template(name)
-            except TemplateDoesNotExist:
-                pass
-            else:
-                setattr(self.__class__, "description_template", name)
-                return templates
+        if self.full_content:
+            return None  # The item_description() returns the cached contents.
+        return _get_description_template()
+
+    def get_feed(self, obj, request):
+        if not self.full_content:
+            return super().get_feed(obj, request)
+
+        # Read the contents of all items at once.
+        items = self._feed_items
+        if items is None:
+            items = list(self._get_dynamic_attr("items", obj))
+        self._item_descriptions = self.get_item_descriptions(items, request)
+        previous, self._feed_items = self._feed_items, items
+        try:
+            return super().get_feed(obj, request)
+        finally:
+            self._feed_items = previous
+            self._item_descriptions = None
+
+    def get_item_descriptions(self, entries, request):
+        """
+        Return the rendered contents of the entries, by primary key.
+        The contents are cached per entry, language and modification date.
+        The relative URLs of images and links are made absolute before storing them in the cache.
+        """
+        current_site = get_current_site(request)
+        secure = request.is_secure()
+        scheme = "https" if secure else "http"
+        keys = get_versioned_cache_keys(
+            "feed_content",
+            [
+                (
+                    (entry.pk, int(entry.modification_date.timestamp()), scheme),
+                    [("entry", entry.pk)],
+                )
+                for entry in entries
+            ],
+            language_code=translation.get_language(),
+        )
+        found = cache.get_many(keys)
+
+        descriptions = {}
+        missing = {}
+        template = None
+        for entry, key in zip(entries, keys):
+            if key in found:
+                descriptions[entry.pk] = found[key]
+                continue
+
+            if template is None:
+                template = get_template(_get_description_template())
+            html = template.render(
+                self.get_context_data(item=entry, site=current_site, obj=None, request=request),
+                request,
+            )
+            descriptions[entry.pk] = missing[key] = _make_urls_absolute(
+                html, current_site.domain, secure
+            )
+
+        if missing:
+            cache.set_many(missing, appsettings.FLUENT_BLOGS_FEED_CONTENT_CACHE_TIMEOUT)
+        return descriptions
+
+    def item_description(self, entry):
+        if self._item_descriptions is not None:
+            return self._item_descriptions[entry.pk]
         return None
 
     def item_pubdate(self, entry):
@@ -163,10 +373,10 @@ class LatestCategoryEntriesFeed(EntryFeedBase):
     """
 
     def get_object(self, request, slug):
-        return get_category_for_slug(slug)
+        return lookup_category(slug)
 
     def items(self, category):
-        return get_entry_queryset().filter(categories=category)[:_max_items]
+        return self.limit_items(self.get_queryset().filter(categories=category))
 
     def title(self, category):
         # django-categories uses 'name', django-categories-i18n uses 'title'
@@ -194,11 +404,10 @@ class LatestAuthorEntriesFeed(EntryFeedBase):
     """
 
     def get_object(self, request, slug):
-        User = get_user_model()
-        return get_object_or_404(User, **{User.USERNAME_FIELD: slug})
+        return lookup_author(slug)
 
     def items(self, author):
-        return get_entry_queryset().filter(author=author)[:_max_items]
+        return self.limit_items(self.get_queryset().filter(author=author))
 
     def title(self, author):
         return gettext("Entries by {author_name}").format(author_name=author.get_full_name())
@@ -221,12 +430,10 @@ class LatestTagEntriesFeed(EntryFeedBase):
     """
 
     def get_object(self, request, slug):
-        from taggit.models import Tag  # Taggit is still an optional dependency
-
-        return get_object_or_404(Tag, slug=slug)
+        return lookup_tag(slug)
 
     def items(self, tag):
-        return get_entry_queryset().filter(tags=tag)[:_max_items]
+        return self.limit_items(self.get_queryset().filter(tags=tag))
 
     def title(self, tag):
         return gettext("Entries for the tag {tag_name}").format(tag_name=tag.name)
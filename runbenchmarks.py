@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+"""
+Run the performance benchmarks of the blog hot paths.
+
+Usage::
+
+    ./runbenchmarks.py [--sizes=1000,10000,100000] [--repeat=5] [--warm] [--output=results.json] [case ...]
+    ./runbenchmarks.py --sites=1,10,60 [--sizes=1000] [--repeat=5] [case ...]
+    ./runbenchmarks.py --imports [--repeat=5]
+
+By default an SQLite database is used. To run against PostgreSQL, define
+the ``BENCHMARK_DB_ENGINE``, ``BENCHMARK_DB_NAME``, ``BENCHMARK_DB_USER``,
+``BENCHMARK_DB_PASSWORD`` and ``BENCHMARK_DB_HOST`` environment variables.
+The results are written as JSON, so they can be compared between releases.
+With ``--sites``, the number of sites grows instead, each site having the same number of entries.
+With ``--imports``, the import time of the URLconf, sitemaps and template tags is measured instead.
+"""
+import argparse
+import json
+import os
+import sys
+from importlib.util import find_spec
+from os import path
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    import fluent_pages
+
+    pages_root = path.dirname(path.abspath(fluent_pages.__file__))
+    optional_apps = tuple(app for app in ("taggit",) if find_spec(app) is not None)
+
+    settings.configure(
+        DEBUG=False,
+        DATABASES={
+            "default": {
+                "ENGINE": os.environ.get("BENCHMARK_DB_ENGINE", "django.db.backends.sqlite3"),
+                "NAME": os.environ.get("BENCHMARK_DB_NAME", ":memory:"),
+                "USER": os.environ.get("BENCHMARK_DB_USER", ""),
+                "PASSWORD": os.environ.get("BENCHMARK_DB_PASSWORD", ""),
+                "HOST": os.environ.get("BENCHMARK_DB_HOST", ""),
+            },
+        },
+        INSTALLED_APPS=(
+            "django.contrib.auth",
+            "django.contrib.contenttypes",
+            "django.contrib.sites",
+            "django.contrib.sitemaps",
+            "django.contrib.admin",
+            "django.contrib.sessions",
+            "django.contrib.messages",
+            "fluent_pages",
+            "fluent_blogs",
+            "fluent_blogs.pagetypes.blogpage",
+            "fluent_contents",
+            "categories_i18n",
+            "django_wysiwyg",
+            "mptt",
+            "parler",
+            "polymorphic",
+            "polymorphic_tree",
+        )
+        + optional_apps,
+        MIDDLEWARE=(
+            "django.middleware.common.CommonMiddleware",
+            "django.contrib.sessions.middleware.SessionMiddleware",
+            "django.contrib.auth.middleware.AuthenticationMiddleware",
+            "django.contrib.messages.middleware.MessageMiddleware",
+        ),
+        TEMPLATES=[
+            {
+                "BACKEND": "django.template.backends.django.DjangoTemplates",
+                "DIRS": (),
+                "OPTIONS": {
+                    "loaders": (
+                        (
+                            "django.template.loaders.cached.Loader",
+                            (
+                                "django.template.loaders.filesystem.Loader",
+                                "django.template.loaders.app_directories.Loader",
+                            ),
+                        ),
+                    ),
+                    "context_processors": (
+                        "django.template.context_processors.i18n",
+                        "django.template.context_processors.request",
+                        "django.template.context_processors.static",
+                        "django.contrib.messages.context_processors.messages",
+                        "django.contrib.auth.context_processors.auth",
+                    ),
+                },
+            },
+        ],
+        ROOT_URLCONF="benchmarks.urls",
+        SECRET_KEY="benchmark",
+        SITE_ID=4,
+        LANGUAGE_CODE="en",
+        TIME_ZONE="UTC",
+        USE_TZ=True,
+        STATIC_URL="/static/",
+        PARLER_LANGUAGES={
+            4: (
+                {"code": "en"},
+                {"code": "nl"},
+            ),
+        },
+        PARLER_DEFAULT_LANGUAGE_CODE="en",
+        FLUENT_PAGES_TEMPLATE_DIR=path.join(pages_root, "tests", "testapp", "templates"),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the django-fluent-blogs benchmarks.")
+    parser.add_argument("cases", nargs="*", help="Only run the given cases.")
+    parser.add_argument(
+        "--sizes",
+        default="1000,10000,100000",
+        help="Comma separated list of dataset sizes (default: %(default)s).",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs per case.")
+    parser.add_argument("--warm", action="store_true", help="Don't clear the cache between runs.")
+    parser.add_argument("--output", help="Write the JSON results to a file instead of stdout.")
+    parser.add_argument(
+        "--sites", help="Comma separated list of site counts, to measure multi-site scaling."
+    )
+    parser.add_argument(
+        "--imports", action="store_true", help="Measure the import time of the modules instead."
+    )
+    args = parser.parse_args()
+
+    if args.imports:
+        from benchmarks.imports import run_import_benchmarks
+
+        results = {
+            "django": django.get_version(),
+            "repeat": args.repeat,
+            "imports": run_import_benchmarks(
+                names=args.cases,
+                repeat=args.repeat,
+                progress=lambda message: sys.stderr.write(message + "\n"),
+            ),
+        }
+        write_results(results, args.output)
+        return
+
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    from benchmarks.runner import run_benchmarks, run_site_benchmarks
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    progress = lambda message: sys.stderr.write(message + "\n")  # noqa: E731
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        if args.sites:
+            results = run_site_benchmarks(
+                site_counts=[int(count) for count in args.sites.split(",")],
+                size=sizes[0],
+                names=args.cases,
+                repeat=args.repeat,
+                warm=args.warm,
+                progress=progress,
+            )
+        else:
+            results = run_benchmarks(
+                sizes=sizes,
+                names=args.cases,
+                repeat=args.repeat,
+                warm=args.warm,
+                progress=progress,
+            )
+    finally:
+        connection.creation.destroy_test_db(connection.settings_dict["NAME"], verbosity=0)
+
+    write_results(results, args.output)
+
+
+def write_results(results, filename=None):
+    output = json.dumps(results, indent=2)
+    if filename:
+        with open(filename, "w") as fileobj:
+            fileobj.write(output)
+    else:
+        sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
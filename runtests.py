@@ -32,6 +32,7 @@ if not settings.configured:
             "django.contrib.auth",
             "django.contrib.contenttypes",
             "django.contrib.sites",
+            "django.contrib.sitemaps",
             "django.contrib.admin",
             "django.contrib.sessions",
             "django.contrib.messages",